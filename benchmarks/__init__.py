@@ -0,0 +1,5 @@
+"""
+Benchmarks of the finder and loader hot paths.
+
+Run with `python -m benchmarks`, from the repository root.
+"""
@@ -0,0 +1,72 @@
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.bench_failing_imports import failing_imports
+from benchmarks.bench_finders import finder_lookups
+from benchmarks.bench_indexed_json import indexed_json_loads
+from benchmarks.bench_loads import module_loads
+from benchmarks.bench_namespaces import namespace_access
+from benchmarks.runner import (
+    compare_results,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+
+SUITES = [
+    finder_lookups,
+    module_loads,
+    indexed_json_loads,
+    failing_imports,
+    namespace_access,
+]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the finder and loader hot paths.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="Timed runs of each benchmark."
+    )
+    parser.add_argument(
+        "--filter", default="", help="Only run benchmarks whose name contains this."
+    )
+    parser.add_argument("--output", type=Path, help="Save the results as JSON.")
+    parser.add_argument(
+        "--compare", type=Path, help="Compare with results saved by --output."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Fraction slower than the compared results that is a regression.",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        results = run_benchmarks(
+            SUITES, Path(work_dir), repeat=args.repeat, name_filter=args.filter
+        )
+
+    if args.output is not None:
+        save_results(results, args.output)
+
+    if args.compare is None:
+        return 0
+
+    lines, regressions = compare_results(
+        load_results(args.compare), results, args.threshold
+    )
+
+    print()
+    print("\n".join(lines))
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+import csv
+from contextlib import contextmanager
+from importlib import import_module
+from pathlib import Path
+from typing import Callable, Iterator
+
+from benchmarks.runner import Benchmark
+from custom_imports import (
+    CSVImporter,
+    FileModuleImporter,
+    cfg_importer,
+    ini_importer,
+    json_importer,
+)
+
+__all__ = ["failing_imports"]
+
+IMPORTS = 100
+
+
+def _fail_imports() -> Callable[[], None]:
+    def fail_imports():
+        for _ in range(IMPORTS):
+            try:
+                import_module("no_such_module_for_benchmarks")
+            except ImportError:
+                pass
+
+    return fail_imports
+
+
+@contextmanager
+def _path_hook(importer: FileModuleImporter) -> Iterator[None]:
+    importer.register_path_hook()
+    try:
+        yield
+    finally:
+        importer.deregister_path_hook()
+
+
+def failing_imports(work_dir: Path) -> Iterator[Benchmark]:
+    """
+    Overhead that registered importers add to imports of modules that do not
+    exist, against the unmodified sys.path.
+    """
+
+    importers = [
+        json_importer,
+        ini_importer,
+        cfg_importer,
+        CSVImporter(csv_reader=csv.reader),
+    ]
+
+    yield Benchmark("failing_import.none", _fail_imports(), number=IMPORTS)
+
+    for importer in importers:
+        importer.register()
+    try:
+        yield Benchmark(
+            "failing_import.sample_importers", _fail_imports(), number=IMPORTS
+        )
+    finally:
+        for importer in importers:
+            importer.deregister()
+
+    file_module_importer = FileModuleImporter.from_importers(*importers)
+
+    with file_module_importer:
+        yield Benchmark(
+            "failing_import.file_module_importer", _fail_imports(), number=IMPORTS
+        )
+
+    with _path_hook(file_module_importer):
+        yield Benchmark(
+            "failing_import.file_module_path_hook", _fail_imports(), number=IMPORTS
+        )
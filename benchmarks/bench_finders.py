@@ -0,0 +1,61 @@
+import sys
+from pathlib import Path
+from typing import Callable, Iterator
+
+from benchmarks.runner import Benchmark
+from custom_imports import FileModuleExtensionFinder
+
+__all__ = ["finder_lookups"]
+
+LOOKUPS = 100
+
+
+def _lookups(finder: FileModuleExtensionFinder, name: str) -> Callable[[], None]:
+    def lookups():
+        for _ in range(LOOKUPS):
+            finder.find_module_locator(name, None)
+
+    return lookups
+
+
+def finder_lookups(work_dir: Path) -> Iterator[Benchmark]:
+    """
+    FileModuleExtensionFinder lookups of top level modules, against sys.path
+    lengths of 5, 50, and 500, with the module in the last directory.
+
+    Warm lookups reuse the finder's directory listings, cold lookups list every
+    directory again.
+    """
+
+    for length in [5, 50, 500]:
+        directories = []
+        for index in range(length):
+            directory = work_dir / f"path_{length}_{index}"
+            directory.mkdir()
+            directories.append(str(directory))
+
+        (Path(directories[-1]) / "target_module.json").write_text("{}")
+
+        original_path = sys.path[:]
+        sys.path[:] = directories
+        try:
+            finder = FileModuleExtensionFinder("json")
+            finder.find_module_locator("target_module", None)
+
+            yield Benchmark(
+                f"finder.path_{length}.hit",
+                _lookups(finder, "target_module"),
+                number=LOOKUPS,
+            )
+            yield Benchmark(
+                f"finder.path_{length}.miss",
+                _lookups(finder, "missing_module"),
+                number=LOOKUPS,
+            )
+            yield Benchmark(
+                f"finder.path_{length}.cold_hit",
+                lambda finder=finder: finder.find_module_locator("target_module", None),
+                setup=finder.invalidate_caches,
+            )
+        finally:
+            sys.path[:] = original_path
@@ -0,0 +1,90 @@
+import json
+import sys
+from importlib import import_module
+from pathlib import Path
+from typing import Callable, Iterator
+
+from benchmarks.runner import Benchmark
+from custom_imports import IndexedJSONImporter, JSONBackend, JSONImporter
+from custom_imports.sample_importers.json_importer import fastest_json_backend
+
+__all__ = ["indexed_json_loads"]
+
+ENTRIES = 50000
+
+
+def write_json_object(path: Path) -> None:
+    entries = {
+        f"entry_{index}": {
+            "id": index,
+            "name": f"name {index}",
+            "tags": ["a", "b", "c"],
+            "position": {"x": index / 7, "y": [1, 2, {"z": "}"}]},
+        }
+        for index in range(ENTRIES)
+    }
+
+    path.write_text(json.dumps(entries))
+
+
+def _unimport(name: str) -> Callable[[], None]:
+    return lambda: sys.modules.pop(name, None)
+
+
+def _import(name: str) -> Callable[[], None]:
+    return lambda: import_module(name)
+
+
+def _import_and_get(name: str, key: str) -> Callable[[], None]:
+    return lambda: import_module(name)[key]
+
+
+def _import_and_index(name: str) -> Callable[[], None]:
+    return lambda: len(import_module(name))
+
+
+def indexed_json_loads(work_dir: Path) -> Iterator[Benchmark]:
+    """
+    Loads of a large JSON object, parsed in full by JSONImporters, with the
+    standard library's parser, and with the fastest installed parser, and by
+    an IndexedJSONImporter, with the fastest installed parser.
+
+    The JSONIndex is imported alone, with the value of its middle key, which
+    indexes half of its keys, and with every key indexed.
+    """
+
+    write_json_object(work_dir / "large_json_object.json")
+
+    name = "large_json_object"
+    backend = fastest_json_backend()
+    key = f"entry_{ENTRIES // 2}"
+
+    sys.path.insert(0, str(work_dir))
+    try:
+        for label, full_backend in [
+            ("stdlib", JSONBackend("json", json.loads)),
+            ("fastest", backend),
+        ]:
+            with JSONImporter(backend=full_backend):
+                yield Benchmark(
+                    f"indexed_json.full_parse.{label}",
+                    _import(name),
+                    setup=_unimport(name),
+                )
+
+        with IndexedJSONImporter(backend=backend):
+            yield Benchmark("indexed_json.import", _import(name), setup=_unimport(name))
+            yield Benchmark(
+                "indexed_json.middle_value",
+                _import_and_get(name, key),
+                setup=_unimport(name),
+            )
+            yield Benchmark(
+                "indexed_json.index_all",
+                _import_and_index(name),
+                setup=_unimport(name),
+            )
+
+        sys.modules.pop(name, None)
+    finally:
+        sys.path.remove(str(work_dir))
@@ -0,0 +1,107 @@
+import csv
+import json
+import sys
+from dataclasses import replace
+from importlib import import_module
+from pathlib import Path
+from typing import Callable, Iterator
+
+from benchmarks.runner import Benchmark
+from custom_imports import (
+    ColumnarCSVImporter,
+    CSVImporter,
+    FileModuleCache,
+    Importer,
+    ini_importer,
+    json_importer,
+)
+
+__all__ = ["module_loads"]
+
+ROWS = 20000
+SECTIONS = 2000
+
+
+def write_json(path: Path) -> None:
+    records = [
+        {"id": index, "name": f"name {index}", "score": index / 7, "tags": ["a", "b"]}
+        for index in range(ROWS)
+    ]
+
+    path.write_text(json.dumps({"records": records}))
+
+
+def write_ini(path: Path) -> None:
+    with path.open("w") as file:
+        for section in range(SECTIONS):
+            file.write(f"[section_{section}]\n")
+
+            for option in range(10):
+                file.write(f"option_{option} = {section * option}\n")
+
+
+def write_csv(path: Path) -> None:
+    with path.open("w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["id", "name", "category", "price", "quantity", "active"])
+
+        for index in range(ROWS):
+            writer.writerow(
+                [index, f"item {index}", f"category {index % 10}", index / 4, 3, True]
+            )
+
+
+def _unimport(name: str) -> Callable[[], None]:
+    return lambda: sys.modules.pop(name, None)
+
+
+def _import(name: str) -> Callable[[], None]:
+    return lambda: import_module(name)
+
+
+def module_loads(work_dir: Path) -> Iterator[Benchmark]:
+    """
+    Loads of large JSON, INI, and CSV modules through the sample importers.
+
+    Cold loads parse the file, cached loads restore a snapshot from a
+    FileModuleCache.
+    """
+
+    write_json(work_dir / "large_json.json")
+    write_ini(work_dir / "large_ini.ini")
+    write_csv(work_dir / "large_csv.csv")
+
+    cases = [
+        ("json", "large_json", json_importer),
+        ("ini", "large_ini", ini_importer),
+        ("csv", "large_csv", CSVImporter(csv_reader=csv.DictReader)),
+        ("columnar_csv", "large_csv", ColumnarCSVImporter()),
+    ]
+
+    sys.path.insert(0, str(work_dir))
+    try:
+        for label, name, importer in cases:
+            cached_importer = Importer(
+                finder=importer.finder,
+                loader=replace(
+                    importer.loader, cache=FileModuleCache(work_dir / "cache" / label)
+                ),
+            )
+
+            with importer:
+                yield Benchmark(
+                    f"load.{label}.cold", _import(name), setup=_unimport(name)
+                )
+
+            with cached_importer:
+                # Store the snapshot.
+                _unimport(name)()
+                import_module(name)
+
+                yield Benchmark(
+                    f"load.{label}.cached", _import(name), setup=_unimport(name)
+                )
+
+            sys.modules.pop(name, None)
+    finally:
+        sys.path.remove(str(work_dir))
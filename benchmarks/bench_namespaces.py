@@ -0,0 +1,51 @@
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from benchmarks.runner import Benchmark
+from custom_imports.utils import Namespace
+from custom_imports.utils.attr_dict import AttrDict
+
+__all__ = ["namespace_access"]
+
+RECORDS = 1000
+
+
+def _attribute_reads(records: list) -> Callable[[], None]:
+    def attribute_reads():
+        for record in records:
+            record.id
+            record.name
+
+    return attribute_reads
+
+
+def _item_reads(records: list) -> Callable[[], None]:
+    def item_reads():
+        for record in records:
+            record["id"]
+            record["name"]
+
+    return item_reads
+
+
+def _record(index: int) -> Any:
+    return {"id": index, "name": f"name {index}", "score": index / 7}
+
+
+def namespace_access(work_dir: Path) -> Iterator[Benchmark]:
+    """
+    Attribute and item reads of the fields of parsed records, as AttrDicts and
+    as Namespaces, the types of JSONImporter(namespaces=True).
+    """
+
+    for name, record_type in [("attr_dict", AttrDict), ("namespace", Namespace)]:
+        records = [record_type(_record(index)) for index in range(RECORDS)]
+
+        yield Benchmark(
+            f"namespace.{name}.attribute",
+            _attribute_reads(records),
+            number=RECORDS * 2,
+        )
+        yield Benchmark(
+            f"namespace.{name}.item", _item_reads(records), number=RECORDS * 2
+        )
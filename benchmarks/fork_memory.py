@@ -0,0 +1,142 @@
+"""
+Memory that forked workers share with a pre-fork master process, which has
+preloaded a large JSON module, for each way of preloading it.
+
+Run with `python -m benchmarks.fork_memory`, on Linux.
+
+Each worker reads a sample of the module's records, and runs the garbage
+collector, as a long running worker would, then reports its private dirty
+memory, which is memory no longer shared with the master.
+"""
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict
+
+from custom_imports import Importer, JSONImporter
+
+RECORDS = 200000
+WORKERS = 4
+MODES = ["plain", "gc_freeze", "frozen_gc_freeze"]
+
+
+def private_dirty_bytes() -> int:
+    with open("/proc/self/smaps_rollup") as file:
+        for line in file:
+            if line.startswith("Private_Dirty:"):
+                return int(line.split()[1]) * 1024
+
+    raise RuntimeError("Private_Dirty not found")
+
+
+def write_data(path: Path) -> None:
+    records = [
+        {"id": index, "name": f"name {index}", "tags": ["a", "b"], "score": index / 7}
+        for index in range(RECORDS)
+    ]
+
+    path.write_text(json.dumps({"records": records}))
+
+
+def worker(module_name: str, report_fd: int) -> None:
+    module = sys.modules[module_name]
+    total = sum(record["id"] for record in module["records"][::100])
+    gc.collect()
+
+    # Single writes, shorter than PIPE_BUF, so reports are not interleaved.
+    report = {"private_dirty": private_dirty_bytes(), "total": total}
+    os.write(report_fd, (json.dumps(report) + "\n").encode())
+
+
+def measure(mode: str, data_dir: Path) -> Dict[str, float]:
+    """
+    Preload the module, and fork workers, in this process.
+    """
+
+    importer = JSONImporter()
+    if mode == "frozen_gc_freeze":
+        importer = Importer(
+            finder=importer.finder, loader=replace(importer.loader, frozen=True)
+        )
+
+    sys.path.insert(0, str(data_dir))
+    importer.preload(["fork_memory_data"], freeze_gc=mode != "plain")
+
+    read_fd, write_fd = os.pipe()
+    pids = []
+    for _ in range(WORKERS):
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            worker("fork_memory_data", write_fd)
+            os._exit(0)
+
+        pids.append(pid)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as reports:
+        private = [json.loads(line)["private_dirty"] for line in reports]
+
+    for pid in pids:
+        os.waitpid(pid, 0)
+
+    return {
+        "master_private_dirty": private_dirty_bytes(),
+        "mean_worker_private_dirty": sum(private) / len(private),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.fork_memory", description=__doc__.strip()
+    )
+    parser.add_argument("--output", type=Path, help="Save the results as JSON.")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--data-dir", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode is not None:
+        print(json.dumps(measure(args.mode, args.data_dir)))
+        return 0
+
+    results = {}
+    with tempfile.TemporaryDirectory() as data_dir:
+        write_data(Path(data_dir, "fork_memory_data.json"))
+
+        for mode in MODES:
+            # Each mode runs in a fresh interpreter, so they do not interfere.
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "benchmarks.fork_memory",
+                    "--mode",
+                    mode,
+                    "--data-dir",
+                    data_dir,
+                ],
+                check=True,
+                stdout=subprocess.PIPE,
+                universal_newlines=True,
+            ).stdout
+            results[mode] = json.loads(output)
+
+            worker_mb = results[mode]["mean_worker_private_dirty"] / 2**20
+            print(f"{mode}: {worker_mb:.1f} MB private per worker")
+
+    if args.output is not None:
+        with args.output.open("w") as file:
+            json.dump(results, file, indent=4)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
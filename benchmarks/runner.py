@@ -0,0 +1,154 @@
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+__all__ = [
+    "Benchmark",
+    "run_benchmarks",
+    "compare_results",
+    "format_time",
+    "save_results",
+    "load_results",
+]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """
+    A timed operation.
+
+    Benchmark(
+        name=name,
+        func=func,
+        setup=None,
+        number=1,
+    )
+
+    Each repeat calls setup(), if given, untimed, then times func(), which
+    should perform the operation number times.
+    """
+
+    name: str
+    func: Callable[[], None]
+    setup: Optional[Callable[[], None]] = None
+    number: int = 1
+
+    def run(self, repeat: int) -> Dict[str, float]:
+        times = []
+
+        for _ in range(repeat):
+            if self.setup is not None:
+                self.setup()
+
+            start = time.perf_counter()
+            self.func()
+            times.append((time.perf_counter() - start) / self.number)
+
+        return {
+            "min": min(times),
+            "median": statistics.median(times),
+            "mean": statistics.mean(times),
+            "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+            "repeat": repeat,
+            "number": self.number,
+        }
+
+
+BenchmarkSuite = Callable[[Path], Iterator[Benchmark]]
+
+
+def run_benchmarks(
+    suites: Iterable[BenchmarkSuite],
+    work_dir: Path,
+    repeat: int = 20,
+    name_filter: str = "",
+    log: Callable[[str], None] = print,
+) -> dict:
+    """
+    Run the benchmarks of each suite whose name contains name_filter, and
+    return the results, with details of the environment.
+
+    Each suite is a generator function, taking a directory for its generated
+    inputs, which prepares and yields Benchmarks, and cleans up when
+    exhausted.
+    """
+
+    results = {}
+
+    for suite in suites:
+        suite_dir = work_dir / suite.__name__
+        suite_dir.mkdir()
+
+        for benchmark in suite(suite_dir):
+            if name_filter not in benchmark.name:
+                continue
+
+            results[benchmark.name] = benchmark.run(repeat)
+            log(f"{benchmark.name}: {format_time(results[benchmark.name]['min'])}")
+
+    return {
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "date": datetime.now(timezone.utc).isoformat(),
+        "results": results,
+    }
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in [("s", 1), ("ms", 1e-3), ("us", 1e-6)]:
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def compare_results(
+    baseline: dict, current: dict, threshold: float = 0.1
+) -> Tuple[List[str], List[str]]:
+    """
+    Compare the minimum times of two sets of results.
+
+    Returns a report line for each benchmark in both, and the names of the
+    benchmarks that are slower than the baseline by more than the threshold
+    fraction.
+    """
+
+    lines = []
+    regressions = []
+
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+
+        before = baseline["results"][name]["min"]
+        after = result["min"]
+        ratio = after / before if before else float("inf")
+
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+
+        lines.append(
+            f"{name}: {format_time(before)} -> {format_time(after)} "
+            f"({ratio:.2f}x){flag}"
+        )
+
+    return lines, regressions
+
+
+def save_results(results: dict, path: Path) -> None:
+    with path.open("w") as file:
+        json.dump(results, file, indent=4)
+
+
+def load_results(path: Path) -> dict:
+    with path.open() as file:
+        return json.load(file)
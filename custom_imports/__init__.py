@@ -1,19 +1,14 @@
-from custom_imports.file_module import FileModuleExtensionFinder, FileModuleLoader
-from custom_imports.importer import (
-    Finder,
-    Importer,
-    Loader,
-    Module,
-    ModuleSpec,
-    SimpleFinder,
-    SimpleLoader,
-)
-from custom_imports.sample_importers import (
-    CSVImporter,
-    cfg_importer,
-    ini_importer,
-    json_importer,
-)
+"""
+Custom importers, for importing non-Python files as modules.
+
+Names are imported from their modules on first access (PEP 562), so importing
+custom_imports is cheap, and only the importers used are built.
+This module imports nothing else but custom_imports.utils.lazy, so that
+registering an ImporterStub in a .pth file stays cheap, for every Python process
+in the environment.
+"""
+
+from custom_imports.utils.lazy import lazy_attributes
 
 __version__ = "1.0.0"
 
@@ -23,12 +18,95 @@ __all__ = [
     "Finder",
     "Loader",
     "SimpleFinder",
+    "CachingFinder",
+    "CacheInfo",
     "SimpleLoader",
     "Importer",
+    "ImportEvent",
+    "ImportObserver",
+    "ObservedLoader",
+    "ImportStats",
+    "ImportTracer",
+    "DirectoryCache",
     "FileModuleExtensionFinder",
+    "FileModuleMultiExtensionFinder",
     "FileModuleLoader",
+    "FileModuleCache",
+    "SharedMemoryCache",
+    "FileModuleDispatchLoader",
+    "FileModuleImporter",
+    "FileModulePathEntryFinder",
+    "FileModuleWatcher",
+    "ManifestFinder",
+    "compile_file_modules",
+    "CompileResult",
+    "ZipLocator",
+    "ZipBundleFinder",
+    "ZipBundleImporter",
     "json_importer",
+    "JSONImporter",
+    "JSONBackend",
+    "IndexedJSONImporter",
+    "JSONIndex",
     "cfg_importer",
     "ini_importer",
+    "ConfigImporter",
     "CSVImporter",
+    "ColumnarCSVImporter",
+    "CSVTable",
+    "StreamingCSVImporter",
+    "CSVStream",
+    "ImporterStub",
+    "register_stub",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "ModuleSpec": ".importer.types",
+        "Module": ".importer.types",
+        "Finder": ".importer.types",
+        "Loader": ".importer.types",
+        "SimpleFinder": ".importer.simple_finder",
+        "CachingFinder": ".importer.caching_finder",
+        "CacheInfo": ".importer.caching_finder",
+        "SimpleLoader": ".importer.simple_loader",
+        "Importer": ".importer.importer",
+        "ImportEvent": ".importer.instrumentation",
+        "ImportObserver": ".importer.instrumentation",
+        "ObservedLoader": ".importer.instrumentation",
+        "ImportStats": ".importer.import_stats",
+        "ImportTracer": ".importer.import_tracer",
+        "DirectoryCache": ".file_module.dir_cache",
+        "FileModuleExtensionFinder": ".file_module.ext_finder",
+        "FileModuleMultiExtensionFinder": ".file_module.multi_ext_finder",
+        "FileModuleLoader": ".file_module.loader",
+        "FileModuleCache": ".file_module.cache",
+        "SharedMemoryCache": ".file_module.shared_cache",
+        "FileModuleDispatchLoader": ".file_module.dispatch_loader",
+        "FileModuleImporter": ".file_module.importer",
+        "FileModulePathEntryFinder": ".file_module.path_entry_finder",
+        "FileModuleWatcher": ".file_module.watcher",
+        "ManifestFinder": ".file_module.manifest",
+        "compile_file_modules": ".file_module.compile",
+        "CompileResult": ".file_module.compile",
+        "ZipLocator": ".file_module.zip_bundle",
+        "ZipBundleFinder": ".file_module.zip_bundle",
+        "ZipBundleImporter": ".file_module.zip_bundle",
+        "json_importer": ".sample_importers.json_importer",
+        "JSONImporter": ".sample_importers.json_importer",
+        "JSONBackend": ".sample_importers.json_importer",
+        "IndexedJSONImporter": ".sample_importers.indexed_json_importer",
+        "JSONIndex": ".sample_importers.indexed_json_importer",
+        "cfg_importer": ".sample_importers.config_importer",
+        "ini_importer": ".sample_importers.config_importer",
+        "ConfigImporter": ".sample_importers.config_importer",
+        "CSVImporter": ".sample_importers.csv_importer",
+        "ColumnarCSVImporter": ".sample_importers.columnar_csv_importer",
+        "CSVTable": ".sample_importers.columnar_csv_importer",
+        "StreamingCSVImporter": ".sample_importers.streaming_csv_importer",
+        "CSVStream": ".sample_importers.streaming_csv_importer",
+        "ImporterStub": ".stub",
+        "register_stub": ".stub",
+    },
+)
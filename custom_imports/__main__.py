@@ -0,0 +1,123 @@
+import argparse
+import logging
+import sys
+from importlib import import_module
+from pathlib import Path
+from typing import List, Optional
+
+from custom_imports.file_module import (
+    FileModuleCache,
+    FileModuleImporter,
+    compile_file_modules,
+)
+from custom_imports.file_module.manifest import write_manifest
+from custom_imports.importer import Importer
+
+DEFAULT_IMPORTERS = [
+    "custom_imports:json_importer",
+    "custom_imports:ini_importer",
+    "custom_imports:cfg_importer",
+]
+
+
+def resolve_importer(reference: str) -> Importer:
+    module_name, _, attribute = reference.partition(":")
+
+    if not attribute:
+        raise argparse.ArgumentTypeError(
+            f"Expected an importer as module:attribute, not {reference!r}"
+        )
+
+    importer = import_module(module_name)
+    for name in attribute.split("."):
+        importer = getattr(importer, name)
+
+    return importer
+
+
+def compile_command(args: argparse.Namespace) -> int:
+    importers = args.importers or [
+        resolve_importer(reference) for reference in DEFAULT_IMPORTERS
+    ]
+    importer = FileModuleImporter.from_importers(*importers)
+
+    if args.directories:
+        directories = args.directories
+        maxlevels = 0 if args.no_recurse else None
+    else:
+        # As compileall, do not recurse into sys.path directories.
+        directories = sys.path
+        maxlevels = 0
+
+    cache = FileModuleCache(args.cache_dir)
+    result = compile_file_modules(importer, directories, cache, maxlevels)
+
+    if args.manifest is not None:
+        write_manifest(args.manifest, result.modules)
+
+    return 1 if result.failed else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m custom_imports")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    compile_parser = subparsers.add_parser(
+        "compile",
+        description=(
+            "Parse the file based modules in the given directories, or on "
+            "sys.path, and store snapshots of them, so they are not parsed on "
+            "import."
+        ),
+    )
+    compile_parser.add_argument(
+        "directories", nargs="*", help="Directories to search, instead of sys.path."
+    )
+    compile_parser.add_argument(
+        "-i",
+        "--importer",
+        dest="importers",
+        action="append",
+        type=resolve_importer,
+        metavar="MODULE:ATTRIBUTE",
+        help=(
+            "File extension importer to compile modules for. "
+            "May be repeated. Defaults to the json, ini, and cfg importers."
+        ),
+    )
+    compile_parser.add_argument(
+        "-l",
+        "--no-recurse",
+        action="store_true",
+        help="Do not recurse into subdirectories.",
+    )
+    compile_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help=(
+            "Directory to store snapshots in, "
+            "instead of __pycache__ directories next to each file."
+        ),
+    )
+    compile_parser.add_argument(
+        "--manifest",
+        type=Path,
+        help="Write a JSON manifest of module names and paths, for ManifestFinder.",
+    )
+    compile_parser.add_argument(
+        "-q", "--quiet", action="store_true", help="Only report failures."
+    )
+    compile_parser.set_defaults(func=compile_command)
+
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.INFO, format="%(message)s"
+    )
+
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
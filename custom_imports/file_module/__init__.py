@@ -1,4 +1,42 @@
-from custom_imports.file_module.ext_finder import FileModuleExtensionFinder
-from custom_imports.file_module.loader import FileModuleLoader
+from custom_imports.utils.lazy import lazy_attributes
 
-__all__ = ["FileModuleExtensionFinder", "FileModuleLoader"]
+__all__ = [
+    "DirectoryCache",
+    "FileModuleExtensionFinder",
+    "FileModuleMultiExtensionFinder",
+    "FileModuleLoader",
+    "FileModuleCache",
+    "FileModuleDispatchLoader",
+    "FileModuleImporter",
+    "FileModulePathEntryFinder",
+    "FileModuleWatcher",
+    "ManifestFinder",
+    "SharedMemoryCache",
+    "compile_file_modules",
+    "CompileResult",
+    "ZipLocator",
+    "ZipBundleFinder",
+    "ZipBundleImporter",
+]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "DirectoryCache": ".dir_cache",
+        "FileModuleExtensionFinder": ".ext_finder",
+        "FileModuleMultiExtensionFinder": ".multi_ext_finder",
+        "FileModuleLoader": ".loader",
+        "FileModuleCache": ".cache",
+        "FileModuleDispatchLoader": ".dispatch_loader",
+        "FileModuleImporter": ".importer",
+        "FileModulePathEntryFinder": ".path_entry_finder",
+        "FileModuleWatcher": ".watcher",
+        "ManifestFinder": ".manifest",
+        "SharedMemoryCache": ".shared_cache",
+        "compile_file_modules": ".compile",
+        "CompileResult": ".compile",
+        "ZipLocator": ".zip_bundle",
+        "ZipBundleFinder": ".zip_bundle",
+        "ZipBundleImporter": ".zip_bundle",
+    },
+)
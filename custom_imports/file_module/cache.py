@@ -0,0 +1,108 @@
+import hashlib
+import os
+import pickle
+import struct
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+__all__ = ["FileModuleCache", "NOT_CACHED"]
+
+NOT_CACHED = object()
+
+_MAGIC = b"CIMC"
+_HEADER = struct.Struct("<4sqQ")  # Magic, source mtime (ns), source size.
+
+
+@dataclass(frozen=True)
+class FileModuleCache:
+    """
+    On-disk cache of parsed file based modules, in the style of __pycache__.
+
+    FileModuleCache(cache_dir=None)
+
+    Stores a pickled snapshot of each parsed module, keyed by the modification
+    time and size of its source file.
+    While the source file is unchanged, the snapshot may be loaded in place of
+    parsing the source file again.
+
+    If cache_dir is None, snapshots are stored in a __pycache__ directory next
+    to each source file, otherwise they are all stored in cache_dir.
+
+    Failure to write a snapshot, for example in a read-only directory, is
+    silently ignored, as is a snapshot that cannot be read, or unpickled.
+    """
+
+    cache_dir: Optional[Path] = None
+
+    def cache_path(self, path: Path) -> Path:
+        file_name = f"{path.name}.{sys.implementation.cache_tag}.pickle"
+
+        if self.cache_dir is None:
+            return path.parent / "__pycache__" / file_name
+
+        digest = hashlib.sha1(os.fsencode(path.resolve())).hexdigest()[:16]
+        return Path(self.cache_dir, f"{digest}-{file_name}")
+
+    def load(self, path: Path, source_stat: Optional[os.stat_result] = None) -> Any:
+        """
+        Load the snapshot for source file path, as of source_stat, its stat
+        result, if given.
+
+        Returns NOT_CACHED if there is no up-to-date snapshot.
+        """
+
+        try:
+            if source_stat is None:
+                source_stat = path.stat()
+
+            with self.cache_path(path).open("rb") as file:
+                magic, mtime, size = _HEADER.unpack(file.read(_HEADER.size))
+
+                if (magic, mtime, size) != (
+                    _MAGIC,
+                    source_stat.st_mtime_ns,
+                    source_stat.st_size,
+                ):
+                    return NOT_CACHED
+
+                return pickle.load(file)
+        except Exception:
+            # Unpickling a snapshot may fail in any way, such as if a class it
+            # refers to has since been renamed, or moved.
+            return NOT_CACHED
+
+    def store(
+        self, path: Path, state: Any, source_stat: Optional[os.stat_result] = None
+    ) -> None:
+        """
+        Store state as the snapshot for source file path.
+
+        source_stat is the stat result of the source file taken before it was
+        read, so that if the file changes while it is read, the snapshot is
+        stored as out of date.
+        If None, the source file is stat-ed now.
+        """
+
+        cache_path = self.cache_path(path)
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+
+        try:
+            if source_stat is None:
+                source_stat = path.stat()
+
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+            with temp_path.open("wb") as file:
+                file.write(
+                    _HEADER.pack(_MAGIC, source_stat.st_mtime_ns, source_stat.st_size)
+                )
+                pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temp_path, cache_path)
+        except OSError:
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
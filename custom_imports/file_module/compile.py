@@ -0,0 +1,123 @@
+import logging
+import os
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from custom_imports.file_module.cache import FileModuleCache
+from custom_imports.file_module.importer import FileModuleImporter
+from custom_imports.file_module.loader import FileModuleLoader
+from custom_imports.importer import ModuleSpec
+
+__all__ = ["compile_file_modules", "iter_file_modules", "CompileResult"]
+
+logger = logging.getLogger(__name__)
+
+
+class CompileResult(NamedTuple):
+    modules: Dict[str, Path]
+    failed: List[str]
+
+
+def iter_file_modules(
+    directory: str, extensions: Iterable[str], maxlevels: Optional[int] = None
+) -> Iterator[Tuple[str, str, Path]]:
+    """
+    Find the file based modules in directory, and its subdirectories up to
+    maxlevels deep, as module name, extension, and path.
+
+    Within a directory, earlier extensions take precedence over later ones.
+    """
+
+    extensions = list(extensions)
+    directory = os.fspath(directory) or "."
+
+    for root, dir_names, file_names in os.walk(directory):
+        rel_parts = Path(os.path.relpath(root, directory)).parts
+        if rel_parts == (".",):
+            rel_parts = ()
+
+        if maxlevels is not None and len(rel_parts) >= maxlevels:
+            dir_names.clear()
+        else:
+            dir_names[:] = sorted(
+                name
+                for name in dir_names
+                if name.isidentifier() and name != "__pycache__"
+            )
+
+        prefix = "".join(part + "." for part in rel_parts)
+        seen = set()
+
+        for extension in extensions:
+            suffix = "." + extension
+
+            for file_name in sorted(file_names):
+                name = file_name[: -len(suffix)]
+
+                if file_name.endswith(suffix) and name.isidentifier():
+                    if name not in seen:
+                        seen.add(name)
+                        yield prefix + name, extension, Path(root, file_name)
+
+
+def compile_file_modules(
+    importer: FileModuleImporter,
+    directories: Iterable[str],
+    cache: Optional[FileModuleCache] = None,
+    maxlevels: Optional[int] = None,
+) -> CompileResult:
+    """
+    Find every file that importer would load from the given directories, and
+    store a snapshot of each parsed module in cache.
+
+    Returns the modules found, by name, and the names of modules that failed to
+    parse.
+    Modules in earlier directories take precedence over later ones, as on
+    sys.path.
+
+    Snapshots are only stored for modules whose loaders are FileModuleLoaders
+    with dump_module and restore_module.
+    If cache is None, a FileModuleCache storing snapshots in __pycache__
+    directories is used.
+    """
+
+    if cache is None:
+        cache = FileModuleCache()
+
+    loaders = {
+        extension: replace(loader, cache=cache)
+        for extension, loader in importer.loaders.items()
+        if isinstance(loader, FileModuleLoader)
+        and loader.dump_module is not None
+        and loader.restore_module is not None
+    }
+
+    modules = {}
+    failed = []
+
+    for directory in directories:
+        for name, extension, path in iter_file_modules(
+            directory, importer.loaders, maxlevels
+        ):
+            if name in modules:
+                continue
+
+            modules[name] = path.resolve()
+
+            loader = loaders.get(extension)
+            if loader is None:
+                continue
+
+            try:
+                module = loader.create_module(
+                    ModuleSpec(name, loader, loader_state=modules[name])
+                )
+                loader.load_module(module, modules[name])
+            except Exception:
+                logger.exception("Failed to compile %s", path)
+                failed.append(name)
+            else:
+                logger.info("Compiled %s", path)
+
+    return CompileResult(modules, failed)
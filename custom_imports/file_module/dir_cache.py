@@ -0,0 +1,48 @@
+import os
+
+# Not imported at run time, as for custom_imports.utils.lazy, so that
+# ImporterStub may use DirectoryCache.
+MYPY = False
+if MYPY:  # pragma: no cover
+    from typing import Dict, FrozenSet, Tuple
+
+__all__ = ["DirectoryCache"]
+
+
+class DirectoryCache:
+    """
+    Cache of directory listings.
+
+    DirectoryCache()
+
+    Lists the contents of each directory once, and answers membership queries
+    from memory, in the same way as the standard library's FileFinder.
+
+    A cached listing is reused for as long as the directory's modification
+    time is unchanged, so each lookup costs at most one stat per directory.
+    Directories that cannot be listed are treated as empty.
+    """
+
+    def __init__(self) -> None:
+        self._listings: "Dict[str, Tuple[int, FrozenSet[str]]]" = {}
+
+    def listing(self, directory: str) -> "FrozenSet[str]":
+        try:
+            mtime = os.stat(directory or ".").st_mtime_ns
+        except OSError:
+            return frozenset()
+
+        cached = self._listings.get(directory)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            names = frozenset(os.listdir(directory or "."))
+        except OSError:
+            names = frozenset()
+
+        self._listings[directory] = (mtime, names)
+        return names
+
+    def invalidate(self) -> None:
+        self._listings.clear()
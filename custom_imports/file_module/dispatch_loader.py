@@ -0,0 +1,53 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict
+
+from custom_imports.importer import Loader, Module, ModuleSpec
+from custom_imports.utils import field_required
+
+__all__ = ["FileModuleDispatchLoader"]
+
+
+@dataclass(frozen=True)
+class FileModuleDispatchLoader(Loader[Path, Any]):
+    """
+    Loader for file based modules of several types.
+
+    FileModuleDispatchLoader(
+        loaders={ext: loader, ...},
+    )
+
+    This Loader takes a Path to the file to be loaded as its module locator,
+    and delegates to the loader registered for that file's extension.
+    Of compound extensions, such as geo.json and json, the longest that the
+    file name ends with is used.
+    """
+
+    loaders: Dict[str, Loader[Path, Any]] = field(default_factory=field_required)
+
+    def loader_for(self, path: Path) -> Loader[Path, Any]:
+        # Module names have no dots, so the extension the file was found by is
+        # the longest that its name ends with.
+        extension = max(
+            (
+                extension
+                for extension in self.loaders
+                if path.name.endswith("." + extension)
+            ),
+            key=len,
+            default=None,
+        )
+
+        if extension is None:
+            raise ImportError(f"No loader for file {path}")
+
+        return self.loaders[extension]
+
+    def create_module(self, spec: ModuleSpec[Path, Any]) -> Module[Path, Any]:
+        return self.loader_for(spec.loader_state).create_module(spec)
+
+    def exec_module(self, module: Module[Path, Any]) -> None:
+        self.loader_for(module.__spec__.loader_state).exec_module(module)
+
+    def reload_module(self, module: Module[Path, Any]) -> None:
+        self.loader_for(module.__spec__.loader_state).reload_module(module)
@@ -1,14 +1,46 @@
+import os
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from types import ModuleType
-from typing import Iterable, Optional
+from typing import Iterable, Optional, Sequence
 
+from custom_imports.file_module.dir_cache import DirectoryCache
 from custom_imports.importer import Finder
 
 __all__ = ["FileModuleExtensionFinder"]
 
 
+def find_file_path(
+    directory_cache: DirectoryCache,
+    fullname: str,
+    extensions: Sequence[str],
+    search_paths: Iterable[str],
+) -> Optional[Path]:
+    """
+    Find the file for module fullname, with any of the given extensions.
+
+    Each search path is tried in turn, and within a search path, extensions are
+    tried in order. Each search directory is listed at most once.
+    """
+
+    rel_dir, _, name = fullname.rpartition(".")
+    rel_dir = rel_dir.replace(".", os.sep)
+    file_names = [name + "." + extension for extension in extensions]
+
+    for path in search_paths:
+        directory = os.fspath(path)
+        if rel_dir:
+            directory = os.path.join(directory, rel_dir)
+
+        listing = directory_cache.listing(directory)
+        for file_name in file_names:
+            if file_name in listing:
+                abs_file_path = Path(directory, file_name)
+                if abs_file_path.is_file():
+                    return abs_file_path
+
+
 @dataclass(frozen=True)
 class FileModuleExtensionFinder(Finder[Path]):
     """
@@ -22,19 +54,30 @@ class FileModuleExtensionFinder(Finder[Path]):
     This provides a relative path, which is searched for on the standard module
     search path. If a file with that relative path is found, then the absolute
     Path of that file is returned as its module locator.
+
+    Submodules are only searched for in their parent package's __path__.
+
+    Directory listings are cached, and the cache is cleared by
+    importlib.invalidate_caches().
     """
 
     extension: str
+    directory_cache: DirectoryCache = field(
+        default_factory=DirectoryCache, init=False, repr=False, compare=False
+    )
 
     def find_path(self, fullname: str, search_paths: Iterable[str]) -> Optional[Path]:
-        rel_file_path = Path(fullname.replace(".", "/") + "." + self.extension)
-
-        for path in search_paths:
-            abs_file_path = path / rel_file_path
-            if abs_file_path.is_file():
-                return abs_file_path
+        return find_file_path(
+            self.directory_cache, fullname, [self.extension], search_paths
+        )
 
     def find_module_locator(
         self, fullname: str, path: Iterable[str], target: Optional[ModuleType] = None
     ) -> Optional[Path]:
-        return self.find_path(fullname, sys.path)
+        if path is None:
+            return self.find_path(fullname, sys.path)
+
+        return self.find_path(fullname.rpartition(".")[2], path)
+
+    def invalidate_caches(self) -> None:
+        self.directory_cache.invalidate()
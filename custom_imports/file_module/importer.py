@@ -0,0 +1,110 @@
+import os
+import sys
+from dataclasses import dataclass, field
+from importlib.abc import PathEntryFinder
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from custom_imports.file_module.dispatch_loader import FileModuleDispatchLoader
+from custom_imports.file_module.ext_finder import FileModuleExtensionFinder
+from custom_imports.file_module.multi_ext_finder import FileModuleMultiExtensionFinder
+from custom_imports.file_module.path_entry_finder import (
+    FileModulePathEntryFinder,
+    next_path_entry_finder,
+)
+from custom_imports.importer import Finder, Importer, Loader
+from custom_imports.utils import field_required
+
+__all__ = ["FileModuleImporter"]
+
+
+@dataclass(frozen=True)
+class FileModuleImporter(Importer[Path, Any]):
+    """
+    An Importer class for file based modules of several types.
+
+    FileModuleImporter(
+        loaders={ext: loader, ...},
+    )
+
+    When registered, this Importer finds a file with any of the given
+    extensions, and loads it with the loader for that extension.
+
+    A single FileModuleImporter scans each search directory once per lookup,
+    however many file types it handles, so is cheaper than registering an
+    Importer per file type.
+    Within a directory, earlier extensions take precedence over later ones.
+
+    Combine existing file based module importers with
+    FileModuleImporter.from_importers(*importers).
+
+    Alternatively, register with importer.register_path_hook() to search each
+    sys.path directory with a FileModulePathEntryFinder, cached in
+    sys.path_importer_cache alongside the standard library's finders.
+    Deregister with importer.deregister_path_hook().
+    Neither clears sys.path_importer_cache: finders already cached for
+    directories are wrapped on registration, and restored on deregistration.
+    """
+
+    finder: Finder[Path] = field(init=False, repr=False)
+    loader: Loader[Path, Any] = field(init=False, repr=False)
+    loaders: Dict[str, Loader[Path, Any]] = field(default_factory=field_required)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "finder", FileModuleMultiExtensionFinder(tuple(self.loaders))
+        )
+        object.__setattr__(self, "loader", FileModuleDispatchLoader(self.loaders))
+
+    @classmethod
+    def from_importers(cls, *importers: Importer[Path, Any]) -> "FileModuleImporter":
+        loaders = {}
+
+        for importer in importers:
+            if not isinstance(importer.finder, FileModuleExtensionFinder):
+                raise TypeError(f"{importer!r} is not a file extension importer")
+
+            loaders[importer.finder.extension] = importer.loader
+
+        return cls(loaders=loaders)
+
+    def _path_entry_finder(
+        self, path_entry: str, fallback: Optional[PathEntryFinder]
+    ) -> FileModulePathEntryFinder:
+        return FileModulePathEntryFinder(
+            path_entry, self.finder.extensions, self.loader, fallback=fallback
+        )
+
+    def path_hook(self, path_entry: str) -> FileModulePathEntryFinder:
+        if not os.path.isdir(path_entry or "."):
+            raise ImportError("only directories are supported", path=path_entry)
+
+        return self._path_entry_finder(
+            path_entry, next_path_entry_finder(self.path_hook, path_entry)
+        )
+
+    def register_path_hook(self):
+        sys.path_hooks.insert(0, self.path_hook)
+
+        # Directories already searched keep their cached finders, as fallbacks,
+        # and entries that no hook supported are looked up again.
+        cache = sys.path_importer_cache
+        for path_entry, finder in list(cache.items()):
+            if finder is None:
+                del cache[path_entry]
+            elif os.path.isdir(path_entry or "."):
+                cache[path_entry] = self._path_entry_finder(path_entry, finder)
+
+    def deregister_path_hook(self):
+        sys.path_hooks.remove(self.path_hook)
+
+        cache = sys.path_importer_cache
+        for path_entry, finder in list(cache.items()):
+            if (
+                isinstance(finder, FileModulePathEntryFinder)
+                and finder.loader is self.loader
+            ):
+                if finder.fallback is None:
+                    del cache[path_entry]
+                else:
+                    cache[path_entry] = finder.fallback
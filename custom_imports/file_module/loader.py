@@ -1,21 +1,105 @@
+import mmap
+import pickle
+import time
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
-from io import IOBase
+from io import IOBase, UnsupportedOperation
 from pathlib import Path
-from typing import Callable, TypeVar
+from typing import Any, Callable, Optional, TypeVar, Union
 
-from custom_imports.importer import Module, SimpleLoader
+from custom_imports.file_module.cache import NOT_CACHED, FileModuleCache
+from custom_imports.file_module.shared_cache import SharedMemoryCache
+from custom_imports.importer import Module, ModuleSpec, SimpleLoader
+from custom_imports.importer.instrumentation import is_observed, record_event
 from custom_imports.utils import field_required
 
 __all__ = ["FileModuleLoader"]
 
 MT = TypeVar("MT")  # Module type.
 
+READ_MODES = ("text", "binary", "bytes", "mmap")
+
+
+def read_file_module(
+    loader: "FileModuleLoader[MT]", module: Module[Path, MT], path: Path
+) -> None:
+    if loader.read_mode == "bytes":
+        loader.read_module(module, path.read_bytes())
+        return
+
+    if loader.read_mode == "text":
+        with path.open() as file:
+            loader.read_module(module, file)
+        return
+
+    with path.open("rb") as file:
+        if loader.read_mode == "binary":
+            loader.read_module(module, file)
+            return
+
+        try:
+            fileno = file.fileno()
+        except UnsupportedOperation:
+            # Not backed by a file descriptor, such as a member of a zip file.
+            loader.read_module(module, file.read())
+            return
+
+        try:
+            buffer = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped.
+            loader.read_module(module, b"")
+            return
+
+        with buffer:
+            loader.read_module(module, buffer)
+
+
+def read_file_snapshot(loader: "FileModuleLoader[MT]", path: Path) -> bytes:
+    """
+    Read a file based module, and return its snapshot, pickled.
+
+    Runs in the loader's executor, so the module is parsed in a worker process.
+    The snapshot is pickled here with the highest protocol, rather than by the
+    executor, so it is sent back as a single bytes object.
+    """
+
+    module = loader.create_module(ModuleSpec(path.stem, loader, loader_state=path))
+    read_file_module(loader, module, path)
+    return pickle.dumps(loader.dump_module(module), protocol=pickle.HIGHEST_PROTOCOL)
+
 
 def load_file_module(
     loader: "FileModuleLoader[MT]", module: Module[Path, MT], path: Path
 ) -> None:
-    with path.open() as file:
-        loader.read_module(module, file)
+    if loader.cache is not None:
+        # Taken before the file is read, so that if it changes meanwhile, the
+        # snapshot is stored as out of date.
+        source_stat = path.stat()
+        state = loader.cache.load(path, source_stat)
+
+        if state is not NOT_CACHED:
+            loader.restore_module(module, state)
+            return
+
+    start = time.perf_counter()
+
+    if loader.executor is not None:
+        snapshot = loader.executor.submit(read_file_snapshot, loader, path).result()
+        state = pickle.loads(snapshot)
+        loader.restore_module(module, state)
+    else:
+        read_file_module(loader, module, path)
+        state = NOT_CACHED
+
+    if is_observed():
+        record_event("read", start, module, bytes=path.stat().st_size)
+
+    if loader.cache is not None:
+        if state is NOT_CACHED:
+            state = loader.dump_module(module)
+
+        loader.cache.store(path, state, source_stat)
 
 
 @dataclass(frozen=True)
@@ -29,18 +113,89 @@ class FileModuleLoader(SimpleLoader[Path, MT]):
         module_type=cls,
         module_type_kwargs=kwargs,
         read_module=func,
+        read_mode="text",
+        dump_module=dump_func,
+        restore_module=restore_func,
+        cache=cache,
+        executor=executor,
     )
 
     This Loader takes a Path to the file to be loaded as its module locator,
     creates an empty module by calling the equivalent of cls(**kwargs),
     and executes it by calling func(module, file).
 
-    The file handle passed to func is closed after func terminates.
+    The file passed to func depends on read_mode:
+    - "text", a file handle in text mode.
+    - "binary", a file handle in binary mode.
+    - "bytes", the contents of the file, as bytes.
+    - "mmap", a read-only mmap of the file, which avoids copying its contents.
+    File handles and mmaps are closed after func terminates, so func must not
+    keep references to them, or to memoryviews of them.
+    Files that cannot be mapped, such as members of zip files, are read into
+    memory instead.
+
+    If cache is a FileModuleCache, or a SharedMemoryCache, then after a module
+    is read, the picklable snapshot dump_func(module) is stored in the cache.
+    Later loads of the unchanged file call restore_func(module, snapshot) on an
+    empty module instead of reading the file.
+
+    If executor is a concurrent.futures.Executor, such as a ProcessPoolExecutor,
+    then files are read by the executor, and the snapshot dump_func(module) is
+    sent back and restored into the module.
+    This moves CPU heavy parsing out of the importing process, but requires
+    the loader, and so func, dump_func, and restore_func, to be picklable.
+    The executor itself is not pickled with the loader.
     """
 
     load_module: Callable[[Module[Path, MT], Path], None] = field(
         default=load_file_module, init=False
     )
-    read_module: Callable[[Module[Path, MT], IOBase], None] = field(
-        default_factory=field_required
+    read_module: Callable[
+        [Module[Path, MT], Union[IOBase, bytes, mmap.mmap]], None
+    ] = field(default_factory=field_required)
+    read_mode: str = "text"
+    dump_module: Optional[Callable[[Module[Path, MT]], Any]] = None
+    restore_module: Optional[Callable[[Module[Path, MT], Any], None]] = None
+    cache: Optional[Union[FileModuleCache, SharedMemoryCache]] = None
+    executor: Optional[Executor] = field(
+        default=None, compare=False, metadata={"pickle": False}
     )
+
+    def __post_init__(self):
+        super().__post_init__()
+
+        if self.read_mode not in READ_MODES:
+            raise ValueError(f"Unknown read mode {self.read_mode!r}")
+
+        if self.cache is not None and (
+            self.dump_module is None or self.restore_module is None
+        ):
+            raise TypeError("A cached loader requires dump_module and restore_module")
+
+        if self.executor is not None and (
+            self.dump_module is None or self.restore_module is None
+        ):
+            raise TypeError(
+                "A loader with an executor requires dump_module and restore_module"
+            )
+
+    def reload_module(self, module: Module[Path, MT]) -> None:
+        if self.dump_module is None or self.restore_module is None:
+            super().reload_module(module)
+            return
+
+        if self.lazy and type(module) is self._lazy_module_type:
+            return
+
+        # Parse into a new module first, so the module being reloaded is only
+        # empty while its snapshot is restored.
+        new_module = self.create_module(module.__spec__)
+        self.load_module(new_module, module.__spec__.loader_state)
+        state = self.dump_module(new_module)
+
+        with self._module_lock(module):
+            self.reset_module(module)
+            self.restore_module(module, state)
+
+            if self.frozen:
+                self.freeze_module(module)
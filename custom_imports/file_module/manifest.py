@@ -0,0 +1,74 @@
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Iterable, Optional, Tuple
+
+from custom_imports.importer import Finder
+
+__all__ = ["ManifestFinder", "read_manifest", "write_manifest"]
+
+MANIFEST_VERSION = 1
+
+
+def write_manifest(path: Path, modules: Dict[str, Path]) -> None:
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "modules": {name: str(file_path) for name, file_path in modules.items()},
+    }
+
+    with Path(path).open("w") as file:
+        json.dump(manifest, file, indent=4, sort_keys=True)
+
+
+def read_manifest(path: Path) -> Dict[str, Path]:
+    with Path(path).open() as file:
+        manifest = json.load(file)
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported manifest version in {path}")
+
+    return {name: Path(file_path) for name, file_path in manifest["modules"].items()}
+
+
+@dataclass(frozen=True)
+class ManifestFinder(Finder[Path]):
+    """
+    Finder for file based modules listed in a manifest.
+
+    ManifestFinder(
+        manifest=path,
+        extensions=(ext, ...),
+    )
+
+    The manifest is a JSON file mapping module names to file paths, as written
+    by `python -m custom_imports compile --manifest path`.
+    It is read once, when the finder is created, and modules are found by
+    looking up their full names, without searching the file system.
+    Only files with the given extensions are found.
+
+    Modules missing from the manifest are not found, so the manifest should be
+    regenerated, and the finder recreated, when files are added.
+    """
+
+    manifest: Path
+    extensions: Tuple[str, ...]
+    modules: Dict[str, Path] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        suffixes = tuple("." + extension for extension in self.extensions)
+
+        object.__setattr__(
+            self,
+            "modules",
+            {
+                name: path
+                for name, path in read_manifest(self.manifest).items()
+                if path.name.endswith(suffixes)
+            },
+        )
+
+    def find_module_locator(
+        self, fullname: str, path: Iterable[str], target: Optional[ModuleType] = None
+    ) -> Optional[Path]:
+        return self.modules.get(fullname)
@@ -0,0 +1,48 @@
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Iterable, Optional, Tuple
+
+from custom_imports.file_module.dir_cache import DirectoryCache
+from custom_imports.file_module.ext_finder import find_file_path
+from custom_imports.importer import Finder
+
+__all__ = ["FileModuleMultiExtensionFinder"]
+
+
+@dataclass(frozen=True)
+class FileModuleMultiExtensionFinder(Finder[Path]):
+    """
+    Finder for file based modules by any of several file extensions.
+
+    FileModuleMultiExtensionFinder(extensions)
+
+    Behaves as FileModuleExtensionFinder, but accepts a file with any of the
+    extensions given.
+
+    Each search directory is listed at most once per lookup, however many
+    extensions there are. Within a directory, earlier extensions take
+    precedence over later ones.
+    """
+
+    extensions: Tuple[str, ...]
+    directory_cache: DirectoryCache = field(
+        default_factory=DirectoryCache, init=False, repr=False, compare=False
+    )
+
+    def find_path(self, fullname: str, search_paths: Iterable[str]) -> Optional[Path]:
+        return find_file_path(
+            self.directory_cache, fullname, self.extensions, search_paths
+        )
+
+    def find_module_locator(
+        self, fullname: str, path: Iterable[str], target: Optional[ModuleType] = None
+    ) -> Optional[Path]:
+        if path is None:
+            return self.find_path(fullname, sys.path)
+
+        return self.find_path(fullname.rpartition(".")[2], path)
+
+    def invalidate_caches(self) -> None:
+        self.directory_cache.invalidate()
@@ -0,0 +1,98 @@
+import sys
+from importlib.abc import PathEntryFinder
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Optional, Sequence
+
+from custom_imports.file_module.dir_cache import DirectoryCache
+from custom_imports.file_module.ext_finder import find_file_path
+from custom_imports.importer import Loader, ModuleSpec
+
+__all__ = ["FileModulePathEntryFinder"]
+
+
+def next_path_entry_finder(
+    hook: Callable[[str], PathEntryFinder], path_entry: str
+) -> Optional[PathEntryFinder]:
+    """
+    Find the path entry finder sys.path_hooks would use for path_entry,
+    if hook were not registered.
+    """
+
+    hooks = sys.path_hooks
+    index = hooks.index(hook) if hook in hooks else -1
+
+    for other_hook in hooks[index + 1 :]:
+        try:
+            return other_hook(path_entry)
+        except ImportError:
+            continue
+
+    return None
+
+
+class FileModulePathEntryFinder(PathEntryFinder):
+    """
+    Path entry finder for file based modules in a single directory.
+
+    FileModulePathEntryFinder(
+        path_entry,
+        extensions,
+        loader,
+        fallback=finder,
+    )
+
+    Finds a file in directory path_entry named after the last component of the
+    module name, with any of the given extensions, and uses loader to load it.
+
+    Regular Python modules and packages are found by the fallback path entry
+    finder, which takes precedence.
+    If the fallback only finds a namespace package portion, a file based module
+    in the same directory takes precedence.
+
+    Instances are created by FileModuleImporter.path_hook, and cached by the
+    import system in sys.path_importer_cache.
+    """
+
+    def __init__(
+        self,
+        path_entry: str,
+        extensions: Sequence[str],
+        loader: Loader[Path, Any],
+        fallback: Optional[PathEntryFinder] = None,
+    ):
+        self.path_entry = path_entry
+        self.extensions = extensions
+        self.loader = loader
+        self.fallback = fallback
+        self.directory_cache = DirectoryCache()
+
+    def find_spec(
+        self, fullname: str, target: Optional[ModuleType] = None
+    ) -> Optional[ModuleSpec]:
+        spec = None
+        if self.fallback is not None:
+            spec = self.fallback.find_spec(fullname, target)
+            if spec is not None and spec.loader is not None:
+                return spec
+
+        file_path = find_file_path(
+            self.directory_cache,
+            fullname.rpartition(".")[2],
+            self.extensions,
+            [self.path_entry],
+        )
+
+        if file_path is None:
+            return spec
+
+        return ModuleSpec(fullname, self.loader, loader_state=file_path)
+
+    def invalidate_caches(self) -> None:
+        self.directory_cache.invalidate()
+
+        if self.fallback is not None:
+            self.fallback.invalidate_caches()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path_entry!r})"
@@ -0,0 +1,358 @@
+import hashlib
+import io
+import os
+import pickle
+import struct
+import sys
+import threading
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from custom_imports.file_module.cache import NOT_CACHED
+
+__all__ = ["SharedMemoryCache"]
+
+_MAGIC = b"CISM"
+# Magic, source file modification time and size, pickle size, number of buffers.
+_HEADER = struct.Struct("<4sqQQQ")
+_BUFFER = struct.Struct("<QQ")  # Buffer offset, buffer size.
+_ALIGNMENT = 8
+
+# Formats that memoryview.cast supports.
+_VIEW_FORMATS = frozenset("bBhHiIlLqQfd")
+
+
+def _shareable(obj: Any) -> Optional[memoryview]:
+    if isinstance(obj, array) or (isinstance(obj, memoryview) and obj.ndim == 1):
+        view = memoryview(obj)
+        if view.format in _VIEW_FORMATS and view.c_contiguous:
+            return view
+
+    return None
+
+
+class _SegmentPickler(pickle.Pickler):
+    """
+    Pickler that sets aside the contents of arrays, to be stored unpickled.
+    """
+
+    def __init__(self, file: io.BytesIO):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.buffers: List[memoryview] = []
+
+    def persistent_id(self, obj: Any) -> Optional[Tuple[int, str]]:
+        view = _shareable(obj)
+        if view is None:
+            return None
+
+        self.buffers.append(view.cast("B"))
+        return len(self.buffers) - 1, view.format
+
+
+class _SegmentUnpickler(pickle.Unpickler):
+    """
+    Unpickler that restores arrays as read-only memoryviews of the segment.
+    """
+
+    def __init__(self, file: io.BytesIO, buffers: List[memoryview]):
+        super().__init__(file)
+        self.buffers = buffers
+
+    def persistent_load(self, pid: Tuple[int, str]) -> memoryview:
+        index, format = pid
+        return self.buffers[index].cast(format)
+
+
+# Attached segments, by name.
+# Restored modules may hold memoryviews of a segment, so segments stay attached
+# for the life of the process, whichever cache attached to them, including
+# segments since unlinked, or replaced by a snapshot of a changed file.
+_segments: Dict[str, Any] = {}
+_retired_segments: List[Any] = []
+_segments_lock = threading.Lock()
+
+
+def _open_segment(name: str, create: bool = False, size: int = 0) -> Any:
+    """
+    Open a shared memory segment, which outlives the process.
+    """
+
+    # Imported here, as FileModuleLoader imports this module.
+    from multiprocessing import resource_tracker, shared_memory
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, create, size, track=False)
+
+    segment = shared_memory.SharedMemory(name, create, size)
+
+    if os.name == "posix":
+        # Otherwise the resource tracker unlinks the segment when this process
+        # exits, even if it only attached to it.
+        resource_tracker.unregister(segment._name, "shared_memory")
+
+    return segment
+
+
+def _unlink_segment(segment: Any) -> None:
+    if sys.version_info < (3, 13) and os.name == "posix":
+        from multiprocessing import resource_tracker
+
+        # SharedMemory.unlink unregisters the segment from the resource tracker.
+        resource_tracker.register(segment._name, "shared_memory")
+
+    segment.unlink()
+
+
+def _source_key(path: Path, source_stat: Optional[os.stat_result]) -> Tuple[int, int]:
+    if source_stat is None:
+        source_stat = path.stat()
+
+    return source_stat.st_mtime_ns, source_stat.st_size
+
+
+def _segment_key(segment: Any) -> Optional[Tuple[int, int]]:
+    """
+    The modification time and size of the source file of the snapshot in
+    segment, or None if it is not yet fully published.
+    """
+
+    magic, mtime, size, _, _ = _HEADER.unpack_from(segment.buf)
+    return (mtime, size) if magic == _MAGIC else None
+
+
+def _keep_segment(name: str, segment: Any) -> None:
+    """
+    Keep segment attached, as the current segment of its name.
+
+    Must be called with _segments_lock held.
+    """
+
+    previous = _segments.get(name)
+    if previous is not None:
+        _retired_segments.append(previous)
+
+    _segments[name] = segment
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+@dataclass(frozen=True)
+class SharedMemoryCache:
+    """
+    Cache of parsed file based modules in shared memory, shared by every
+    process on the host.
+
+    SharedMemoryCache(prefix="cim_")
+
+    Publishes a snapshot of each parsed module in a
+    multiprocessing.shared_memory segment, named by prefix, and by the path of
+    its source file.
+    The first process to import a module parses it, and publishes its snapshot.
+    Later imports of the unchanged file, in any process, attach to the segment,
+    and restore the snapshot, instead of parsing the file again.
+    Once the file changes, by modification time or size, the next process to
+    import it parses it again, and replaces the segment.
+
+    Only arrays in the snapshot, such as the numeric columns of a CSVTable, are
+    restored without copying, as read-only memoryviews of the segment, so each
+    process shares the same memory.
+    The rest of the snapshot, including the whole of a JSON or config module,
+    is unpickled into each process, which only saves parsing the file.
+
+    Segments outlive the processes that use them, so processes that start
+    later still attach to them, until they are unlinked with cache.unlink(path),
+    or the host restarts.
+    Requires Python 3.8+.
+    """
+
+    prefix: str = "cim_"
+
+    def __post_init__(self):
+        if sys.version_info < (3, 8):
+            raise RuntimeError("SharedMemoryCache requires Python 3.8+")
+
+    def segment_name(self, path: Path) -> str:
+        # Short enough for the 31 character limit on macOS.
+        return (
+            self.prefix + hashlib.sha1(os.fsencode(path.resolve())).hexdigest()[:20]
+        )
+
+    def _attach(self, name: str, source_key: Tuple[int, int]) -> Any:
+        """
+        Attach to the segment name, if it holds a snapshot of the source file
+        with source_key, or return None.
+        """
+
+        with _segments_lock:
+            segment = _segments.get(name)
+            if segment is not None and _segment_key(segment) == source_key:
+                return segment
+
+            try:
+                segment = _open_segment(name)
+            except (OSError, ValueError):
+                return None
+
+            if _segment_key(segment) != source_key:
+                # Not yet fully published, or of another version of the file.
+                segment.close()
+                return None
+
+            _keep_segment(name, segment)
+            return segment
+
+    def _unlink_stale(self, name: str, source_key: Tuple[int, int]) -> bool:
+        """
+        Unlink the segment name, if it holds a snapshot of another version of
+        the source file, and return whether it did.
+        """
+
+        try:
+            segment = _open_segment(name)
+        except (OSError, ValueError):
+            # Already unlinked.
+            return True
+
+        try:
+            segment_key = _segment_key(segment)
+            if segment_key is None or segment_key == source_key:
+                # Being published, or already published, by another process.
+                return False
+
+            _unlink_segment(segment)
+            return True
+        except OSError:
+            return True
+        finally:
+            segment.close()
+
+    def load(self, path: Path, source_stat: Optional[os.stat_result] = None) -> Any:
+        """
+        Load the snapshot for source file path, as of source_stat, its stat
+        result, if given.
+
+        Returns NOT_CACHED if there is no up-to-date snapshot.
+        """
+
+        try:
+            segment = self._attach(
+                self.segment_name(path), _source_key(path, source_stat)
+            )
+        except OSError:
+            return NOT_CACHED
+
+        if segment is None:
+            return NOT_CACHED
+
+        buf = segment.buf.toreadonly()
+        _, _, _, pickle_size, buffer_count = _HEADER.unpack_from(buf)
+
+        offset = _HEADER.size
+        buffers = []
+        for _ in range(buffer_count):
+            buffer_offset, buffer_size = _BUFFER.unpack_from(buf, offset)
+            buffers.append(buf[buffer_offset : buffer_offset + buffer_size])
+            offset += _BUFFER.size
+
+        data = io.BytesIO(buf[offset : offset + pickle_size])
+        try:
+            return _SegmentUnpickler(data, buffers).load()
+        except Exception:
+            # Unpickling a snapshot may fail in any way, such as if a class it
+            # refers to has since been renamed, or moved.
+            return NOT_CACHED
+
+    def store(
+        self, path: Path, state: Any, source_stat: Optional[os.stat_result] = None
+    ) -> None:
+        """
+        Publish state as the snapshot for source file path, replacing any
+        snapshot of an earlier version of the file.
+
+        source_stat is the stat result of the source file taken before it was
+        read, as for FileModuleCache.store.
+
+        If another process is publishing a snapshot of the same file, this one
+        is discarded.
+        """
+
+        data = io.BytesIO()
+        pickler = _SegmentPickler(data)
+        pickler.dump(state)
+        buffers = pickler.buffers
+
+        offset = _HEADER.size + _BUFFER.size * len(buffers) + len(data.getbuffer())
+        table = []
+        for buffer in buffers:
+            offset = _align(offset)
+            table.append((offset, buffer.nbytes))
+            offset += buffer.nbytes
+
+        try:
+            source_key = _source_key(path, source_stat)
+            name = self.segment_name(path)
+            try:
+                segment = _open_segment(name, create=True, size=offset)
+            except FileExistsError:
+                if not self._unlink_stale(name, source_key):
+                    return
+
+                segment = _open_segment(name, create=True, size=offset)
+        except OSError:
+            return
+
+        buf = segment.buf
+        position = _HEADER.size
+        for buffer_offset, buffer_size in table:
+            _BUFFER.pack_into(buf, position, buffer_offset, buffer_size)
+            position += _BUFFER.size
+
+        buf[position : position + len(data.getbuffer())] = data.getbuffer()
+
+        for buffer, (buffer_offset, buffer_size) in zip(buffers, table):
+            buf[buffer_offset : buffer_offset + buffer_size] = buffer
+
+        # The magic is written last, so the segment is only attached to once
+        # it is complete.
+        _HEADER.pack_into(
+            buf,
+            0,
+            b"\0" * len(_MAGIC),
+            *source_key,
+            len(data.getbuffer()),
+            len(buffers),
+        )
+        buf[: len(_MAGIC)] = _MAGIC
+
+        with _segments_lock:
+            _keep_segment(name, segment)
+
+    def unlink(self, path: Path) -> None:
+        """
+        Remove the snapshot for source file path, so that later imports parse the
+        file again.
+
+        Modules already restored from the snapshot are unaffected.
+        """
+
+        name = self.segment_name(path)
+
+        with _segments_lock:
+            segment = _segments.pop(name, None)
+            if segment is not None:
+                _retired_segments.append(segment)
+
+        try:
+            if segment is not None:
+                _unlink_segment(segment)
+            else:
+                segment = _open_segment(name)
+                _unlink_segment(segment)
+                segment.close()
+        except (OSError, ValueError):
+            # Already unlinked.
+            pass
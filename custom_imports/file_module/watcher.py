@@ -0,0 +1,219 @@
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from custom_imports.importer import Importer, Loader, Module, ObservedLoader
+
+__all__ = ["FileModuleWatcher"]
+
+logger = logging.getLogger(__name__)
+
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_EVENT = struct.Struct("iIII")  # Watch descriptor, mask, cookie, name length.
+
+
+class _Inotify:
+    """
+    Minimal inotify wrapper, watching directories for written or replaced files.
+    """
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.directories: Set[str] = set()
+
+    def watch(self, directory: str) -> None:
+        if directory in self.directories:
+            return
+
+        mask = _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+        if self._add_watch(self.fd, os.fsencode(directory), mask) >= 0:
+            self.directories.add(directory)
+
+    def drain(self) -> None:
+        try:
+            while os.read(self.fd, 64 * _IN_EVENT.size):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _module_loader(module: Module) -> Optional[Loader]:
+    loader = getattr(getattr(module, "__spec__", None), "loader", None)
+
+    if isinstance(loader, ObservedLoader):
+        return loader.loader
+
+    return loader
+
+
+def _module_path(module: Module) -> Optional[Path]:
+    path = getattr(getattr(module, "__spec__", None), "loader_state", None)
+
+    # Modules from other locators, such as ZipLocators, have no file to watch.
+    if isinstance(path, (str, os.PathLike)):
+        return path
+
+    return None
+
+
+class FileModuleWatcher:
+    """
+    Reloads file based modules in place when their files change.
+
+    FileModuleWatcher(
+        *importers,
+        interval=1.0,
+        use_inotify=None,
+    )
+
+    Watches the files of modules in sys.modules that were loaded by any of the
+    given importers, and reloads a module when the modification time or size of
+    its file changes.
+    Modules loaded from elsewhere than a file, such as from a zip archive by a
+    ZipBundleImporter, are not watched.
+    Modules are reloaded in place, with loader.reload_module(module), so
+    existing references to a module see its new contents.
+
+    Start watching in a background thread with watcher.start(), and stop with
+    watcher.stop(), or use the watcher as a context manager.
+    Alternatively, call watcher.check() to check for changes immediately.
+
+    On Linux, inotify is used to react to changes promptly, otherwise files
+    are polled every interval seconds.
+    Set use_inotify to False to always poll.
+    """
+
+    def __init__(
+        self,
+        *importers: Importer[Path, Module],
+        interval: float = 1.0,
+        use_inotify: Optional[bool] = None,
+    ):
+        self.importers = importers
+        self.interval = interval
+        self.use_inotify = (
+            sys.platform == "linux" if use_inotify is None else use_inotify
+        )
+
+        self._file_states: Dict[str, Tuple[Path, Tuple[int, int]]] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def watched_modules(self) -> Dict[str, Module]:
+        loaders = [importer.loader for importer in self.importers]
+
+        return {
+            name: module
+            for name, module in list(sys.modules.items())
+            if any(_module_loader(module) is loader for loader in loaders)
+            and _module_path(module) is not None
+        }
+
+    def check(self) -> List[str]:
+        """
+        Reload each watched module whose file has changed since it was last
+        checked.
+
+        Returns the names of the modules reloaded.
+        """
+
+        reloaded = []
+
+        for name, module in self.watched_modules().items():
+            path = _module_path(module)
+
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+
+            file_state = (path, (stat.st_mtime_ns, stat.st_size))
+            previous_file_state = self._file_states.get(name)
+            self._file_states[name] = file_state
+
+            if previous_file_state is None or previous_file_state[0] != path:
+                continue
+
+            if previous_file_state == file_state:
+                continue
+
+            try:
+                module.__spec__.loader.reload_module(module)
+            except Exception:
+                logger.exception("Failed to reload module %s", name)
+            else:
+                reloaded.append(name)
+
+        return reloaded
+
+    def _run(self, inotify: Optional[_Inotify]) -> None:
+        try:
+            while not self._stopped.is_set():
+                if inotify is None:
+                    self._stopped.wait(self.interval)
+                else:
+                    for module in self.watched_modules().values():
+                        inotify.watch(os.path.dirname(_module_path(module)))
+
+                    select.select([inotify.fd], [], [], self.interval)
+                    inotify.drain()
+
+                if not self._stopped.is_set():
+                    self.check()
+        finally:
+            if inotify is not None:
+                inotify.close()
+
+    def start(self) -> None:
+        inotify = None
+        if self.use_inotify:
+            try:
+                inotify = _Inotify()
+            except (OSError, AttributeError, TypeError):
+                inotify = None
+
+        self.check()
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, args=(inotify,), daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop watching, within interval seconds.
+
+        Does nothing if the watcher is not started.
+        """
+
+        if self._thread is None:
+            return
+
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,222 @@
+import io
+import os
+import posixpath
+import sys
+import threading
+from dataclasses import dataclass, field, replace
+from types import ModuleType
+from typing import Any, Dict, FrozenSet, Iterable, NamedTuple, Optional, Tuple
+from zipfile import BadZipFile, ZipFile
+
+from custom_imports.file_module.dispatch_loader import FileModuleDispatchLoader
+from custom_imports.file_module.importer import FileModuleImporter
+from custom_imports.file_module.loader import FileModuleLoader
+from custom_imports.importer import Finder, Importer, Loader
+from custom_imports.utils import field_required
+
+__all__ = ["ZipLocator", "ZipBundleFinder", "ZipBundleImporter"]
+
+
+class ZipMemberStat(NamedTuple):
+    st_size: int
+
+
+class ZipLocator(NamedTuple):
+    """
+    Locator for a file in a zip archive.
+
+    ZipLocator(archive, member)
+
+    Supports the parts of the Path interface used by FileModuleLoader, so file
+    based module loaders can read modules from zip archives unchanged.
+
+    If the archive has since been closed, by ZipBundleFinder.invalidate_caches,
+    it is opened again for each read.
+    """
+
+    archive: ZipFile
+    member: str
+
+    @property
+    def name(self) -> str:
+        return posixpath.basename(self.member)
+
+    def _open_member(self):
+        if self.archive.fp is None:
+            # Members keep the archive file open until they are closed.
+            with ZipFile(self.archive.filename) as archive:
+                return archive.open(self.member)
+
+        return self.archive.open(self.member)
+
+    def open(self, mode: str = "r"):
+        file = self._open_member()
+        return file if mode == "rb" else io.TextIOWrapper(file)
+
+    def read_bytes(self) -> bytes:
+        with self._open_member() as file:
+            return file.read()
+
+    def stat(self) -> ZipMemberStat:
+        return ZipMemberStat(self.archive.getinfo(self.member).file_size)
+
+    def __str__(self) -> str:
+        return posixpath.join(self.archive.filename, self.member)
+
+
+def split_archive_path(path_entry: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a search path entry within a zip archive, such as bundle.zip/pkg, into
+    the path of the archive, and the prefix of member names within it.
+
+    Returns None for entries that are not within an archive.
+    """
+
+    path = path_entry
+    prefix = ""
+
+    while not os.path.isdir(path):
+        if os.path.isfile(path):
+            return path, prefix
+
+        parent, base = os.path.split(path)
+        if not base:
+            break
+
+        prefix = base + "/" + prefix
+        path = parent
+
+    return None
+
+
+@dataclass(frozen=True)
+class ZipBundleFinder(Finder[ZipLocator]):
+    """
+    Finder for file based modules in zip archives on the module search path.
+
+    ZipBundleFinder(extensions=(ext, ...))
+
+    This Finder interprets a module's name as a filename, with any of the given
+    extensions, in the same way as FileModuleMultiExtensionFinder, but searches
+    only the zip archives on the module search path, such as bundle.zip, or
+    bundle.zip/pkg.
+
+    The central directory of each archive is read once, and lookups are
+    answered from memory, without opening or statting any files.
+    Call importlib.invalidate_caches() to close the archives, and read them
+    again.
+    """
+
+    extensions: Tuple[str, ...] = field(default_factory=field_required)
+    _archives: Dict[str, Optional[Tuple[ZipFile, FrozenSet[str]]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _entries: Dict[str, Optional[Tuple[str, str]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def _archive(self, archive_path: str) -> Optional[Tuple[ZipFile, FrozenSet[str]]]:
+        if archive_path not in self._archives:
+            try:
+                archive = ZipFile(archive_path)
+            except (OSError, BadZipFile):
+                self._archives[archive_path] = None
+            else:
+                self._archives[archive_path] = (archive, frozenset(archive.namelist()))
+
+        return self._archives[archive_path]
+
+    def _bundle(self, path_entry: str) -> Optional[Tuple[ZipFile, FrozenSet[str], str]]:
+        with self._lock:
+            if path_entry not in self._entries:
+                self._entries[path_entry] = split_archive_path(path_entry)
+
+            split_entry = self._entries[path_entry]
+            if split_entry is None:
+                return None
+
+            archive_path, prefix = split_entry
+            archive = self._archive(archive_path)
+            if archive is None:
+                return None
+
+            return archive[0], archive[1], prefix
+
+    def find_module_locator(
+        self, fullname: str, path: Iterable[str], target: Optional[ModuleType] = None
+    ) -> Optional[ZipLocator]:
+        if path is None:
+            rel_dir, _, name = fullname.rpartition(".")
+            path = sys.path
+        else:
+            rel_dir, name = "", fullname.rpartition(".")[2]
+
+        rel_prefix = rel_dir.replace(".", "/") + "/" if rel_dir else ""
+
+        for path_entry in path:
+            bundle = self._bundle(os.fspath(path_entry))
+            if bundle is None:
+                continue
+
+            archive, names, prefix = bundle
+            for extension in self.extensions:
+                member = f"{prefix}{rel_prefix}{name}.{extension}"
+                if member in names:
+                    return ZipLocator(archive, member)
+
+        return None
+
+    def invalidate_caches(self) -> None:
+        with self._lock:
+            for archive in self._archives.values():
+                if archive is not None:
+                    archive[0].close()
+
+            self._archives.clear()
+            self._entries.clear()
+
+
+@dataclass(frozen=True)
+class ZipBundleImporter(Importer[ZipLocator, Any]):
+    """
+    An Importer class for file based modules of several types, in zip archives.
+
+    ZipBundleImporter(
+        loaders={ext: loader, ...},
+    )
+
+    When registered, this Importer finds a file with any of the given
+    extensions in the zip archives on the module search path, and loads it with
+    the loader for that extension.
+
+    FileModuleLoaders read modules from the archive unchanged, except that
+    their cache and executor are not used.
+    Files read in "mmap" mode are read into memory instead.
+
+    Combine existing file based module importers with
+    ZipBundleImporter.from_importers(*importers).
+    """
+
+    finder: Finder[ZipLocator] = field(init=False, repr=False)
+    loader: Loader[ZipLocator, Any] = field(init=False, repr=False)
+    loaders: Dict[str, Loader] = field(default_factory=field_required)
+
+    def __post_init__(self):
+        loaders = {
+            extension: (
+                replace(loader, cache=None, executor=None)
+                if isinstance(loader, FileModuleLoader)
+                else loader
+            )
+            for extension, loader in self.loaders.items()
+        }
+
+        object.__setattr__(self, "finder", ZipBundleFinder(tuple(loaders)))
+        object.__setattr__(self, "loader", FileModuleDispatchLoader(loaders))
+
+    @classmethod
+    def from_importers(cls, *importers: Importer) -> "ZipBundleImporter":
+        return cls(loaders=FileModuleImporter.from_importers(*importers).loaders)
@@ -1,7 +1,4 @@
-from custom_imports.importer.importer import Importer
-from custom_imports.importer.simple_finder import SimpleFinder
-from custom_imports.importer.simple_loader import SimpleLoader
-from custom_imports.importer.types import Finder, Loader, Module, ModuleSpec
+from custom_imports.utils.lazy import lazy_attributes
 
 __all__ = [
     "ModuleSpec",
@@ -9,6 +6,33 @@ __all__ = [
     "Finder",
     "Loader",
     "SimpleFinder",
+    "CachingFinder",
+    "CacheInfo",
     "SimpleLoader",
     "Importer",
+    "ImportEvent",
+    "ImportObserver",
+    "ObservedLoader",
+    "ImportStats",
+    "ImportTracer",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "ModuleSpec": ".types",
+        "Module": ".types",
+        "Finder": ".types",
+        "Loader": ".types",
+        "SimpleFinder": ".simple_finder",
+        "CachingFinder": ".caching_finder",
+        "CacheInfo": ".caching_finder",
+        "SimpleLoader": ".simple_loader",
+        "Importer": ".importer",
+        "ImportEvent": ".instrumentation",
+        "ImportObserver": ".instrumentation",
+        "ObservedLoader": ".instrumentation",
+        "ImportStats": ".import_stats",
+        "ImportTracer": ".import_tracer",
+    },
+)
@@ -0,0 +1,103 @@
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Iterable, NamedTuple, Optional, TypeVar
+
+from custom_imports.importer.types import Finder
+
+__all__ = ["CachingFinder", "CacheInfo"]
+
+LT = TypeVar("LT")  # Locator type.
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    max_size: Optional[int]
+    current_size: int
+
+
+@dataclass(frozen=True)
+class CachingFinder(Finder[LT]):
+    """
+    Finder wrapper that remembers the results of another Finder.
+
+    CachingFinder(
+        finder=finder,
+        max_size=128,
+        ttl=None,
+    )
+
+    Both found locators and failed lookups are remembered, keyed by module name
+    and search path.
+
+    At most max_size results are kept, discarding the least recently used.
+    If max_size is None, the cache is unbounded.
+    If ttl is not None, results are discarded ttl seconds after being found.
+
+    The cache is cleared by importlib.invalidate_caches(), and the hit and miss
+    counts are available from cache_info().
+    """
+
+    finder: Finder[LT]
+    max_size: Optional[int] = 128
+    ttl: Optional[float] = None
+    _results: OrderedDict = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    _counts: Counter = field(
+        default_factory=Counter, init=False, repr=False, compare=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def find_module_locator(
+        self, fullname: str, path: Iterable[str], target: Optional[ModuleType] = None
+    ) -> Optional[LT]:
+        key = (fullname, None if path is None else tuple(path))
+        now = time.monotonic()
+
+        with self._lock:
+            result = self._results.get(key)
+
+            if result is not None:
+                module_locator, expiry = result
+
+                if expiry is None or now < expiry:
+                    self._results.move_to_end(key)
+                    self._counts["hits"] += 1
+                    return module_locator
+
+                del self._results[key]
+
+            self._counts["misses"] += 1
+
+        module_locator = self.finder.find_module_locator(fullname, path, target)
+        expiry = None if self.ttl is None else now + self.ttl
+
+        with self._lock:
+            self._results[key] = (module_locator, expiry)
+
+            if self.max_size is not None:
+                while len(self._results) > self.max_size:
+                    self._results.popitem(last=False)
+
+        return module_locator
+
+    def invalidate_caches(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+        self.finder.invalidate_caches()
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._counts["hits"],
+                self._counts["misses"],
+                self.max_size,
+                len(self._results),
+            )
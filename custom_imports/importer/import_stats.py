@@ -0,0 +1,104 @@
+import json
+import threading
+from typing import Any, Dict
+
+from custom_imports.importer.instrumentation import ImportEvent, ImportObserver
+
+__all__ = ["ImportStats"]
+
+
+def _module_stats() -> Dict[str, Any]:
+    return {
+        "find_time": 0.0,
+        "create_time": 0.0,
+        "exec_time": 0.0,
+        "read_time": 0.0,
+        "bytes_read": 0,
+    }
+
+
+class ImportStats(ImportObserver):
+    """
+    Import observer that keeps counters and timings of imports.
+
+    ImportStats()
+
+    Counts find_spec calls, split into hits, which found a module, and misses,
+    and totals the time spent finding, creating, executing, and reading
+    modules, in seconds, and the bytes read.
+    Found modules also have a breakdown by module name, in stats.modules.
+
+    Execution times are inclusive, so include the time taken by any imports
+    made while executing a module.
+
+    Read the stats as a dict with stats.as_dict(), or as JSON with
+    stats.to_json().
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.find_calls = 0
+            self.hits = 0
+            self.misses = 0
+            self.find_time = 0.0
+            self.max_find_time = 0.0
+            self.create_time = 0.0
+            self.exec_time = 0.0
+            self.read_time = 0.0
+            self.bytes_read = 0
+            self.modules: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, event: ImportEvent) -> None:
+        with self._lock:
+            if event.kind == "find":
+                self.find_calls += 1
+                self.find_time += event.duration
+                self.max_find_time = max(self.max_find_time, event.duration)
+
+                if not event.details["found"]:
+                    self.misses += 1
+                    return
+
+                self.hits += 1
+
+            module = self.modules.setdefault(event.name, _module_stats())
+            module[f"{event.kind}_time"] += event.duration
+
+            if event.kind == "create":
+                self.create_time += event.duration
+            elif event.kind == "exec":
+                self.exec_time += event.duration
+            elif event.kind == "read":
+                self.read_time += event.duration
+                self.bytes_read += event.details["bytes"]
+                module["bytes_read"] += event.details["bytes"]
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "find_calls": self.find_calls,
+                "hits": self.hits,
+                "misses": self.misses,
+                "find_time": self.find_time,
+                "max_find_time": self.max_find_time,
+                "create_time": self.create_time,
+                "exec_time": self.exec_time,
+                "read_time": self.read_time,
+                "bytes_read": self.bytes_read,
+                "modules": {
+                    name: dict(module) for name, module in self.modules.items()
+                },
+            }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ImportStats {self.hits} hits, {self.misses} misses, "
+            f"{len(self.modules)} modules>"
+        )
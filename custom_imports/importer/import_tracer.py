@@ -0,0 +1,89 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from custom_imports.importer.importer import Importer
+from custom_imports.importer.instrumentation import ImportEvent, ImportObserver
+
+__all__ = ["ImportTracer"]
+
+
+class ImportTracer(ImportObserver):
+    """
+    Import observer that records a timeline of imports, in the Chrome trace
+    event format.
+
+    ImportTracer(
+        *importers,
+        path=None,
+    )
+
+    Records a span for each find, create, exec, and file read step of each
+    import, which may be viewed in chrome://tracing, or https://ui.perfetto.dev/.
+    Spans nest, so a module that imports other modules while executing
+    contains their spans.
+
+    Use the tracer as a context manager to observe the given importers within
+    the block, and then save the trace to path, if it is not None.
+    Alternatively, add the tracer to importers with importer.add_observer, and
+    save the trace with tracer.save(path).
+    """
+
+    def __init__(self, *importers: Importer, path: Optional[Union[str, Path]] = None):
+        self.importers = importers
+        self.path = path
+
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def record(self, event: ImportEvent) -> None:
+        trace_event = {
+            "name": f"{event.kind} {event.name}",
+            "cat": event.kind,
+            "ph": "X",
+            "ts": event.start * 1e6,
+            "dur": event.duration * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": {
+                "module": event.name,
+                "importer": type(event.importer).__name__,
+                **event.details,
+            },
+        }
+
+        with self._lock:
+            self._events.append(trace_event)
+
+    def trace(self) -> Dict[str, Any]:
+        """
+        The recorded trace, as a JSON serializable dict.
+        """
+
+        with self._lock:
+            events = list(self._events)
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, path: Union[str, Path]) -> None:
+        with open(path, "w") as file:
+            json.dump(self.trace(), file)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+
+    def __enter__(self):
+        for importer in self.importers:
+            importer.add_observer(self)
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        for importer in self.importers:
+            importer.remove_observer(self)
+
+        if self.path is not None:
+            self.save(self.path)
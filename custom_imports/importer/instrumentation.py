@@ -0,0 +1,135 @@
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, NamedTuple, Tuple, TypeVar
+
+from custom_imports.importer.types import Loader, Module, ModuleSpec
+
+__all__ = [
+    "ImportEvent",
+    "ImportObserver",
+    "ObservedLoader",
+    "record_event",
+    "is_observed",
+]
+
+LT = TypeVar("LT")  # Locator type.
+MT = TypeVar("MT")  # Module type.
+
+_active = threading.local()
+
+
+class ImportEvent(NamedTuple):
+    """
+    A timed step of an import by an Importer.
+
+    kind is one of:
+    - "find", finding the module, with details {"found": bool}.
+    - "create", creating the empty module.
+    - "exec", executing the module.
+    - "read", reading a file based module's file, with details {"bytes": int}.
+
+    start is the time.perf_counter() time at which the step started, and
+    duration is in seconds.
+    Steps nest, so the duration of an "exec" event includes the "read" events
+    within it, and any imports made by the module.
+    """
+
+    kind: str
+    name: str
+    start: float
+    duration: float
+    importer: Any
+    details: Dict[str, Any]
+
+
+class ImportObserver(metaclass=ABCMeta):
+    """
+    Abstract base class for import observers.
+
+    Add an observer to an Importer with importer.add_observer(observer), and
+    `record` is called with an ImportEvent for each step of each import made
+    through that importer.
+    Observers may be called from several threads at once.
+    """
+
+    @abstractmethod
+    def record(self, event: ImportEvent) -> None:
+        raise NotImplementedError
+
+
+def record_event(kind: str, start: float, module: Module, **details: Any) -> None:
+    """
+    Record an event for module, ending now, if an observed import in this
+    thread is executing it.
+
+    Events for modules that no observed import is executing, such as modules
+    imported by an unobserved importer while executing an observed module, are
+    not recorded.
+    """
+
+    for loader, active_module in reversed(getattr(_active, "stack", ())):
+        if active_module is module:
+            loader.record(kind, module.__spec__.name, start, details)
+            return
+
+
+def is_observed() -> bool:
+    """
+    Whether an observed import is executing a module in this thread.
+    """
+
+    return bool(getattr(_active, "stack", None))
+
+
+@dataclass(frozen=True)
+class ObservedLoader(Loader[LT, MT]):
+    """
+    Loader wrapper that reports the steps of loading a module to observers.
+
+    ObservedLoader(
+        loader=loader,
+        importer=importer,
+        observers=(observer, ...),
+    )
+
+    Used in place of the loader of an Importer with observers.
+    """
+
+    loader: Loader[LT, MT]
+    importer: Any
+    observers: Tuple[ImportObserver, ...]
+
+    def record(self, kind: str, name: str, start: float, details: dict) -> None:
+        event = ImportEvent(
+            kind, name, start, time.perf_counter() - start, self.importer, details
+        )
+
+        for observer in self.observers:
+            observer.record(event)
+
+    def create_module(self, spec: ModuleSpec[LT, MT]) -> Module[LT, MT]:
+        start = time.perf_counter()
+        try:
+            return self.loader.create_module(spec)
+        finally:
+            self.record("create", spec.name, start, {})
+
+    def exec_module(self, module: Module[LT, MT]) -> None:
+        name = module.__spec__.name
+
+        stack = getattr(_active, "stack", None)
+        if stack is None:
+            stack = _active.stack = []
+
+        stack.append((self, module))
+        start = time.perf_counter()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.record("exec", name, start, {})
+            stack.pop()
+
+    def reload_module(self, module: Module[LT, MT]) -> None:
+        self.loader.reload_module(module)
@@ -1,4 +1,6 @@
-from dataclasses import dataclass, field
+import threading
+from dataclasses import dataclass, field, fields
+from functools import wraps
 from types import ModuleType
 from typing import Callable, Type, TypeVar
 
@@ -6,6 +8,8 @@ from more_properties import cached_property
 
 from custom_imports.importer.types import Loader, Module, ModuleSpec
 from custom_imports.utils import field_required
+from custom_imports.utils.class_variants import instance_methods, set_class
+from custom_imports.utils.frozen import MUTATING_METHODS, deep_freeze
 
 __all__ = ["SimpleLoader"]
 
@@ -22,10 +26,34 @@ class SimpleLoader(Loader[LT, MT]):
         module_type=cls,
         module_type_kwargs=kwargs,
         load_module=func,
+        lazy=False,
+        frozen=False,
     )
 
     Creates an empty module by calling the equivalent of cls(**kwargs),
     and executes it by calling func(module, module_locator).
+
+    If lazy is True, executing the module is deferred until one of its methods
+    is first called, including special methods such as __getitem__ and
+    __iter__, and attribute notation provided by __getattr__.
+    Until then, the module is an instance of a subclass of cls, and code that
+    reads the contents of a dict, list, or set directly, without calling its
+    methods, sees it empty.
+    This includes json.dumps of a dict, concatenating a list to another list,
+    and set() and frozenset() of a set, or combining it with another set.
+    Call a method first, such as len(module), to load the module.
+
+    If frozen is True, then once executed, the contents of a dict, list, or set
+    module are replaced by deeply immutable copies, with FrozenDicts, tuples,
+    and frozensets in place of dicts, lists, and sets, and the module itself
+    becomes an instance of a subclass of cls, whose methods that would modify
+    it raise TypeError.
+
+    Reload a module in place with loader.reload_module(module).
+
+    Loaders are pickled by their constructor arguments, so they may be sent to
+    worker processes if those arguments are picklable.
+    Fields with metadata {"pickle": False} are left at their defaults.
     """
 
     module_type: Type[MT]
@@ -33,6 +61,30 @@ class SimpleLoader(Loader[LT, MT]):
     load_module: Callable[[Module[LT, MT], LT], None] = field(
         default_factory=field_required
     )
+    lazy: bool = False
+    frozen: bool = False
+    # Locks of the modules being loaded lazily, or reloaded, by id, so that
+    # unrelated modules load concurrently.
+    _module_locks: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _lazy_loading: set = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if self.frozen and not issubclass(self.module_type, tuple(MUTATING_METHODS)):
+            raise TypeError("Only dict, list, and set modules may be frozen")
+
+    def __getstate__(self) -> dict:
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.init and f.metadata.get("pickle", True)
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(**state)
 
     @cached_property
     def _module_type(self) -> Type[Module[LT, MT]]:
@@ -44,8 +96,130 @@ class SimpleLoader(Loader[LT, MT]):
 
         return _Module
 
+    @cached_property
+    def _lazy_module_type(self) -> Type[Module[LT, MT]]:
+        def load_on_call(method):
+            @wraps(method)
+            def lazy_method(module, *args, **kwargs):
+                self._load_lazy_module(module)
+                return method(module, *args, **kwargs)
+
+            return lazy_method
+
+        class _LazyModule(self._module_type):
+            pass
+
+        methods = instance_methods(self._module_type)
+
+        # Copying and pickling read the module's contents by its class.
+        for name in ("__reduce__", "__reduce_ex__"):
+            methods.setdefault(name, getattr(self._module_type, name))
+
+        for name, method in methods.items():
+            setattr(_LazyModule, name, load_on_call(method))
+
+        return _LazyModule
+
+    @cached_property
+    def _frozen_module_type(self) -> Type[Module[LT, MT]]:
+        def frozen_method(module, *args, **kwargs):
+            raise TypeError(f"Module {getattr(module, '__name__', '')!r} is frozen")
+
+        class _FrozenModule(self._module_type):
+            pass
+
+        for base, names in MUTATING_METHODS.items():
+            if issubclass(self._module_type, base):
+                for name in names:
+                    setattr(_FrozenModule, name, frozen_method)
+
+        return _FrozenModule
+
+    def _module_lock(self, module: Module[LT, MT]) -> threading.RLock:
+        return self._module_locks.setdefault(id(module), threading.RLock())
+
+    def _load_lazy_module(self, module: Module[LT, MT]) -> None:
+        if type(module) is not self._lazy_module_type:
+            return
+
+        with self._module_lock(module):
+            if type(module) is not self._lazy_module_type:
+                return
+
+            if id(module) in self._lazy_loading:
+                return
+
+            self._lazy_loading.add(id(module))
+            try:
+                self.load_module(module, module.__spec__.loader_state)
+            finally:
+                self._lazy_loading.discard(id(module))
+
+            set_class(module, self._module_type)
+
+            if self.frozen:
+                self.freeze_module(module)
+
     def create_module(self, spec: ModuleSpec[LT, MT]) -> Module[LT, MT]:
         return self._module_type(**self.module_type_kwargs)
 
+    def freeze_module(self, module: Module[LT, MT]) -> None:
+        """
+        Replace the contents of a module with deeply immutable copies, in place,
+        and make the module immutable.
+        """
+
+        if isinstance(module, dict):
+            for key, value in dict.items(module):
+                dict.__setitem__(module, key, deep_freeze(value))
+        elif isinstance(module, list):
+            list.__setitem__(
+                module, slice(None), [deep_freeze(item) for item in module]
+            )
+        elif isinstance(module, set):
+            items = [deep_freeze(item) for item in module]
+            set.clear(module)
+            set.update(module, items)
+
+        set_class(module, self._frozen_module_type)
+
+    def reset_module(self, module: Module[LT, MT]) -> None:
+        """
+        Return a module to its newly created state, in place.
+        """
+
+        if self.frozen and type(module) is self._frozen_module_type:
+            set_class(module, self._module_type)
+
+        for base in (dict, list, set):
+            if isinstance(module, base):
+                base.clear(module)
+
+        type(module).__init__(module, **self.module_type_kwargs)
+
     def exec_module(self, module: Module[LT, MT]) -> None:
+        if self.lazy:
+            set_class(module, self._lazy_module_type)
+            return
+
         self.load_module(module, module.__spec__.loader_state)
+
+        if self.frozen:
+            self.freeze_module(module)
+
+    def reload_module(self, module: Module[LT, MT]) -> None:
+        """
+        Execute a module again, in place, so that existing references to the
+        module see its new contents.
+        """
+
+        with self._module_lock(module):
+            if self.lazy and type(module) is self._lazy_module_type:
+                # Not yet loaded, so will load the new contents when used.
+                return
+
+            self.reset_module(module)
+            self.load_module(module, module.__spec__.loader_state)
+
+            if self.frozen:
+                self.freeze_module(module)
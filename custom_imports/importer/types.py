@@ -58,6 +58,9 @@ class Finder(Generic[LT], metaclass=ABCMeta):
     otherwise it returns None.
 
     Module finders do not attempt to construct the module.
+
+    Finders that cache lookups should override `invalidate_caches` to clear
+    them. It is called by importlib.invalidate_caches() while registered.
     """
 
     @abstractmethod
@@ -66,6 +69,9 @@ class Finder(Generic[LT], metaclass=ABCMeta):
     ) -> Optional[LT]:
         raise NotImplementedError
 
+    def invalidate_caches(self) -> None:
+        pass
+
 
 class Loader(LoaderBase, Generic[LT, MT], metaclass=ABCMeta):
     """
@@ -1,5 +1,36 @@
-from custom_imports.sample_importers.config_importer import cfg_importer, ini_importer
-from custom_imports.sample_importers.csv_importer import CSVImporter
-from custom_imports.sample_importers.json_importer import json_importer
+from custom_imports.utils.lazy import lazy_attributes
 
-__all__ = ["json_importer", "cfg_importer", "ini_importer", "CSVImporter"]
+__all__ = [
+    "json_importer",
+    "JSONImporter",
+    "JSONBackend",
+    "IndexedJSONImporter",
+    "JSONIndex",
+    "cfg_importer",
+    "ini_importer",
+    "ConfigImporter",
+    "CSVImporter",
+    "ColumnarCSVImporter",
+    "CSVTable",
+    "StreamingCSVImporter",
+    "CSVStream",
+]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "json_importer": ".json_importer",
+        "JSONImporter": ".json_importer",
+        "JSONBackend": ".json_importer",
+        "IndexedJSONImporter": ".indexed_json_importer",
+        "JSONIndex": ".indexed_json_importer",
+        "cfg_importer": ".config_importer",
+        "ini_importer": ".config_importer",
+        "ConfigImporter": ".config_importer",
+        "CSVImporter": ".csv_importer",
+        "ColumnarCSVImporter": ".columnar_csv_importer",
+        "CSVTable": ".columnar_csv_importer",
+        "StreamingCSVImporter": ".streaming_csv_importer",
+        "CSVStream": ".streaming_csv_importer",
+    },
+)
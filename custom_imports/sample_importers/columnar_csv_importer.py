@@ -0,0 +1,301 @@
+import csv
+import re
+from array import array
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from custom_imports.file_module import FileModuleExtensionFinder, FileModuleLoader
+from custom_imports.importer import Finder, Importer, Loader
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+__all__ = ["ColumnarCSVImporter", "CSVTable"]
+
+
+# Decimal numbers, as written by str(float), without leading zeros.
+_FLOAT = re.compile(r"-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?")
+
+# Larger integers may not be held exactly by a double.
+_MAX_EXACT_INT = 2 ** 53
+
+
+def _to_int(value: Any) -> int:
+    if isinstance(value, int):
+        return value
+
+    # Only strings that int round-trips, so "007" and "1_000" stay strings.
+    if isinstance(value, str) and str(int(value)) == value:
+        return int(value)
+
+    raise ValueError(f"Not an integer: {value!r}")
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, float):
+        return value
+
+    if isinstance(value, str):
+        # No leading zeros, underscores, or words, such as "nan" and "inf".
+        match = _FLOAT.fullmatch(value)
+        if match is None:
+            raise ValueError(f"Not a number: {value!r}")
+
+        if match.group(1) or match.group(2):
+            return float(value)
+
+        value = int(value)
+
+    if isinstance(value, int) and abs(value) <= _MAX_EXACT_INT:
+        return float(value)
+
+    # Such as IDs, too large to be held exactly.
+    raise ValueError(f"Not a number: {value!r}")
+
+
+def _same(spelling: Any, value: Any) -> bool:
+    return type(spelling) is type(value) and spelling == value
+
+
+class _ColumnBuilder:
+    """
+    Column of CSV values, built a row at a time, as an array of 64-bit
+    integers, or failing that, of doubles, or failing that, a list.
+
+    The values that the numbers of the column do not spell, such as "1.50", are
+    kept by row, so that the column may still become a list of the values read.
+    """
+
+    def __init__(self):
+        self.values: Union[array, List[Any]] = array("q")
+        self._convert: Optional[Callable[[Any], Union[int, float]]] = _to_int
+        self._strings: Optional[bool] = None
+        self._originals: Dict[int, Any] = {}
+        self._shared_values: Dict[Any, Any] = {}
+
+    def _spell(self, number: Union[int, float]) -> Any:
+        if not self._strings:
+            return number
+
+        return str(number) if self._convert is _to_int else repr(number)
+
+    def _widen(self) -> None:
+        """
+        Store the column as doubles, if it is stored as integers, all of which
+        doubles hold exactly, or otherwise as a list.
+        """
+
+        numbers = self.values
+        originals = [
+            self._originals.get(row, self._spell(number))
+            for row, number in enumerate(numbers)
+        ]
+
+        if self._convert is _to_int and all(
+            abs(number) <= _MAX_EXACT_INT for number in numbers
+        ):
+            self.values = array("d", map(float, numbers))
+            self._convert = _to_float
+            self._originals = {
+                row: original
+                for row, (number, original) in enumerate(zip(self.values, originals))
+                if not _same(self._spell(number), original)
+            }
+        else:
+            self.values = [self._shared_values.setdefault(v, v) for v in originals]
+            self._convert = None
+            self._originals = {}
+
+    def append(self, value: Any) -> None:
+        if self._convert is None:
+            self.values.append(self._shared_values.setdefault(value, value))
+            return
+
+        if self._strings is None:
+            self._strings = isinstance(value, str)
+
+        try:
+            number = self._convert(value)
+            self.values.append(number)
+        except (ValueError, TypeError, OverflowError):
+            self._widen()
+            self.append(value)
+            return
+
+        if self._strings:
+            # _to_int only converts strings that it spells exactly.
+            spelled = type(value) is str and (
+                self._convert is _to_int or repr(number) == value
+            )
+        else:
+            spelled = number is value
+
+        if not spelled:
+            self._originals[len(self.values) - 1] = value
+
+
+def compact_column(values: Iterable[Any]) -> Sequence[Any]:
+    """
+    Store a column of CSV values as an array of 64-bit integers, or failing
+    that, of doubles.
+
+    Only columns whose values are all written as plain numbers are numeric, so
+    text such as zip codes with leading zeros, "1_000", and "nan", is kept.
+    Integer columns with values too large for a double to hold exactly, such as
+    IDs, are not stored as doubles.
+    Columns that are not entirely numeric are kept as a list, with equal strings
+    shared between rows.
+    """
+
+    builder = _ColumnBuilder()
+    for value in values:
+        builder.append(value)
+
+    return builder.values
+
+
+class CSVTable:
+    """
+    Columnar table of CSV data.
+
+    CSVTable(use_numpy=None)
+
+    Each column is stored separately, as compactly as its values allow.
+    Numeric columns are stored as arrays, using NumPy arrays if use_numpy is
+    True, or if use_numpy is None and NumPy is installed.
+
+    table["name"] is the column with header name.
+    table[i] is row i, as a dict from header to value.
+    Iterating over the table iterates over its rows.
+    """
+
+    def __init__(self, use_numpy: Optional[bool] = None):
+        self.use_numpy = numpy is not None if use_numpy is None else use_numpy
+        self.fieldnames: List[str] = []
+        self._columns: List[Sequence[Any]] = []
+        self._column_views: Dict[str, Sequence[Any]] = {}
+
+    def read_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """
+        Read rows of CSV data, the first of which is the header.
+        """
+
+        rows = iter(rows)
+        self.fieldnames = list(next(rows, []))
+
+        # Built a row at a time, so the rows are never all held at once.
+        width = len(self.fieldnames)
+        builders = [_ColumnBuilder() for _ in range(width)]
+        padding = [""] * width
+
+        for row in rows:
+            if len(row) < width:
+                row = [*row, *padding[len(row) :]]
+
+            for builder, value in zip(builders, row):
+                builder.append(value)
+
+        self.set_columns(self.fieldnames, [builder.values for builder in builders])
+
+    def set_columns(self, fieldnames: List[str], columns: List[Sequence[Any]]) -> None:
+        if len(columns) < len(fieldnames):
+            length = len(columns[0]) if columns else 0
+            columns = columns + [
+                [""] * length for _ in range(len(fieldnames) - len(columns))
+            ]
+
+        self.fieldnames = fieldnames
+        self._columns = columns
+        self._column_views = {
+            name: self._column_view(column) for name, column in zip(fieldnames, columns)
+        }
+
+    def _column_view(self, column: Sequence[Any]) -> Sequence[Any]:
+        if self.use_numpy and isinstance(column, (array, memoryview)):
+            return numpy.frombuffer(column, dtype=memoryview(column).format)
+
+        return column
+
+    @property
+    def columns(self) -> Dict[str, Sequence[Any]]:
+        return dict(self._column_views)
+
+    def __len__(self) -> int:
+        return len(self._columns[0]) if self._columns else 0
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for values in zip(*self._columns):
+            yield dict(zip(self.fieldnames, values))
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._column_views[key]
+
+        return dict(zip(self.fieldnames, (column[key] for column in self._columns)))
+
+    def __eq__(self, other):
+        if isinstance(other, CSVTable):
+            return self.fieldnames == other.fieldnames and list(self) == list(other)
+
+        if isinstance(other, list):
+            return list(self) == other
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"<CSVTable {self.fieldnames!r}, {len(self)} rows>"
+
+
+def read_table(csv_reader_kwargs: dict, table: CSVTable, file) -> None:
+    table.read_rows(csv.reader(file, **csv_reader_kwargs))
+
+
+def dump_table(table: CSVTable) -> tuple:
+    return table.fieldnames, table._columns
+
+
+def restore_table(table: CSVTable, state: tuple) -> None:
+    table.set_columns(*state)
+
+
+@dataclass(frozen=True)
+class ColumnarCSVImporter(Importer[Path, CSVTable]):
+    """
+    An Importer class for CSV files, stored by column.
+
+    ColumnarCSVImporter(
+        csv_reader_kwargs=kwargs,
+        use_numpy=None,
+    )
+
+    This file based module importer finds a CSV file by the extension .csv, and
+    loads it as a CSVTable module, using the rows of csv.reader(file, **kwargs),
+    the first of which is the header.
+
+    Numeric columns are stored as arrays, which take a fraction of the memory
+    of a list of rows.
+    """
+
+    finder: Finder[Path] = field(
+        default=FileModuleExtensionFinder(extension="csv"), init=False
+    )
+    loader: Loader[Path, CSVTable] = field(init=False, repr=False)
+    csv_reader_kwargs: dict = field(default_factory=dict)
+    use_numpy: Optional[bool] = None
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "loader",
+            FileModuleLoader[CSVTable](
+                module_type=CSVTable,
+                module_type_kwargs={"use_numpy": self.use_numpy},
+                read_module=partial(read_table, self.csv_reader_kwargs),
+                dump_module=dump_table,
+                restore_module=restore_table,
+            ),
+        )
@@ -1,12 +1,49 @@
 import configparser
-from dataclasses import replace
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Callable, Dict, Optional, get_type_hints
 
 from custom_imports.file_module import FileModuleExtensionFinder, FileModuleLoader
-from custom_imports.importer import Importer
+from custom_imports.importer import Finder, Importer, Loader
 from custom_imports.utils.attr_dict import AttrDict
 
-__all__ = ["ini_importer", "cfg_importer"]
+__all__ = ["ini_importer", "cfg_importer", "ConfigImporter", "compile_schema"]
+
+Converter = Callable[[str], Any]
+ConverterTable = Dict[str, Dict[str, Converter]]
+
+# Values that int or float may accept.
+_NUMBER = re.compile(r"[-+]?(?:\d|\.\d|inf|nan)", re.IGNORECASE)
+
+# configparser's default for fallback arguments, as its own methods use.
+_UNSET = configparser._UNSET
+
+
+class SectionProxy(configparser.SectionProxy, AttrDict):
+    """
+    Wrapper for SectionProxy to allow attribute notation for properties.
+
+    For property names that clash with SectionProxy attributes, the SectionProxy
+    version is used. For example, a property called `name`.
+    """
+
+
+class SectionProxies(dict):
+    """
+    Dict of a parser's section proxies, which wraps each proxy added to it as a
+    SectionProxy.
+
+    configparser creates section proxies in several places, so wrapping them
+    as they are added is simpler than overriding each of those places.
+    """
+
+    def __setitem__(self, section: str, proxy: configparser.SectionProxy) -> None:
+        if not isinstance(proxy, SectionProxy):
+            proxy = SectionProxy(proxy.parser, proxy.name)
+
+        super().__setitem__(section, proxy)
 
 
 class ConfigParser(configparser.ConfigParser, AttrDict):
@@ -15,39 +52,227 @@ class ConfigParser(configparser.ConfigParser, AttrDict):
 
     For section names that clash with ConfigParser attributes, the ConfigParser
     version is used. For example, a section called `items`.
-    """
 
+    Only parsers of this class have SectionProxy sections, so other uses of
+    configparser are unaffected.
 
-class SectionProxy(configparser.SectionProxy, AttrDict):
+    With BasicInterpolation, raw values are converted too, as they are
+    otherwise.
     """
-    Wrapper for SectionProxy to allow attribute notation for properties.
 
-    For property names that clash with SectionProxy attributes, the SectionProxy
-    version is used. For example, a property called `name`.
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        proxies = SectionProxies()
+        for section, proxy in self._proxies.items():
+            proxies[section] = proxy
+
+        self._proxies = proxies
+
+    def _convert_raw(self, section: str, option: str, value: Any) -> Any:
+        if isinstance(self._interpolation, BasicInterpolation):
+            return self._interpolation.convert(section, option, value)
+
+        return value
+
+    def get(self, section, option, *, raw=False, vars=None, fallback=_UNSET):
+        value = super().get(section, option, raw=raw, vars=vars, fallback=fallback)
+
+        if raw and value is not fallback:
+            value = self._convert_raw(section, self.optionxform(option), value)
+
+        return value
+
+    def items(self, section=_UNSET, raw=False, vars=None):
+        items = super().items(section, raw=raw, vars=vars)
+
+        if raw and section is not _UNSET:
+            items = [
+                (option, self._convert_raw(section, option, value))
+                for option, value in items
+            ]
+
+        return items
+
+
+def to_bool(value: str) -> bool:
+    try:
+        return configparser.ConfigParser.BOOLEAN_STATES[value.lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value!r}") from None
+
+
+def to_str(value: str) -> str:
+    return value
+
+
+def guess_type(value: str) -> Any:
     """
+    Convert value to an int, float, or bool, if it is one, in that order.
 
+    Values that cannot be numbers are ruled out without trying to convert them.
+    """
 
-class BasicInterpolation(configparser.Interpolation):
-    def before_read(self, parser, section, option, value):
-        for func in [int, float, parser._convert_to_boolean]:
+    if _NUMBER.match(value):
+        for func in [int, float]:
             try:
                 return func(value)
             except ValueError:
                 pass
 
-        return value
+    return configparser.ConfigParser.BOOLEAN_STATES.get(value.lower(), value)
+
+
+def type_converter(value_type: Any) -> Converter:
+    if value_type is str:
+        return to_str
+
+    if value_type is bool:
+        return to_bool
+
+    # Generic types, such as Optional[int], are callable, but not converters.
+    if not callable(value_type) or getattr(value_type, "__module__", "") == "typing":
+        raise TypeError(f"Unsupported config value type {value_type!r}")
+
+    return value_type
+
+
+def _schema_items(schema: Any) -> Dict[str, Any]:
+    if isinstance(schema, Mapping):
+        return dict(schema)
+
+    return get_type_hints(schema)
+
+
+def compile_schema(schema: Any) -> ConverterTable:
+    """
+    Compile a config schema into a table of converters, by section and option.
+
+    schema maps each section to its options, and each option to its type, as a
+    dict, a dataclass, or a TypedDict, whose fields are sections, themselves
+    dicts, dataclasses, or TypedDicts, whose fields are options.
+
+    bool values are converted as by ConfigParser.getboolean, str values are
+    left as they are, and values of any other type are converted by calling
+    the type, such as int, float, Path, or Decimal, on the value.
+    """
+
+    return {
+        section: {
+            configparser.ConfigParser.optionxform(None, option): type_converter(
+                value_type
+            )
+            for option, value_type in _schema_items(options).items()
+        }
+        for section, options in _schema_items(schema).items()
+    }
+
+
+class BasicInterpolation(configparser.Interpolation):
+    """
+    Interpolation that converts values to Python types.
+
+    BasicInterpolation(converters=None)
+
+    Values in the converters table, by section and option, are converted by
+    their converter once, as they are read, and are not converted further, so
+    str values stay strings.
+    Other values are kept as read, and converted by guess_type on each access,
+    which rules out most strings by a regex match alone, so reads never change
+    the parser.
+    """
+
+    def __init__(self, converters: Optional[ConverterTable] = None):
+        self.converters = converters or {}
+
+    def before_read(self, parser, section, option, value):
+        converter = self.converters.get(section, {}).get(option)
+        if converter is None:
+            return value
+
+        try:
+            return converter(value)
+        except ValueError as error:
+            raise ValueError(
+                f"Invalid value for option {option!r} in section {section!r}: "
+                f"{value!r}"
+            ) from error
+
+    def convert(self, section: str, option: str, value: Any) -> Any:
+        if not isinstance(value, str) or option in self.converters.get(section, {}):
+            return value
+
+        return guess_type(value)
+
+    def before_get(self, parser, section, option, value, defaults):
+        return self.convert(section, option, value)
+
+
+def read_config(parser: ConfigParser, file) -> None:
+    parser.read_file(file)
+
+
+def dump_config(parser: ConfigParser) -> dict:
+    return {
+        "defaults": dict(parser._defaults),
+        "sections": {
+            section: dict(options) for section, options in parser._sections.items()
+        },
+    }
+
+
+def restore_config(parser: ConfigParser, state: dict) -> None:
+    parser._defaults.update(state["defaults"])
+
+    for section, options in state["sections"].items():
+        parser.add_section(section)
+        parser._sections[section].update(options)
+
+
+@dataclass(frozen=True)
+class ConfigImporter(Importer[Path, ConfigParser]):
+    """
+    An Importer class for config files.
+
+    ConfigImporter(
+        extension="ini",
+        schema=None,
+    )
+
+    This file based module importer finds a config file by the given extension,
+    and loads it as a ConfigParser module, with attribute notation.
+
+    Values are converted to Python types.
+    If schema is given, each value in it is converted to its type once, as the
+    file is read, through a converter table compiled once, by compile_schema.
+    Other values are converted to an int, float, or bool, if they are one, on
+    access.
+    """
+
+    finder: Finder[Path] = field(init=False, repr=False)
+    loader: Loader[Path, ConfigParser] = field(init=False, repr=False)
+    extension: str = "ini"
+    schema: Any = None
+
+    def __post_init__(self):
+        converters = None if self.schema is None else compile_schema(self.schema)
 
+        object.__setattr__(
+            self, "finder", FileModuleExtensionFinder(extension=self.extension)
+        )
+        object.__setattr__(
+            self,
+            "loader",
+            FileModuleLoader[ConfigParser](
+                module_type=ConfigParser,
+                module_type_kwargs={"interpolation": BasicInterpolation(converters)},
+                read_module=read_config,
+                dump_module=dump_config,
+                restore_module=restore_config,
+            ),
+        )
 
-configparser.ConfigParser = ConfigParser
-configparser.SectionProxy = SectionProxy
 
-ini_importer = Importer[Path, ConfigParser](
-    finder=FileModuleExtensionFinder(extension="ini"),
-    loader=FileModuleLoader[ConfigParser](
-        module_type=ConfigParser,
-        module_type_kwargs={"interpolation": BasicInterpolation()},
-        read_module=lambda module, file: module.read_file(file),
-    ),
-)
+ini_importer = ConfigImporter(extension="ini")
 
-cfg_importer = replace(ini_importer, finder=FileModuleExtensionFinder(extension="cfg"))
+cfg_importer = ConfigImporter(extension="cfg")
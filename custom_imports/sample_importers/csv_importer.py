@@ -1,6 +1,12 @@
+import csv
+import io
+import os
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
+from functools import partial
+from io import UnsupportedOperation
 from pathlib import Path
-from typing import Callable
+from typing import BinaryIO, Callable, List, Optional, Tuple
 
 from custom_imports.file_module import FileModuleExtensionFinder, FileModuleLoader
 from custom_imports.importer import Finder, Importer, Loader
@@ -9,6 +15,113 @@ from custom_imports.utils import field_required
 __all__ = ["CSVImporter"]
 
 
+def read_csv(csv_reader: Callable, csv_reader_kwargs: dict, module: list, file) -> None:
+    module.extend(csv_reader(file, **csv_reader_kwargs))
+
+
+def _finish_record(file: BinaryIO, data: bytes, quote: bytes) -> bytes:
+    """
+    Read on from file until data, and what follows it, ends with a whole record.
+
+    A newline ends a record if it is preceded by an even number of quotes.
+    """
+
+    parts = [data]
+    quotes = data.count(quote) if quote else 0
+
+    while data and (quotes % 2 or not data.endswith(b"\n")):
+        data = file.readline()
+        quotes += data.count(quote) if quote else 0
+        parts.append(data)
+
+    return b"".join(parts)
+
+
+def csv_chunks(
+    path: str, chunk_size: int, quote: bytes
+) -> Tuple[bytes, List[Tuple[int, int]]]:
+    """
+    Split a CSV file into its header, and the byte ranges of chunks of roughly
+    chunk_size bytes of whole records that follow it.
+    """
+
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        header = _finish_record(file, file.readline(), quote)
+
+        chunks = []
+        start = file.tell()
+        while not chunks or start < size:
+            _finish_record(file, file.read(chunk_size), quote)
+            chunks.append((start, file.tell()))
+            start = file.tell()
+
+    return header, chunks
+
+
+def read_csv_chunk(
+    csv_reader: Callable,
+    csv_reader_kwargs: dict,
+    path: str,
+    encoding: str,
+    header: bytes,
+    chunk: Tuple[int, int],
+    skip_rows: int,
+) -> list:
+    start, end = chunk
+    with open(path, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+
+    text = io.StringIO((header + data).decode(encoding), newline="")
+    return list(csv_reader(text, **csv_reader_kwargs))[skip_rows:]
+
+
+def read_csv_chunks(
+    csv_reader: Callable,
+    csv_reader_kwargs: dict,
+    executor: Executor,
+    chunk_size: int,
+    module: list,
+    file,
+) -> None:
+    try:
+        file.fileno()
+    except UnsupportedOperation:
+        # Not backed by a file that the executor may read by name, such as a
+        # member of a zip file, so read it here, in one piece.
+        read_csv(csv_reader, csv_reader_kwargs, module, file)
+        return
+
+    quoting = csv_reader_kwargs.get("quoting", csv.QUOTE_MINIMAL)
+    quotechar = csv_reader_kwargs.get("quotechar", '"')
+    quote = b"" if quoting == csv.QUOTE_NONE else quotechar.encode(file.encoding)
+
+    header, chunks = csv_chunks(file.name, chunk_size, quote)
+
+    # Each chunk is parsed with the header prepended, so rows produced by the
+    # header alone are dropped from all chunks but the first.
+    header_text = io.StringIO(header.decode(file.encoding), newline="")
+    header_rows = len(list(csv_reader(header_text, **csv_reader_kwargs)))
+
+    futures = [
+        executor.submit(
+            read_csv_chunk,
+            csv_reader,
+            csv_reader_kwargs,
+            file.name,
+            file.encoding,
+            header,
+            chunk,
+            header_rows if index else 0,
+        )
+        for index, chunk in enumerate(chunks)
+    ]
+
+    for future in futures:
+        module.extend(future.result())
+
+
 @dataclass(frozen=True)
 class CSVImporter(Importer[Path, list]):
     """
@@ -17,6 +130,8 @@ class CSVImporter(Importer[Path, list]):
     CSVImporter(
         csv_reader=csv_reader,
         csv_reader_kwargs=kwargs,
+        executor=None,
+        chunk_size=None,
     )
 
     This file based module importer finds a CSV file by the extension .csv, and
@@ -24,21 +139,53 @@ class CSVImporter(Importer[Path, list]):
 
     `csv_reader` should be a CSV reader class (for example, csv.reader, or
     csv.DictReader).
+
+    If executor is a concurrent.futures.Executor, such as a ProcessPoolExecutor,
+    CSV files are parsed by the executor.
+    If chunk_size is also given, each file is split into chunks of roughly
+    chunk_size bytes of whole records, which are parsed in parallel, each with
+    the header prepended, and then joined in order.
+    Chunks are split at newlines outside of quoted fields, so chunking
+    requires an encoding in which newlines and quotes are single bytes, such as
+    UTF-8, and fields that do not use an escapechar to escape quotes.
+    Files that are not on the file system, such as members of zip files, are
+    read without chunking.
     """
 
     finder: Finder[Path] = field(
         default=FileModuleExtensionFinder(extension="csv"), init=False
     )
-    loader: Loader[Path, list] = field(
-        default=property(
-            lambda self: FileModuleLoader[list](
-                module_type=list,
-                read_module=lambda module, file: module.extend(
-                    self.csv_reader(file, **self.csv_reader_kwargs)
-                ),
-            )
-        ),
-        init=False,
-    )
+    loader: Loader[Path, list] = field(init=False, repr=False)
     csv_reader: Callable = field(default_factory=field_required)
     csv_reader_kwargs: dict = field(default_factory=dict)
+    executor: Optional[Executor] = field(default=None, compare=False)
+    chunk_size: Optional[int] = None
+
+    def __post_init__(self):
+        if self.chunk_size is not None and self.executor is None:
+            raise TypeError("A chunked CSVImporter requires an executor")
+
+        if self.chunk_size is not None:
+            read_module = partial(
+                read_csv_chunks,
+                self.csv_reader,
+                self.csv_reader_kwargs,
+                self.executor,
+                self.chunk_size,
+            )
+            executor = None
+        else:
+            read_module = partial(read_csv, self.csv_reader, self.csv_reader_kwargs)
+            executor = self.executor
+
+        object.__setattr__(
+            self,
+            "loader",
+            FileModuleLoader[list](
+                module_type=list,
+                read_module=read_module,
+                dump_module=list,
+                restore_module=list.extend,
+                executor=executor,
+            ),
+        )
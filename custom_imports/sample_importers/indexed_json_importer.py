@@ -0,0 +1,346 @@
+import json
+import mmap
+import re
+import sys
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Pattern, Tuple, Union
+
+from custom_imports.file_module import FileModuleExtensionFinder
+from custom_imports.importer import Finder, Importer, Loader, SimpleLoader
+from custom_imports.sample_importers.json_importer import (
+    JSONBackend,
+    fastest_json_backend,
+)
+
+__all__ = ["IndexedJSONImporter", "JSONIndex", "index_json_object"]
+
+# Possessive quantifiers (Python 3.11+) keep the patterns below from saving
+# backtracking state for every token, which they never need.
+_P = b"+" if sys.version_info >= (3, 11) else b""
+
+_WHITESPACE = rb"[ \t\n\r]*" + _P
+_STRING = rb'"[^"\\]*' + _P + rb'(?:\\.[^"\\]*' + _P + rb")*" + _P + rb'"'
+_PLAIN_STRING = rb'"[^"\\]*' + _P + rb'"'
+_SCALAR = rb'[^ \t\n\r,:{}\[\]"]+' + _P
+_SEPARATOR = _WHITESPACE + rb"([,}])"
+
+# Values nested more deeply are skipped by _skip_nested.
+_MAX_DEPTH = 16
+
+
+def _member_pattern(string: bytes, depth: int) -> Pattern[bytes]:
+    """
+    Pattern of an object member, its key, value, and the separator after it,
+    matched in a single call, so that values are skipped by the regular
+    expression engine.
+
+    Arrays and objects are matched by their brackets, nested up to depth deep,
+    skipping strings, without checking the values between them.
+    """
+
+    other = rb'[^"{}\[\]]*' + _P
+    nested = other + rb"(?:" + string + other + rb")*" + _P
+
+    for _ in range(depth - 1):
+        nested = (
+            other
+            + rb"(?:(?:"
+            + string
+            + rb"|[\[{]"
+            + nested
+            + rb"[\]}])"
+            + other
+            + rb")*"
+            + _P
+        )
+
+    return re.compile(
+        _WHITESPACE
+        + rb"("
+        + string
+        + rb")"
+        + _WHITESPACE
+        + rb":"
+        + _WHITESPACE
+        + rb"("
+        + string
+        + rb"|[\[{]"
+        + nested
+        + rb"[\]}]|"
+        + _SCALAR
+        + rb")"
+        + _SEPARATOR
+    )
+
+
+_MEMBER = _member_pattern(_STRING, _MAX_DEPTH)
+# Faster, for files without escape sequences, the strings of which end at the
+# next quote.
+_PLAIN_MEMBER = _member_pattern(_PLAIN_STRING, _MAX_DEPTH)
+_KEY_ONLY = re.compile(
+    _WHITESPACE + rb"(" + _STRING + rb")" + _WHITESPACE + rb":" + _WHITESPACE
+)
+_SEPARATOR_ONLY = re.compile(_SEPARATOR)
+_OBJECT_START = re.compile(_WHITESPACE + rb"\{")
+_OBJECT_END = re.compile(_WHITESPACE + rb"\}")
+_NESTED_START = re.compile(rb"[\[{]")
+
+# Strings, which may contain brackets, and brackets.
+_TOKEN = re.compile(_STRING + rb"|[{}\[\]]")
+
+_QUOTE = ord('"')
+_OPEN_BRACKETS = frozenset(b"{[")
+
+
+def _skip_nested(buffer: Union[bytes, mmap.mmap], start: int) -> int:
+    """
+    Find the end of the array or object at start, by scanning each of its
+    strings and brackets.
+    """
+
+    depth = 0
+
+    for token in _TOKEN.finditer(buffer, start):
+        char = buffer[token.start()]
+
+        if char in _OPEN_BRACKETS:
+            depth += 1
+        elif char != _QUOTE:
+            depth -= 1
+
+            if depth == 0:
+                return token.end()
+
+    raise ValueError("Unterminated JSON object")
+
+
+def _object_start(buffer: Union[bytes, mmap.mmap]) -> Optional[int]:
+    """
+    Position of the first member of the JSON object in buffer, or None if the
+    object is empty.
+    """
+
+    object_start = _OBJECT_START.match(buffer)
+    if not object_start:
+        raise ValueError("JSON index requires a top level object")
+
+    if _OBJECT_END.match(buffer, object_start.end()):
+        return None
+
+    return object_start.end()
+
+
+def _scan_member(
+    buffer: Union[bytes, mmap.mmap], position: int, escaped: bool
+) -> Tuple[str, int, int, Optional[int]]:
+    """
+    Scan the member of a JSON object at position, without parsing its value.
+
+    Returns its key, the byte range of its value, and the position of the next
+    member, or None if it is the last.
+    escaped is whether buffer may contain escape sequences.
+    """
+
+    member = (_MEMBER if escaped else _PLAIN_MEMBER).match(buffer, position)
+
+    if member is not None:
+        key = member.group(1)
+        value_start, value_end = member.span(2)
+        separator = member.group(3)
+        position = member.end()
+    else:
+        key_match = _KEY_ONLY.match(buffer, position)
+        if key_match is None or not _NESTED_START.match(buffer, key_match.end()):
+            raise ValueError(f"Invalid JSON object member at byte {position}")
+
+        key = key_match.group(1)
+        value_start = key_match.end()
+        value_end = _skip_nested(buffer, value_start)
+
+        separator_match = _SEPARATOR_ONLY.match(buffer, value_end)
+        if separator_match is None:
+            raise ValueError(f"Expecting ',' or '}}' at byte {value_end}")
+
+        separator = separator_match.group(1)
+        position = separator_match.end()
+
+    return (
+        json.loads(key) if escaped else key[1:-1].decode(),
+        value_start,
+        value_end,
+        None if separator == b"}" else position,
+    )
+
+
+def index_json_object(
+    buffer: Union[bytes, mmap.mmap],
+) -> Dict[str, Tuple[int, int]]:
+    """
+    Find the byte range of the value of each key of a JSON object, without
+    parsing the values.
+
+    Values are skipped by matching their brackets and strings with a regular
+    expression, so the values of the object may be parsed separately, from
+    buffer[start:end].
+
+    Raises ValueError if buffer is not a JSON object.
+    """
+
+    index = {}
+    position = _object_start(buffer)
+    escaped = buffer.find(b"\\") >= 0
+
+    while position is not None:
+        key, start, end, position = _scan_member(buffer, position, escaped)
+        index[key] = (start, end)
+
+    return index
+
+
+class JSONIndex(Mapping):
+    """
+    Read-only mapping of the top level keys of a JSON object, parsing values
+    on first access.
+
+    JSONIndex(loads=json.loads)
+
+    index.load_index(path) maps the JSON file at path into memory.
+    The file is indexed by the byte range of the value of each top level key,
+    as far as needed, on first access of a key, so import time is independent
+    of the size of the file, and access time depends on the position of the
+    key in the file.
+    Iteration, len, and looking up missing keys, index the whole file.
+    Each value is parsed by loads on first access, by index notation, or
+    attribute notation, and kept.
+    """
+
+    def __init__(self, loads: Callable[[bytes], Any] = json.loads):
+        self.loads = loads
+        self.path: Optional[Path] = None
+        self._buffer: Union[bytes, mmap.mmap] = b""
+        self._escaped = False
+        self._position: Optional[int] = None
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._values: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def load_index(self, path: Path) -> None:
+        with path.open("rb") as file:
+            try:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped.
+                buffer = b""
+
+        self.path = path
+        self._buffer = buffer
+        self._escaped = buffer.find(b"\\") >= 0
+        self._position = _object_start(buffer)
+        self._index = {}
+        self._values = {}
+
+    def _scan(self, key: Optional[str] = None) -> None:
+        """
+        Index the members of the object not yet indexed, up to key, if given.
+
+        Must be called with the lock held.
+        """
+
+        while self._position is not None:
+            member_key, start, end, self._position = _scan_member(
+                self._buffer, self._position, self._escaped
+            )
+            self._index[member_key] = (start, end)
+
+            if member_key == key:
+                return
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            try:
+                return self._values[key]
+            except KeyError:
+                pass
+
+            if key not in self._index:
+                self._scan(key)
+
+            start, end = self._index[key]
+            value = self.loads(self._buffer[start:end])
+            self._values[key] = value
+            return value
+
+    def __getattr__(self, item: str) -> Any:
+        # The import system probes modules for dunder attributes, such as
+        # __path__, which would otherwise index the whole file.
+        if (
+            not (item.startswith("__") and item.endswith("__"))
+            and "_index" in self.__dict__
+            and item in self
+        ):
+            return self[item]
+
+        raise AttributeError(item)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            self._scan()
+
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._scan()
+
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            if key not in self._index:
+                self._scan(key)
+
+            return key in self._index
+
+    def __repr__(self) -> str:
+        return f"<JSONIndex {str(self.path)!r}, {len(self)} keys>"
+
+
+@dataclass(frozen=True)
+class IndexedJSONImporter(Importer[Path, JSONIndex]):
+    """
+    An Importer class for large JSON files, of which only parts are used.
+
+    IndexedJSONImporter(
+        backend=backend,
+    )
+
+    This file based module importer finds a JSON file by the extension .json,
+    and loads it as a JSONIndex module.
+    On import, the file is mapped into memory, and it is indexed by its top
+    level keys as they are accessed, without parsing their values, which are
+    instead parsed by backend.loads on first access.
+    So memory use and import time depend on the values used, rather than on
+    the size of the file.
+
+    The file must contain a JSON object.
+    """
+
+    finder: Finder[Path] = field(
+        default=FileModuleExtensionFinder(extension="json"), init=False
+    )
+    loader: Loader[Path, JSONIndex] = field(init=False, repr=False)
+    backend: JSONBackend = field(default_factory=fastest_json_backend)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "loader",
+            SimpleLoader[Path, JSONIndex](
+                module_type=JSONIndex,
+                module_type_kwargs={"loads": self.backend.loads},
+                load_module=JSONIndex.load_index,
+            ),
+        )
@@ -1,15 +1,107 @@
 import json
+from dataclasses import dataclass, field
+from functools import partial
+from importlib import import_module
 from pathlib import Path
+from typing import Any, Callable, NamedTuple
 
 from custom_imports.file_module import FileModuleExtensionFinder, FileModuleLoader
-from custom_imports.importer import Importer
+from custom_imports.importer import Finder, Importer, Loader
+from custom_imports.utils.attr_dict import AttrDict
+from custom_imports.utils.namespace import Namespace, to_namespace
 
-__all__ = ["json_importer"]
+__all__ = ["json_importer", "JSONImporter", "JSONBackend", "fastest_json_backend"]
 
-json_importer = Importer[Path, dict](
-    finder=FileModuleExtensionFinder(extension="json"),
-    loader=FileModuleLoader[dict](
-        module_type=dict,
-        read_module=lambda module, file: module.update(json.load(file)),
-    ),
-)
+
+class JSONBackend(NamedTuple):
+    """
+    A JSON parser.
+
+    JSONBackend(name, loads)
+
+    loads should take the contents of a JSON file as bytes, and return the
+    parsed value.
+    """
+
+    name: str
+    loads: Callable[[bytes], Any]
+
+
+def fastest_json_backend() -> JSONBackend:
+    """
+    Find the fastest installed JSON parser, of orjson, ujson, and simdjson,
+    falling back to the standard library's json module.
+    """
+
+    for name in ["orjson", "ujson", "simdjson"]:
+        try:
+            module = import_module(name)
+        except ImportError:
+            continue
+
+        return JSONBackend(name, module.loads)
+
+    return JSONBackend("json", json.loads)
+
+
+def read_json(loads: Callable[[bytes], Any], module: dict, data: bytes) -> None:
+    module.update(loads(data))
+
+
+def read_json_namespaces(
+    loads: Callable[[bytes], Any], module: dict, data: bytes
+) -> None:
+    if loads is json.loads:
+        # Build namespaces directly while parsing.
+        module.update(json.loads(data, object_pairs_hook=Namespace.from_pairs))
+    else:
+        module.update(to_namespace(loads(data)))
+
+
+@dataclass(frozen=True)
+class JSONImporter(Importer[Path, dict]):
+    """
+    An Importer class for JSON files.
+
+    JSONImporter(
+        backend=backend,
+        namespaces=False,
+    )
+
+    This file based module importer finds a JSON file by the extension .json,
+    and loads it as a dict module, using backend.loads on the contents of the
+    file.
+
+    By default, the fastest installed JSON parser is used.
+
+    If namespaces is True, the module supports attribute notation, and JSON
+    objects within it are loaded as Namespaces, so module.a.b.c works as well
+    as module["a"]["b"]["c"].
+    Namespaces are built while parsing by the standard library's json module,
+    and converted from dicts after parsing by other backends.
+    """
+
+    finder: Finder[Path] = field(
+        default=FileModuleExtensionFinder(extension="json"), init=False
+    )
+    loader: Loader[Path, dict] = field(init=False, repr=False)
+    backend: JSONBackend = field(default_factory=fastest_json_backend)
+    namespaces: bool = False
+
+    def __post_init__(self):
+        read_module = read_json_namespaces if self.namespaces else read_json
+
+        object.__setattr__(
+            self,
+            "loader",
+            FileModuleLoader[dict](
+                module_type=AttrDict if self.namespaces else dict,
+                read_module=partial(read_module, self.backend.loads),
+                read_mode="bytes",
+                dump_module=dict,
+                restore_module=dict.update,
+            ),
+        )
+
+
+json_importer = JSONImporter()
@@ -0,0 +1,92 @@
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional
+
+from custom_imports.file_module import FileModuleExtensionFinder
+from custom_imports.importer import Finder, Importer, Loader, SimpleLoader
+from custom_imports.utils import field_required
+
+__all__ = ["StreamingCSVImporter", "CSVStream"]
+
+
+class CSVStream:
+    """
+    Re-iterable view of the rows of a CSV file.
+
+    CSVStream(
+        csv_reader=csv_reader,
+        csv_reader_kwargs=kwargs,
+    )
+
+    Each iteration opens the file at path afresh, and yields the rows of
+    csv_reader(file, **kwargs) as they are read, so only the rows currently in
+    use are held in memory.
+    """
+
+    def __init__(self, csv_reader: Callable, csv_reader_kwargs: Optional[dict] = None):
+        self.csv_reader = csv_reader
+        self.csv_reader_kwargs = csv_reader_kwargs or {}
+        self.path: Optional[Path] = None
+
+    def set_path(self, path: Path) -> None:
+        self.path = path
+
+    def __iter__(self) -> Iterator[Any]:
+        with self.path.open(newline="") as file:
+            yield from self.csv_reader(file, **self.csv_reader_kwargs)
+
+    def batches(self, size: int) -> Iterator[List[Any]]:
+        """
+        Iterate over the rows in lists of up to size rows.
+        """
+
+        rows = iter(self)
+
+        while True:
+            batch = list(islice(rows, size))
+            if not batch:
+                return
+
+            yield batch
+
+    def __repr__(self) -> str:
+        return f"<CSVStream {str(self.path)!r}>"
+
+
+@dataclass(frozen=True)
+class StreamingCSVImporter(Importer[Path, CSVStream]):
+    """
+    An Importer class for CSV files, too large to hold in memory.
+
+    StreamingCSVImporter(
+        csv_reader=csv_reader,
+        csv_reader_kwargs=kwargs,
+    )
+
+    This file based module importer finds a CSV file by the extension .csv, and
+    loads it as a CSVStream module.
+    The file is not read on import. Instead, each iteration over the module
+    reads the rows of csv_reader(file, **kwargs) on demand.
+    """
+
+    finder: Finder[Path] = field(
+        default=FileModuleExtensionFinder(extension="csv"), init=False
+    )
+    loader: Loader[Path, CSVStream] = field(init=False, repr=False)
+    csv_reader: Callable = field(default_factory=field_required)
+    csv_reader_kwargs: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "loader",
+            SimpleLoader[Path, CSVStream](
+                module_type=CSVStream,
+                module_type_kwargs={
+                    "csv_reader": self.csv_reader,
+                    "csv_reader_kwargs": self.csv_reader_kwargs,
+                },
+                load_module=CSVStream.set_path,
+            ),
+        )
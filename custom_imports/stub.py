@@ -0,0 +1,127 @@
+"""
+Lightweight stand-ins for file based module importers, for environment-wide
+registration.
+
+Importing this module imports nothing beyond os, sys, importlib, and
+DirectoryCache, so that registering importers from a .pth file costs Python
+processes that never import a file based module next to nothing.
+"""
+
+import os
+import sys
+from _thread import RLock, get_ident
+from importlib import import_module
+
+from custom_imports.file_module.dir_cache import DirectoryCache
+
+__all__ = ["ImporterStub", "register_stub"]
+
+
+class ImporterStub:
+    """
+    Stand-in for a file based module importer, which imports the importer only
+    once a file that it would import is found.
+
+    ImporterStub(importer, extensions)
+
+    importer is the name of the importer, as "module:attribute", for example
+    "custom_imports:ini_importer", and extensions are the file extensions that
+    it finds modules by, for example ("ini",).
+
+    When registered, this finds files for modules in the same way as
+    FileModuleExtensionFinder, listing each directory on the module search
+    path once.
+    On finding a file with any of the given extensions, it imports the importer,
+    registers it in its own place on sys.meta_path, and defers to it.
+    The importer is imported once, by whichever thread finds a file first;
+    other threads wait for it.
+    """
+
+    __slots__ = (
+        "importer",
+        "extensions",
+        "_dir_cache",
+        "_lock",
+        "_loading",
+        "_loaded",
+    )
+
+    def __init__(self, importer: str, extensions: tuple):
+        self.importer = importer
+        self.extensions = tuple(extensions)
+        self._dir_cache = DirectoryCache()
+        self._lock = RLock()
+        # The thread importing the importer, if any.
+        self._loading = None
+        self._loaded = None
+
+    def __repr__(self) -> str:
+        return f"ImporterStub({self.importer!r}, {self.extensions!r})"
+
+    def _finds(self, fullname: str, path) -> bool:
+        if path is None:
+            rel_dir, _, name = fullname.rpartition(".")
+            path = sys.path
+        else:
+            rel_dir, name = "", fullname.rpartition(".")[2]
+
+        rel_dir = rel_dir.replace(".", os.sep)
+        file_names = [name + "." + extension for extension in self.extensions]
+
+        for entry in path:
+            directory = os.fspath(entry)
+            if rel_dir:
+                directory = os.path.join(directory, rel_dir)
+
+            listing = self._dir_cache.listing(directory)
+            if any(file_name in listing for file_name in file_names):
+                return True
+
+        return False
+
+    def load_importer(self):
+        """
+        Import the importer, and register it in place of this stub.
+        """
+
+        with self._lock:
+            if self._loaded is not None:
+                return self._loaded
+
+            module_name, _, attribute = self.importer.partition(":")
+
+            self._loading = get_ident()
+            try:
+                importer = getattr(import_module(module_name), attribute)
+            finally:
+                self._loading = None
+
+            if self in sys.meta_path:
+                if importer in sys.meta_path:
+                    sys.meta_path.remove(self)
+                else:
+                    sys.meta_path[sys.meta_path.index(self)] = importer
+
+            self._loaded = importer
+            return importer
+
+    def find_spec(self, fullname: str, path=None, target=None):
+        # Modules imported while importing the importer are not its concern.
+        if self._loading == get_ident() or not self._finds(fullname, path):
+            return None
+
+        return self.load_importer().find_spec(fullname, path, target)
+
+    def invalidate_caches(self) -> None:
+        self._dir_cache.invalidate()
+
+
+def register_stub(importer: str, *extensions: str) -> ImporterStub:
+    """
+    Register an ImporterStub for importer, by its name as "module:attribute",
+    which finds modules by any of the given file extensions.
+    """
+
+    stub = ImporterStub(importer, extensions)
+    sys.meta_path.append(stub)
+    return stub
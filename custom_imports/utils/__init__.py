@@ -1,11 +1,27 @@
-from typing import Any
+from custom_imports.utils.lazy import lazy_attributes
 
-__all__ = ["field_required"]
+# Not imported at run time, as for custom_imports.utils.lazy.
+MYPY = False
+if MYPY:  # pragma: no cover
+    from typing import Any
 
+__all__ = ["field_required", "FrozenDict", "deep_freeze", "Namespace", "to_namespace"]
 
-def field_required() -> Any:
+
+def field_required() -> "Any":
     """
     Use as a dataclass field default_factory argument to indicate
     a required, keyword-only field.
     """
     raise TypeError("Missing required keyword-only argument")
+
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "FrozenDict": ".frozen",
+        "deep_freeze": ".frozen",
+        "Namespace": ".namespace",
+        "to_namespace": ".namespace",
+    },
+)
@@ -12,7 +12,11 @@ class AttrDict(dict):
     """
 
     def __getattr__(self, item: str) -> Any:
-        if item in self:
+        # Only called once ordinary attribute lookup has failed, so the item
+        # is the only remaining candidate.
+        try:
             return self[item]
-
-        return getattr(super(), item)
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {item!r}"
+            ) from None
@@ -0,0 +1,46 @@
+from types import FunctionType
+from typing import Any, Callable, Dict
+
+__all__ = ["set_class", "instance_methods"]
+
+_method_types = (FunctionType, type(object.__init__), type(object.__dir__))
+
+_object_protocol = {
+    "__new__",
+    "__init__",
+    "__init_subclass__",
+    "__subclasshook__",
+    "__class_getitem__",
+    "__getattribute__",
+    "__setattr__",
+    "__delattr__",
+    "__class__",
+}
+
+
+def set_class(instance: Any, cls: type) -> None:
+    """
+    Set the class of instance to cls.
+
+    Bypasses any __class__ attribute defined on the class of instance, such as
+    the one defined by Module.
+    """
+
+    object.__dict__["__class__"].__set__(instance, cls)
+
+
+def instance_methods(cls: type) -> Dict[str, Callable]:
+    """
+    Find the instance methods of cls, excluding those of object, and those
+    used to construct instances and access their attributes.
+    """
+
+    names = {
+        name
+        for base in cls.__mro__
+        if base is not object
+        for name, value in vars(base).items()
+        if isinstance(value, _method_types)
+    }
+
+    return {name: getattr(cls, name) for name in names - _object_protocol}
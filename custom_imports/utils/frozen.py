@@ -0,0 +1,90 @@
+from typing import Any, Dict, Tuple
+
+__all__ = ["FrozenDict", "deep_freeze", "MUTATING_METHODS"]
+
+MUTATING_METHODS: Dict[type, Tuple[str, ...]] = {
+    dict: (
+        "__setitem__",
+        "__delitem__",
+        "__ior__",
+        "clear",
+        "pop",
+        "popitem",
+        "setdefault",
+        "update",
+    ),
+    list: (
+        "__setitem__",
+        "__delitem__",
+        "__iadd__",
+        "__imul__",
+        "append",
+        "clear",
+        "extend",
+        "insert",
+        "pop",
+        "remove",
+        "reverse",
+        "sort",
+    ),
+    set: (
+        "__iand__",
+        "__ior__",
+        "__isub__",
+        "__ixor__",
+        "add",
+        "clear",
+        "difference_update",
+        "discard",
+        "intersection_update",
+        "pop",
+        "remove",
+        "symmetric_difference_update",
+        "update",
+    ),
+}
+
+
+def _immutable(instance, *args, **kwargs):
+    raise TypeError(f"{type(instance).__name__} is immutable")
+
+
+class FrozenDict(dict):
+    """
+    Immutable, hashable dict.
+
+    Still a dict, so may be used wherever a dict is read, at the speed of a
+    dict, but methods that would modify it raise TypeError.
+    """
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+    def __repr__(self) -> str:
+        return f"FrozenDict({dict.__repr__(self)})"
+
+
+def deep_freeze(value: Any) -> Any:
+    """
+    Copy value with its dicts, lists, and sets, at any depth, replaced by
+    FrozenDicts, tuples, and frozensets.
+    """
+
+    if isinstance(value, dict):
+        return FrozenDict(
+            (key, deep_freeze(item_value)) for key, item_value in value.items()
+        )
+
+    if isinstance(value, list) or type(value) is tuple:
+        return tuple(deep_freeze(item) for item in value)
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset(deep_freeze(item) for item in value)
+
+    return value
@@ -0,0 +1,65 @@
+import sys
+from importlib import import_module
+from types import ModuleType
+
+# Annotations are only evaluated by type checkers, so that importing
+# custom_imports, or registering an ImporterStub, does not import typing,
+# which takes longer than the rest of custom_imports.stub put together.
+MYPY = False
+if MYPY:  # pragma: no cover
+    from typing import Any, Callable, Dict, List, Tuple
+
+__all__ = ["lazy_attributes"]
+
+
+def lazy_attributes(
+    package: str, attributes: "Dict[str, str]"
+) -> "Tuple[Callable[[str], Any], Callable[[], List[str]]]":
+    """
+    Module __getattr__ and __dir__ functions (PEP 562) for package, which
+    import each of its attributes from its module on first access.
+
+    attributes maps the name of each attribute to the name of the module that
+    defines it, relative to package.
+
+    On Python 3.6, which does not support module __getattr__, the attributes
+    are all imported immediately.
+    """
+
+    module = sys.modules[package]
+    namespace = module.__dict__
+
+    class LazyPackage(ModuleType):
+        def __setattr__(self, name: str, value: "Any") -> None:
+            # Importing a submodule binds it in its package, where it would hide
+            # an attribute of the same name that it defines, such as
+            # json_importer in the json_importer module.
+            if (
+                isinstance(value, ModuleType)
+                and value.__name__ == f"{package}.{name}"
+                and name in attributes
+            ):
+                value = getattr(value, name)
+
+            super().__setattr__(name, value)
+
+    module.__class__ = LazyPackage
+
+    def __getattr__(name: str) -> "Any":
+        try:
+            module_name = attributes[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> "List[str]":
+        return sorted(set(namespace) | set(attributes))
+
+    if sys.version_info < (3, 7):  # pragma: no cover
+        for name in attributes:
+            __getattr__(name)
+
+    return __getattr__, __dir__
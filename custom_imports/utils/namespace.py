@@ -0,0 +1,209 @@
+from collections.abc import Mapping
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple
+
+__all__ = ["Namespace", "to_namespace"]
+
+# Namespaces of more shapes than this store their items in a dict.
+_MAX_SHAPES = 1024
+
+
+class Namespace(Mapping):
+    """
+    Read-only mapping of parsed data, with attribute notation.
+
+    Namespace(mapping=(), **kwargs)
+
+    Namespaces with the same keys, in the same order, such as the records of a
+    JSON array, share a class generated for those keys, which stores each
+    value in a slot named by its key, so namespace.key is a plain attribute
+    lookup, and namespaces take less memory than dicts.
+
+    Attributes of Namespace, such as keys and get, take precedence over keys of
+    the same name, which are only accessible by index notation, as are keys
+    that are not identifiers.
+
+    Namespaces compare equal to dicts with the same items.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, mapping: Any = (), **kwargs: Any) -> "Namespace":
+        return Namespace.from_pairs(dict(mapping, **kwargs).items())
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[Tuple[str, Any]]) -> "Namespace":
+        """
+        Build a namespace from (key, value) pairs.
+
+        Suitable as the object_pairs_hook of json.loads, to build namespaces
+        directly while parsing.
+        """
+
+        data = dict(pairs)
+        keys = tuple(data)
+
+        shape = _shapes.get(keys)
+        if shape is None:
+            shape = _new_shape(keys)
+
+        return shape._from_dict(data)
+
+    def __getattr__(self, item: str) -> Any:
+        try:
+            return self[item]
+        except KeyError:
+            raise AttributeError(
+                f"'Namespace' object has no attribute {item!r}"
+            ) from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("'Namespace' object is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("'Namespace' object is read-only")
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+
+        return NotImplemented
+
+    def __reduce__(self):
+        # Rebuilt from its items, so unpickled namespaces share shapes again.
+        return Namespace.from_pairs, (list(self.items()),)
+
+    def __repr__(self) -> str:
+        return f"Namespace({dict(self.items())!r})"
+
+
+class _DictNamespace(Namespace):
+    """
+    Namespace that stores its items in a dict, once there are too many shapes.
+    """
+
+    __slots__ = ("_data",)
+
+    @classmethod
+    def _from_dict(cls, data: Dict[str, Any]) -> Namespace:
+        namespace = object.__new__(cls)
+        _set_data(namespace, data)
+        return namespace
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+
+_set_data = _DictNamespace._data.__set__
+
+
+class _ShapedNamespace(Namespace):
+    """
+    Base of the namespace classes generated for each shape.
+
+    Keys that may be slot names are stored in slots, others in a dict in the
+    _rest slot.
+    """
+
+    __slots__ = ()
+
+    _keys: Tuple[str, ...] = ()
+    _getters: Dict[str, Callable[[Namespace], Any]] = {}
+    _setters: Tuple[Tuple[str, Callable[[Namespace, Any], None]], ...] = ()
+    _rest_keys: Tuple[str, ...] = ()
+    _set_rest: Callable[[Namespace, Dict[str, Any]], None] = None
+
+    @classmethod
+    def _from_dict(cls, data: Dict[str, Any]) -> Namespace:
+        namespace = object.__new__(cls)
+
+        for key, setter in cls._setters:
+            setter(namespace, data[key])
+
+        if cls._rest_keys:
+            cls._set_rest(namespace, {key: data[key] for key in cls._rest_keys})
+
+        return namespace
+
+    def __getitem__(self, key: str) -> Any:
+        return self._getters[key](self)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._getters
+
+
+def _is_slot_name(key: str) -> bool:
+    # Names starting with __ would be mangled.
+    return (
+        key.isidentifier()
+        and not key.startswith("__")
+        and key != "_rest"
+        and not hasattr(_ShapedNamespace, key)
+    )
+
+
+def _rest_getter(key: str) -> Callable[[Namespace], Any]:
+    return lambda namespace: namespace._rest[key]
+
+
+_shapes: Dict[Tuple[str, ...], type] = {}
+
+
+def _new_shape(keys: Tuple[str, ...]) -> type:
+    if len(_shapes) >= _MAX_SHAPES:
+        return _DictNamespace
+
+    slot_keys = tuple(key for key in keys if _is_slot_name(key))
+    rest_keys = tuple(key for key in keys if not _is_slot_name(key))
+
+    shape = type(
+        "Namespace",
+        (_ShapedNamespace,),
+        {
+            "__slots__": slot_keys + (("_rest",) if rest_keys else ()),
+            "__module__": __name__,
+            "_keys": keys,
+            "_rest_keys": rest_keys,
+        },
+    )
+
+    getters = {key: attrgetter(key) for key in slot_keys}
+    getters.update((key, _rest_getter(key)) for key in rest_keys)
+
+    shape._getters = {key: getters[key] for key in keys}
+    shape._setters = tuple((key, shape.__dict__[key].__set__) for key in slot_keys)
+    if rest_keys:
+        shape._set_rest = shape.__dict__["_rest"].__set__
+
+    return _shapes.setdefault(keys, shape)
+
+
+def to_namespace(value: Any) -> Any:
+    """
+    Copy parsed data, with its dicts, at any depth, replaced by Namespaces.
+    """
+
+    if isinstance(value, dict):
+        return Namespace.from_pairs(
+            (key, to_namespace(item_value)) for key, item_value in value.items()
+        )
+
+    if isinstance(value, list):
+        return [to_namespace(item) for item in value]
+
+    return value
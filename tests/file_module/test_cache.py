@@ -0,0 +1,127 @@
+import os
+from dataclasses import replace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from custom_imports.file_module import FileModuleCache, FileModuleLoader
+from custom_imports.file_module.cache import NOT_CACHED
+from custom_imports.importer import ModuleSpec
+from custom_imports.sample_importers import ini_importer
+
+
+class Snapshot(list):
+    pass
+
+
+class TestFileModuleCache(TestCase):
+    def test_file_module_cache(self):
+        reads = []
+        changes = []
+
+        def read_module(module, file):
+            reads.append(file.name)
+            module.extend(file.read().split())
+
+            for change in changes:
+                change()
+
+        with TemporaryDirectory() as directory:
+            source = Path(directory, "words.txt")
+            source.write_text("foo bar")
+
+            loader = FileModuleLoader(
+                module_type=list,
+                read_module=read_module,
+                dump_module=list,
+                restore_module=list.extend,
+                cache=FileModuleCache(),
+            )
+
+            def load():
+                spec = ModuleSpec("words", loader, loader_state=source)
+                module = loader.create_module(spec)
+                module.__spec__ = spec
+                loader.exec_module(module)
+                return module
+
+            with self.subTest("Read uncached file"):
+                self.assertEqual(["foo", "bar"], load())
+                self.assertEqual(1, len(reads))
+                self.assertTrue(loader.cache.cache_path(source).is_file())
+
+            with self.subTest("Restore cached file"):
+                self.assertEqual(["foo", "bar"], load())
+                self.assertEqual(1, len(reads))
+
+            with self.subTest("Read changed file"):
+                source.write_text("foo bar baz")
+                stat = source.stat()
+                os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+                self.assertEqual(["foo", "bar", "baz"], load())
+                self.assertEqual(2, len(reads))
+
+            with self.subTest("File changed while read"):
+                source.write_text("foo")
+
+                def change():
+                    changes.clear()
+                    source.write_text("quux")
+
+                changes.append(change)
+                self.assertEqual(["foo"], load())
+                self.assertEqual(["quux"], load())
+                self.assertEqual(4, len(reads))
+
+    def test_file_module_cache_unpicklable(self):
+        with TemporaryDirectory() as directory:
+            source = Path(directory, "words.txt")
+            source.write_text("foo")
+
+            cache = FileModuleCache()
+            cache.store(source, Snapshot(["foo"]))
+
+            # As if the class had since been renamed.
+            with patch.dict(globals()):
+                del globals()["Snapshot"]
+
+                self.assertIs(NOT_CACHED, cache.load(source))
+
+    def test_file_module_cache_dir(self):
+        with TemporaryDirectory() as directory:
+            cache = FileModuleCache(cache_dir=Path(directory))
+            source = Path(directory, "source", "config.ini")
+
+            self.assertEqual(Path(directory), cache.cache_path(source).parent)
+
+    def test_cached_loader_requires_snapshot_functions(self):
+        with self.assertRaises(TypeError):
+            FileModuleLoader(
+                module_type=list, read_module=list.extend, cache=FileModuleCache()
+            )
+
+    def test_cached_sample_importer(self):
+        project_root = Path(__file__).parents[2]
+
+        with TemporaryDirectory() as directory:
+            loader = replace(
+                ini_importer.loader, cache=FileModuleCache(cache_dir=Path(directory))
+            )
+            spec = ModuleSpec(
+                "db_config",
+                loader,
+                loader_state=project_root / "tests/sample_files/db_config.ini",
+            )
+
+            modules = []
+            for _ in range(2):
+                module = loader.create_module(spec)
+                module.__spec__ = spec
+                loader.exec_module(module)
+                modules.append(module)
+
+            self.assertEqual(1, len(os.listdir(directory)))
+            self.assertEqual(modules[0]._sections, modules[1]._sections)
+            self.assertEqual(143, modules[1].database.port)
@@ -0,0 +1,123 @@
+import logging
+import sys
+import tempfile
+from dataclasses import replace
+from importlib import import_module
+from pathlib import Path
+from unittest import TestCase
+
+from custom_imports import (
+    FileModuleCache,
+    FileModuleImporter,
+    Importer,
+    ManifestFinder,
+    compile_file_modules,
+    ini_importer,
+    json_importer,
+)
+from custom_imports.__main__ import main
+from custom_imports.file_module.cache import NOT_CACHED
+
+COMPILE_LOGGER = "custom_imports.file_module.compile"
+
+
+class TestCompile(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+        (self.root / "pkg").mkdir()
+        (self.root / "settings.json").write_text('{"debug": true}')
+        (self.root / "settings.ini").write_text("[shadowed]\n")
+        (self.root / "pkg/database.ini").write_text("[database]\nport = 143\n")
+        (self.root / "broken.json").write_text("{")
+        (self.root / "not-a-module.json").write_text("{}")
+
+        self.importer = FileModuleImporter.from_importers(json_importer, ini_importer)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_compile_file_modules(self):
+        cache = FileModuleCache()
+
+        with self.assertLogs(COMPILE_LOGGER, logging.ERROR) as logs:
+            result = compile_file_modules(self.importer, [str(self.root)], cache)
+
+        with self.subTest("Modules found"):
+            self.assertEqual(
+                {
+                    "settings": self.root.resolve() / "settings.json",
+                    "pkg.database": self.root.resolve() / "pkg/database.ini",
+                    "broken": self.root.resolve() / "broken.json",
+                },
+                result.modules,
+            )
+            self.assertEqual(["broken"], result.failed)
+
+        with self.subTest("Failure logged"):
+            self.assertEqual(1, len(logs.records))
+            self.assertEqual(
+                f"Failed to compile {self.root.resolve() / 'broken.json'}",
+                logs.records[0].getMessage(),
+            )
+            self.assertIsNotNone(logs.records[0].exc_info)
+
+        with self.subTest("Snapshots stored"):
+            self.assertEqual({"debug": True}, cache.load(self.root / "settings.json"))
+            self.assertIsNot(NOT_CACHED, cache.load(self.root / "pkg/database.ini"))
+
+        with self.subTest("Not recursive"):
+            with self.assertLogs(COMPILE_LOGGER, logging.ERROR):
+                result = compile_file_modules(
+                    self.importer, [str(self.root)], cache, maxlevels=0
+                )
+
+            self.assertNotIn("pkg.database", result.modules)
+
+    def test_compile_command(self):
+        manifest = self.root / "manifest.json"
+        cache_dir = self.root / "cache"
+        cache_dir.mkdir()
+
+        root_handlers = logging.root.handlers[:]
+        self.addCleanup(setattr, logging.root, "handlers", root_handlers)
+
+        with self.assertLogs(COMPILE_LOGGER, logging.ERROR) as logs:
+            status = main(
+                [
+                    "compile",
+                    "-q",
+                    "--importer",
+                    "custom_imports:json_importer",
+                    "--cache-dir",
+                    str(cache_dir),
+                    "--manifest",
+                    str(manifest),
+                    str(self.root),
+                ]
+            )
+
+        with self.subTest("Failure reported"):
+            self.assertEqual(1, status)
+            self.assertEqual(
+                [f"Failed to compile {self.root.resolve() / 'broken.json'}"],
+                [record.getMessage() for record in logs.records],
+            )
+
+        with self.subTest("Import through manifest"):
+            finder = ManifestFinder(manifest, ("json",))
+            self.assertEqual({"settings", "broken"}, set(finder.modules))
+
+            importer = Importer(
+                finder=finder,
+                loader=replace(json_importer.loader, cache=FileModuleCache(cache_dir)),
+            )
+
+            try:
+                with importer:
+                    settings = import_module("settings")
+            finally:
+                sys.modules.pop("settings", None)
+
+            self.assertEqual({"debug": True}, settings)
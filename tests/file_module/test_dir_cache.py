@@ -0,0 +1,43 @@
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from custom_imports.file_module import DirectoryCache
+
+
+class TestDirectoryCache(TestCase):
+    def test_directory_cache(self):
+        cache = DirectoryCache()
+
+        with TemporaryDirectory() as directory:
+            Path(directory, "foo.json").touch()
+
+            with self.subTest("List directory"):
+                self.assertEqual(frozenset({"foo.json"}), cache.listing(directory))
+
+            with self.subTest("Reuse listing while mtime unchanged"):
+                stat = os.stat(directory)
+                Path(directory, "bar.json").touch()
+                os.utime(directory, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+                self.assertEqual(frozenset({"foo.json"}), cache.listing(directory))
+
+            with self.subTest("Relist after invalidation"):
+                cache.invalidate()
+
+                self.assertEqual(
+                    frozenset({"foo.json", "bar.json"}), cache.listing(directory)
+                )
+
+            with self.subTest("Relist after mtime change"):
+                Path(directory, "baz.json").touch()
+                os.utime(directory, ns=(0, stat.st_mtime_ns + 10 ** 9))
+
+                self.assertEqual(
+                    frozenset({"foo.json", "bar.json", "baz.json"}),
+                    cache.listing(directory),
+                )
+
+        with self.subTest("Missing directory is empty"):
+            self.assertEqual(frozenset(), cache.listing(directory))
@@ -1,7 +1,11 @@
+import importlib
+import os
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
-from custom_imports.file_module import FileModuleExtensionFinder
+from custom_imports.file_module import FileModuleExtensionFinder, FileModuleLoader
+from custom_imports.importer import Importer
 
 project_root = Path(__file__).parents[2]
 
@@ -27,7 +31,48 @@ class TestFileModuleExtensionFinder(TestCase):
     def test_file_extension_module_finder_find_module_locator(self):
         finder = FileModuleExtensionFinder("txt")
 
-        self.assertEqual(
-            project_root / "tests/sample_files/lipsum.txt",
-            finder.find_module_locator("tests.sample_files.lipsum", []),
+        with self.subTest("Find top level module on sys.path"):
+            self.assertEqual(
+                project_root / "tests/sample_files/lipsum.txt",
+                finder.find_module_locator("tests.sample_files.lipsum", None),
+            )
+
+        with self.subTest("Find submodule in package path"):
+            self.assertEqual(
+                project_root / "tests/sample_files/lipsum.txt",
+                finder.find_module_locator(
+                    "tests.sample_files.lipsum", [project_root / "tests/sample_files"]
+                ),
+            )
+
+        with self.subTest("Fail to find submodule outside package path"):
+            self.assertEqual(
+                None,
+                finder.find_module_locator(
+                    "tests.sample_files.lipsum", [project_root / "tests"]
+                ),
+            )
+
+    def test_file_extension_module_finder_invalidate_caches(self):
+        finder = FileModuleExtensionFinder("json")
+        importer = Importer(
+            finder=finder, loader=FileModuleLoader(module_type=dict, read_module=None)
         )
+
+        with TemporaryDirectory() as directory:
+            self.assertEqual(None, finder.find_path("foo", [directory]))
+
+            stat = os.stat(directory)
+            Path(directory, "foo.json").touch()
+            os.utime(directory, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            with self.subTest("Listing is cached"):
+                self.assertEqual(None, finder.find_path("foo", [directory]))
+
+            with self.subTest("Cache cleared by importlib.invalidate_caches"):
+                with importer:
+                    importlib.invalidate_caches()
+
+                self.assertEqual(
+                    Path(directory, "foo.json"), finder.find_path("foo", [directory])
+                )
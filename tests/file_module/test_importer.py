@@ -0,0 +1,118 @@
+import csv
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from custom_imports.file_module import FileModuleImporter
+from custom_imports.importer import SimpleLoader
+from custom_imports.sample_importers import CSVImporter, ini_importer, json_importer
+
+
+class TestFileModuleImporter(TestCase):
+    def setUp(self):
+        self.importer = FileModuleImporter.from_importers(
+            json_importer, ini_importer, CSVImporter(csv_reader=csv.reader)
+        )
+
+    def tearDown(self):
+        for name in ["john_smith", "db_config", "cars"]:
+            sys.modules.pop(f"tests.sample_files.{name}", None)
+
+    def test_file_module_importer(self):
+        with self.importer:
+            from tests.sample_files import cars, db_config, john_smith
+
+        with self.subTest("Dispatch to JSON loader"):
+            self.assertIsInstance(john_smith, dict)
+            self.assertEqual("John", john_smith["firstName"])
+
+        with self.subTest("Dispatch to INI loader"):
+            self.assertEqual(143, db_config.database.port)
+
+        with self.subTest("Dispatch to CSV loader"):
+            self.assertIsInstance(cars, list)
+            self.assertEqual(["1997", "Ford"], cars[1][:2])
+
+    def test_file_module_importer_compound_extensions(self):
+        geo_loader = SimpleLoader(
+            module_type=dict, load_module=lambda module, path: module.update(geo=True)
+        )
+
+        with TemporaryDirectory() as directory:
+            Path(directory, "shapes.geo.json").write_text("{}")
+            Path(directory, "points.json").write_text('{"geo": false}')
+
+            for loaders in [
+                {"json": json_importer.loader, "geo.json": geo_loader},
+                {"geo.json": geo_loader, "json": json_importer.loader},
+            ]:
+                importer = FileModuleImporter(loaders=loaders)
+                sys.path.insert(0, directory)
+
+                try:
+                    with importer:
+                        import points
+                        import shapes
+                finally:
+                    sys.path.remove(directory)
+                    sys.modules.pop("points", None)
+                    sys.modules.pop("shapes", None)
+
+                with self.subTest(extensions=list(loaders)):
+                    self.assertEqual({"geo": True}, shapes)
+                    self.assertEqual({"geo": False}, points)
+
+    def test_file_module_importer_path_hook(self):
+        self.importer.register_path_hook()
+        try:
+            from tests.sample_files import db_config, john_smith
+        finally:
+            self.importer.deregister_path_hook()
+
+        self.assertEqual("John", john_smith["firstName"])
+        self.assertEqual(143, db_config.database.port)
+
+    def test_file_module_importer_path_hook_cache(self):
+        with TemporaryDirectory() as directory:
+            Path(directory, "hooked_module.py").write_text("value = 1\n")
+            Path(directory, "hooked_data.json").write_text('{"value": 2}')
+
+            sys.path.insert(0, directory)
+            self.addCleanup(sys.path.remove, directory)
+            for name in ["hooked_module", "hooked_data"]:
+                self.addCleanup(sys.modules.pop, name, None)
+
+            import hooked_module
+
+            cached_finder = sys.path_importer_cache[directory]
+            sys.path_importer_cache["missing_path_entry"] = None
+            self.addCleanup(sys.path_importer_cache.pop, "missing_path_entry", None)
+            sys.modules.pop("hooked_module")
+
+            self.importer.register_path_hook()
+            try:
+                import hooked_data
+                import hooked_module
+
+                hooked_finder = sys.path_importer_cache[directory]
+                cleared = "missing_path_entry" not in sys.path_importer_cache
+            finally:
+                self.importer.deregister_path_hook()
+
+            with self.subTest("Regular modules still importable"):
+                self.assertEqual(1, hooked_module.value)
+                self.assertEqual({"value": 2}, hooked_data)
+
+            with self.subTest("Cached finders kept as fallbacks"):
+                self.assertIs(cached_finder, hooked_finder.fallback)
+
+            with self.subTest("Unsupported entries looked up again"):
+                self.assertTrue(cleared)
+
+            with self.subTest("Cached finders restored"):
+                self.assertIs(cached_finder, sys.path_importer_cache[directory])
+
+    def test_from_importers_requires_file_extension_importers(self):
+        with self.assertRaises(TypeError):
+            FileModuleImporter.from_importers(self.importer)
@@ -1,4 +1,6 @@
+import pickle
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from unittest import TestCase
@@ -11,6 +13,10 @@ PY_36 = sys.version_info[:2] == (3, 6)
 project_root = Path(__file__).parents[2]
 
 
+def read_lines(module, file):
+    module.extend(file.readlines())
+
+
 class TestFileModuleLoader(TestCase):
     def test_file_module_loader(self):
         @dataclass
@@ -54,3 +60,67 @@ class TestFileModuleLoader(TestCase):
                 self.assertTrue(issubclass(type(module), Module))
             else:
                 self.assertIsInstance(module, Module)
+
+    def test_file_module_loader_read_modes(self):
+        module_spec = ModuleSpec(
+            "fake_module",
+            None,
+            loader_state=project_root / "tests/sample_files/lipsum.txt",
+        )
+
+        for read_mode, read in [
+            ("text", lambda file: file.read()),
+            ("binary", lambda file: file.read()),
+            ("bytes", lambda data: data),
+            ("mmap", lambda buffer: buffer[:]),
+        ]:
+            with self.subTest(read_mode=read_mode):
+                loader = FileModuleLoader(
+                    module_type=list,
+                    read_module=lambda module, file: module.append(read(file)),
+                    read_mode=read_mode,
+                )
+
+                module = loader.create_module(module_spec)
+                module.__spec__ = module_spec
+                loader.exec_module(module)
+
+                expected = "Lorem ipsum\n" if read_mode == "text" else b"Lorem ipsum\n"
+                self.assertEqual([expected], module)
+
+        with self.subTest("Unknown read mode"), self.assertRaises(ValueError):
+            FileModuleLoader(module_type=list, read_module=list.append, read_mode="foo")
+
+    def test_file_module_loader_executor(self):
+        module_spec = ModuleSpec(
+            "fake_module",
+            None,
+            loader_state=project_root / "tests/sample_files/lipsum.txt",
+        )
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            loader = FileModuleLoader(
+                module_type=list,
+                read_module=read_lines,
+                dump_module=list,
+                restore_module=list.extend,
+                executor=executor,
+            )
+
+            with self.subTest("Pickle loader"):
+                unpickled = pickle.loads(pickle.dumps(loader))
+
+                self.assertIs(read_lines, unpickled.read_module)
+                self.assertIsNone(unpickled.executor)
+
+            with self.subTest("Load module in worker"):
+                module = loader.create_module(module_spec)
+                module.__spec__ = module_spec
+                loader.exec_module(module)
+
+                self.assertEqual(["Lorem ipsum\n"], module)
+
+        with self.subTest("Missing snapshot functions"), self.assertRaises(TypeError):
+            FileModuleLoader(
+                module_type=list, read_module=read_lines, executor=executor
+            )
@@ -0,0 +1,28 @@
+from pathlib import Path
+from unittest import TestCase
+
+from custom_imports.file_module import FileModuleMultiExtensionFinder
+
+project_root = Path(__file__).parents[2]
+
+
+class TestFileModuleMultiExtensionFinder(TestCase):
+    def test_multi_extension_finder_find_path(self):
+        finder = FileModuleMultiExtensionFinder(("json", "txt"))
+
+        with self.subTest("Find file path by first extension"):
+            self.assertEqual(
+                project_root / "tests/sample_files/john_smith.json",
+                finder.find_path("tests.sample_files.john_smith", [project_root]),
+            )
+
+        with self.subTest("Find file path by later extension"):
+            self.assertEqual(
+                project_root / "tests/sample_files/lipsum.txt",
+                finder.find_path("tests.sample_files.lipsum", [project_root]),
+            )
+
+        with self.subTest("Fail to find file with other extension"):
+            self.assertEqual(
+                None, finder.find_path("tests.sample_files.cars", [project_root])
+            )
@@ -0,0 +1,30 @@
+from importlib.machinery import FileFinder, SourceFileLoader
+from pathlib import Path
+from unittest import TestCase
+
+from custom_imports.file_module import FileModulePathEntryFinder
+from custom_imports.sample_importers import json_importer
+
+project_root = Path(__file__).parents[2]
+
+
+class TestFileModulePathEntryFinder(TestCase):
+    def test_file_module_path_entry_finder(self):
+        sample_files = str(project_root / "tests/sample_files")
+        finder = FileModulePathEntryFinder(
+            sample_files,
+            ["json"],
+            json_importer.loader,
+            fallback=FileFinder(sample_files, (SourceFileLoader, [".py"])),
+        )
+
+        with self.subTest("Find file based module"):
+            spec = finder.find_spec("tests.sample_files.john_smith")
+
+            self.assertIs(json_importer.loader, spec.loader)
+            self.assertEqual(
+                project_root / "tests/sample_files/john_smith.json", spec.loader_state
+            )
+
+        with self.subTest("Fail to find file with other extension"):
+            self.assertEqual(None, finder.find_spec("tests.sample_files.cars"))
@@ -0,0 +1,95 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipIf
+
+from custom_imports import ColumnarCSVImporter, SharedMemoryCache
+from custom_imports.file_module.cache import NOT_CACHED
+from custom_imports.importer import ModuleSpec
+
+
+def load_table(path, cache):
+    loader = replace(ColumnarCSVImporter(use_numpy=False).loader, cache=cache)
+    spec = ModuleSpec("table", loader, loader_state=path)
+    module = loader.create_module(spec)
+    module.__spec__ = spec
+    loader.exec_module(module)
+    return module
+
+
+def attached_column_sum(path):
+    column = load_table(path, SharedMemoryCache())["count"]
+    return type(column).__name__, sum(column)
+
+
+@skipIf(sys.version_info < (3, 8), "SharedMemoryCache requires Python 3.8+")
+class TestSharedMemoryCache(TestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+
+        self.path = Path(temp_dir.name, "table.csv")
+        self.path.write_text(
+            "name,count,ratio\n" + "".join(f"n{i},{i},{i / 2}\n" for i in range(100))
+        )
+
+        self.cache = SharedMemoryCache()
+        self.addCleanup(self.cache.unlink, self.path)
+
+    def test_shared_memory_cache(self):
+        with self.subTest("Nothing published"):
+            self.assertIs(NOT_CACHED, SharedMemoryCache().load(self.path))
+
+        table = load_table(self.path, self.cache)
+
+        with self.subTest("Publish"):
+            self.assertEqual(list(range(100)), list(table["count"]))
+
+        attached = load_table(self.path, SharedMemoryCache())
+
+        with self.subTest("Attach"):
+            self.assertEqual(table, attached)
+            self.assertEqual(list(table["ratio"]), list(attached["ratio"]))
+            self.assertEqual(["n0", "n1"], attached["name"][:2])
+
+        with self.subTest("Numeric columns shared"):
+            self.assertIsInstance(attached["count"], memoryview)
+            self.assertTrue(attached["count"].readonly)
+
+        with self.subTest("Unlink"):
+            self.cache.unlink(self.path)
+            self.assertIs(NOT_CACHED, SharedMemoryCache().load(self.path))
+
+    def test_shared_memory_cache_across_processes(self):
+        load_table(self.path, self.cache)
+
+        with ProcessPoolExecutor(1) as executor:
+            result = executor.submit(attached_column_sum, self.path).result()
+
+        self.assertEqual(("memoryview", sum(range(100))), result)
+
+    def test_shared_memory_cache_changed_file(self):
+        name = self.cache.segment_name(self.path)
+        table = load_table(self.path, self.cache)
+
+        self.path.write_text("name,count,ratio\nn0,7,0.5\n")
+        source_stat = self.path.stat()
+        os.utime(self.path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns + 1))
+
+        with self.subTest("Stale snapshot not loaded"):
+            self.assertIs(NOT_CACHED, SharedMemoryCache().load(self.path))
+
+        changed = load_table(self.path, self.cache)
+
+        with self.subTest("Snapshot replaced in the same segment"):
+            self.assertEqual(name, self.cache.segment_name(self.path))
+            attached = load_table(self.path, SharedMemoryCache())
+            self.assertIsInstance(attached["count"], memoryview)
+            self.assertEqual([7], list(attached["count"]))
+
+        with self.subTest("Restored modules unaffected"):
+            self.assertEqual(list(range(100)), list(table["count"]))
+            self.assertEqual([7], list(changed["count"]))
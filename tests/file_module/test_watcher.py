@@ -0,0 +1,113 @@
+import os
+import sys
+import time
+from importlib import import_module
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from zipfile import ZipFile
+
+from custom_imports.file_module import FileModuleWatcher, ZipBundleImporter
+from custom_imports.sample_importers import ini_importer, json_importer
+
+
+def rewrite(path: Path, contents: str) -> None:
+    stat = path.stat()
+    new_path = path.with_name(path.name + ".new")
+    new_path.write_text(contents)
+    os.utime(new_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    os.replace(new_path, path)
+
+
+class TestFileModuleWatcher(TestCase):
+    def setUp(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+        (self.directory / "watched_config.json").write_text('{"debug": false}')
+        (self.directory / "watched_settings.ini").write_text("[server]\nport = 80\n")
+
+        sys.path.insert(0, str(self.directory))
+        self.addCleanup(sys.path.remove, str(self.directory))
+
+        for importer in [json_importer, ini_importer]:
+            importer.register()
+            self.addCleanup(importer.deregister)
+
+        for name in ["watched_config", "watched_settings"]:
+            self.addCleanup(sys.modules.pop, name, None)
+
+    def test_file_module_watcher_check(self):
+        config = import_module("watched_config")
+        settings = import_module("watched_settings")
+        server = settings.server
+
+        watcher = FileModuleWatcher(json_importer, ini_importer)
+
+        with self.subTest("Nothing reloaded before changes"):
+            self.assertEqual([], watcher.check())
+            self.assertEqual([], watcher.check())
+
+        with self.subTest("Reload changed module in place"):
+            rewrite(self.directory / "watched_config.json", '{"debug": true}')
+
+            self.assertEqual(["watched_config"], watcher.check())
+            self.assertEqual({"debug": True}, config)
+
+        with self.subTest("Reload config module in place"):
+            rewrite(self.directory / "watched_settings.ini", "[server]\nport = 8080\n")
+
+            self.assertEqual(["watched_settings"], watcher.check())
+            self.assertEqual(8080, settings.server.port)
+            self.assertEqual(8080, server.port)
+
+    def test_file_module_watcher_thread(self):
+        for use_inotify in [False, True]:
+            with self.subTest(use_inotify=use_inotify):
+                config = import_module("watched_config")
+                watcher = FileModuleWatcher(
+                    json_importer, interval=0.01, use_inotify=use_inotify
+                )
+
+                with watcher:
+                    rewrite(self.directory / "watched_config.json", '{"run": 1}')
+
+                    for _ in range(500):
+                        if config == {"run": 1}:
+                            break
+                        time.sleep(0.01)
+
+                self.assertEqual({"run": 1}, config)
+
+                del sys.modules["watched_config"]
+
+    def test_file_module_watcher_stop(self):
+        watcher = FileModuleWatcher(json_importer, interval=0.01)
+
+        with self.subTest("Stop before start"):
+            watcher.stop()
+
+        with self.subTest("Stop twice"):
+            watcher.start()
+            watcher.stop()
+            watcher.stop()
+
+    def test_file_module_watcher_zip_bundle(self):
+        archive = str(self.directory / "bundle.zip")
+        with ZipFile(archive, "w") as zip_file:
+            zip_file.writestr("watched_bundled.json", "{}")
+
+        sys.path.insert(0, archive)
+        self.addCleanup(sys.path.remove, archive)
+
+        importer = ZipBundleImporter.from_importers(json_importer)
+        importer.register()
+        self.addCleanup(importer.deregister)
+        self.addCleanup(sys.modules.pop, "watched_bundled", None)
+
+        import_module("watched_bundled")
+        watcher = FileModuleWatcher(importer)
+
+        self.assertEqual({}, watcher.watched_modules())
+        self.assertEqual([], watcher.check())
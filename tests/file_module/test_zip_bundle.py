@@ -0,0 +1,108 @@
+import csv
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from configparser import ConfigParser
+from importlib import import_module, invalidate_caches
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+from zipfile import ZipFile
+
+from custom_imports import (
+    CSVImporter,
+    ZipBundleImporter,
+    ZipLocator,
+    ini_importer,
+    json_importer,
+)
+
+
+class TestZipBundleImporter(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.archive = str(Path(self.temp_dir.name, "bundle.zip"))
+
+        with ZipFile(self.archive, "w") as archive:
+            archive.writestr("bundled_settings.json", '{"debug": true}')
+            archive.writestr("bundled_pkg/", "")
+            archive.writestr("bundled_pkg/database.ini", "[database]\nport = 143\n")
+            archive.writestr("bundled_table.csv", "a,b\n1,2\n3,4\n")
+
+        sys.path.insert(0, self.archive)
+        self.importer = ZipBundleImporter.from_importers(json_importer, ini_importer)
+        self.importer.register()
+
+    def tearDown(self):
+        self.importer.deregister()
+        self.importer.invalidate_caches()
+        sys.path.remove(self.archive)
+
+        for name in [
+            "bundled_settings",
+            "bundled_pkg",
+            "bundled_pkg.database",
+            "bundled_table",
+        ]:
+            sys.modules.pop(name, None)
+
+        self.temp_dir.cleanup()
+
+    def test_zip_bundle_importer(self):
+        with self.subTest("Import from archive"):
+            settings = import_module("bundled_settings")
+
+            self.assertEqual({"debug": True}, settings)
+            self.assertIsInstance(settings.__spec__.loader_state, ZipLocator)
+
+        with self.subTest("Import from package in archive"):
+            database = import_module("bundled_pkg.database")
+
+            self.assertIsInstance(database, ConfigParser)
+            self.assertEqual(143, database["database"]["port"])
+
+        with self.subTest("Lookups do not touch the file system"):
+            with patch("os.stat", side_effect=AssertionError), patch(
+                "os.path.isfile", side_effect=AssertionError
+            ):
+                self.assertIsNone(
+                    self.importer.finder.find_module_locator("missing", [self.archive])
+                )
+
+        with self.subTest("Reload archive after invalidation"):
+            with ZipFile(self.archive, "a") as archive:
+                archive.writestr("bundled_extra.json", "{}")
+
+            invalidate_caches()
+            self.assertIsNotNone(
+                self.importer.finder.find_module_locator("bundled_extra", None)
+            )
+
+    def test_zip_bundle_invalidate_caches(self):
+        settings = import_module("bundled_settings")
+        archive = settings.__spec__.loader_state.archive
+
+        invalidate_caches()
+
+        with self.subTest("Archives closed"):
+            self.assertIsNone(archive.fp)
+
+        with self.subTest("Closed archives read again"):
+            settings.__spec__.loader.reload_module(settings)
+
+            self.assertEqual({"debug": True}, settings)
+
+    def test_zip_bundle_chunked_csv(self):
+        executor = ThreadPoolExecutor(1)
+        self.addCleanup(executor.shutdown)
+
+        importer = ZipBundleImporter.from_importers(
+            CSVImporter(csv_reader=csv.reader, executor=executor, chunk_size=4)
+        )
+        importer.register()
+        self.addCleanup(importer.deregister)
+        self.addCleanup(importer.invalidate_caches)
+
+        self.assertEqual(
+            [["a", "b"], ["1", "2"], ["3", "4"]], import_module("bundled_table")
+        )
@@ -0,0 +1,93 @@
+import importlib
+from dataclasses import dataclass
+from unittest import TestCase
+from unittest.mock import patch
+
+from custom_imports.importer import (
+    CacheInfo,
+    CachingFinder,
+    Importer,
+    SimpleFinder,
+    SimpleLoader,
+)
+
+
+@dataclass
+class SimpleLocator:
+    fullname: str
+
+
+class TestCachingFinder(TestCase):
+    def setUp(self):
+        self.lookups = []
+
+        def locate_module(fullname, path, target):
+            self.lookups.append(fullname)
+
+            if fullname.startswith("fake"):
+                return SimpleLocator(fullname)
+
+        self.finder = SimpleFinder(locate_module=locate_module)
+
+    def test_caching_finder(self):
+        finder = CachingFinder(self.finder)
+
+        with self.subTest("Cache found locators"):
+            for _ in range(2):
+                self.assertEqual(
+                    SimpleLocator("fake_module"),
+                    finder.find_module_locator("fake_module", None),
+                )
+
+            self.assertEqual(["fake_module"], self.lookups)
+
+        with self.subTest("Cache failed lookups"):
+            for _ in range(2):
+                self.assertEqual(None, finder.find_module_locator("ujson", None))
+
+            self.assertEqual(["fake_module", "ujson"], self.lookups)
+
+        with self.subTest("Key on search path"):
+            finder.find_module_locator("fake_module", ["foo"])
+
+            self.assertEqual(["fake_module", "ujson", "fake_module"], self.lookups)
+
+        with self.subTest("Count hits and misses"):
+            self.assertEqual(CacheInfo(2, 3, 128, 3), finder.cache_info())
+
+    def test_caching_finder_max_size(self):
+        finder = CachingFinder(self.finder, max_size=2)
+
+        for fullname in ["fake_a", "fake_b", "fake_a", "fake_c", "fake_a", "fake_b"]:
+            finder.find_module_locator(fullname, None)
+
+        self.assertEqual(["fake_a", "fake_b", "fake_c", "fake_b"], self.lookups)
+        self.assertEqual(2, finder.cache_info().current_size)
+
+    def test_caching_finder_ttl(self):
+        finder = CachingFinder(self.finder, ttl=10)
+
+        with patch("time.monotonic", return_value=100):
+            finder.find_module_locator("fake_module", None)
+            finder.find_module_locator("fake_module", None)
+
+        with patch("time.monotonic", return_value=110):
+            finder.find_module_locator("fake_module", None)
+
+        self.assertEqual(["fake_module", "fake_module"], self.lookups)
+
+    def test_caching_finder_invalidate_caches(self):
+        finder = CachingFinder(self.finder)
+        importer = Importer(
+            finder=finder,
+            loader=SimpleLoader(module_type=dict, load_module=lambda module, _: None),
+        )
+
+        finder.find_module_locator("fake_module", None)
+
+        with importer:
+            importlib.invalidate_caches()
+
+        finder.find_module_locator("fake_module", None)
+
+        self.assertEqual(["fake_module", "fake_module"], self.lookups)
@@ -0,0 +1,126 @@
+import json
+import sys
+from dataclasses import dataclass
+from importlib import import_module
+from pathlib import Path
+from unittest import TestCase
+
+from custom_imports.importer import (
+    Importer,
+    ImportStats,
+    ObservedLoader,
+    SimpleFinder,
+    SimpleLoader,
+)
+from custom_imports.sample_importers import JSONImporter
+
+project_root = Path(__file__).parents[2]
+
+
+@dataclass
+class SimpleLocator:
+    fullname: str
+
+
+@dataclass
+class SimpleModule:
+    value: str = ""
+
+    def set_value(self, locator):
+        self.value = locator.fullname
+
+
+class TestImportStats(TestCase):
+    def setUp(self):
+        finder = SimpleFinder(
+            locate_module=lambda fullname, path, target: (
+                SimpleLocator(fullname) if fullname.startswith("fake") else None
+            )
+        )
+
+        loader = SimpleLoader(
+            module_type=SimpleModule, load_module=SimpleModule.set_value
+        )
+
+        self.importer = Importer(finder=finder, loader=loader)
+
+    def tearDown(self):
+        sys.modules.pop("fake_module", None)
+
+    def test_import_stats(self):
+        stats = ImportStats()
+        self.importer.add_observer(stats)
+
+        with self.importer:
+            import fake_module
+
+            with self.assertRaises(ImportError):
+                import missing_module
+
+        with self.subTest("Counters"):
+            self.assertEqual("fake_module", fake_module.value)
+            self.assertIsInstance(fake_module.__spec__.loader, ObservedLoader)
+            self.assertEqual(2, stats.find_calls)
+            self.assertEqual(1, stats.hits)
+            self.assertEqual(1, stats.misses)
+            self.assertGreater(stats.exec_time, 0)
+            self.assertLessEqual(stats.max_find_time, stats.find_time)
+
+        with self.subTest("Per module breakdown"):
+            self.assertEqual(["fake_module"], list(stats.modules))
+            self.assertEqual(stats.exec_time, stats.modules["fake_module"]["exec_time"])
+
+        with self.subTest("Export"):
+            self.assertEqual(stats.as_dict(), json.loads(stats.to_json()))
+            self.assertEqual(1, stats.as_dict()["hits"])
+
+        with self.subTest("Remove observer"):
+            del sys.modules["fake_module"]
+            self.importer.remove_observer(stats)
+
+            with self.importer:
+                import fake_module
+
+            self.assertEqual(2, stats.find_calls)
+            self.assertIsInstance(fake_module.__spec__.loader, SimpleLoader)
+
+    def test_import_stats_bytes_read(self):
+        name = "tests.sample_files.john_smith"
+        importer = JSONImporter()
+        stats = ImportStats()
+        importer.add_observer(stats)
+
+        try:
+            with importer:
+                import_module(name)
+        finally:
+            sys.modules.pop(name, None)
+
+        size = (project_root / "tests/sample_files/john_smith.json").stat().st_size
+        self.assertEqual(size, stats.bytes_read)
+        self.assertEqual(size, stats.modules[name]["bytes_read"])
+        self.assertGreater(stats.read_time, 0)
+
+    def test_import_stats_unobserved_read(self):
+        name = "tests.sample_files.john_smith"
+        json_importer = JSONImporter()
+
+        def import_json(module, locator):
+            module.value = import_module(name)["firstName"]
+
+        importer = Importer(
+            finder=self.importer.finder,
+            loader=SimpleLoader(module_type=SimpleModule, load_module=import_json),
+        )
+        stats = ImportStats()
+        importer.add_observer(stats)
+
+        try:
+            with importer, json_importer:
+                import fake_module
+        finally:
+            sys.modules.pop(name, None)
+
+        self.assertEqual("John", fake_module.value)
+        self.assertEqual(0, stats.bytes_read)
+        self.assertEqual(0, stats.modules["fake_module"]["bytes_read"])
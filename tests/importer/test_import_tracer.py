@@ -0,0 +1,77 @@
+import json
+import sys
+import tempfile
+from dataclasses import dataclass
+from importlib import import_module
+from pathlib import Path
+from unittest import TestCase
+
+from custom_imports.importer import (
+    Importer,
+    ImportTracer,
+    SimpleFinder,
+    SimpleLoader,
+)
+
+
+@dataclass
+class SimpleLocator:
+    fullname: str
+
+
+@dataclass
+class SimpleModule:
+    value: object = None
+
+    def import_next(self, locator):
+        # fake_module_2 imports fake_module_1, which imports fake_module_0.
+        index = int(locator.fullname.rpartition("_")[2])
+        if index:
+            self.value = import_module(f"fake_module_{index - 1}")
+
+
+class TestImportTracer(TestCase):
+    def setUp(self):
+        finder = SimpleFinder(
+            locate_module=lambda fullname, path, target: (
+                SimpleLocator(fullname) if fullname.startswith("fake") else None
+            )
+        )
+
+        loader = SimpleLoader(
+            module_type=SimpleModule, load_module=SimpleModule.import_next
+        )
+
+        self.importer = Importer(finder=finder, loader=loader)
+
+    def tearDown(self):
+        for index in range(3):
+            sys.modules.pop(f"fake_module_{index}", None)
+
+    def test_import_tracer(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "trace.json"
+
+            with self.importer, ImportTracer(self.importer, path=path):
+                import fake_module_2
+
+            with path.open() as file:
+                trace = json.load(file)
+
+        events = {event["name"]: event for event in trace["traceEvents"]}
+
+        with self.subTest("Steps recorded"):
+            self.assertEqual(9, len(events))
+            self.assertTrue(all(event["ph"] == "X" for event in events.values()))
+            self.assertEqual(True, events["find fake_module_0"]["args"]["found"])
+            self.assertIs(fake_module_2.value.value, sys.modules["fake_module_0"])
+
+        with self.subTest("Spans nest"):
+            outer = events["exec fake_module_2"]
+            inner = events["exec fake_module_0"]
+
+            self.assertLessEqual(outer["ts"], inner["ts"])
+            self.assertLessEqual(inner["ts"] + inner["dur"], outer["ts"] + outer["dur"])
+
+        with self.subTest("Observer removed"):
+            self.assertEqual([], self.importer._observers)
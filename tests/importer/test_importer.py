@@ -1,6 +1,10 @@
+import asyncio
+import gc
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from unittest import TestCase
+from unittest import TestCase, skipIf
+from unittest.mock import patch
 
 from custom_imports.importer import Importer, SimpleFinder, SimpleLoader
 
@@ -18,6 +22,14 @@ class SimpleModule:
         self.value = locator.fullname
 
 
+class CountingExecutor(ThreadPoolExecutor):
+    submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
 class TestImporter(TestCase):
     def setUp(self):
         finder = SimpleFinder(
@@ -65,3 +77,71 @@ class TestImporter(TestCase):
 
             with self.assertRaises(ImportError):
                 import fake_module
+
+    def test_importer_preload(self):
+        names = [f"fake_module_{i}" for i in range(20)]
+        self.addCleanup(lambda: [sys.modules.pop(name, None) for name in names])
+
+        modules = self.importer.preload(names, max_workers=4)
+
+        with self.subTest("Modules imported"):
+            self.assertEqual(names, list(modules))
+
+            for name in names:
+                self.assertIs(sys.modules[name], modules[name])
+                self.assertEqual(name, modules[name].value)
+
+        with self.subTest("Importer not left registered"):
+            self.assertNotIn(self.importer, sys.meta_path)
+
+        with self.subTest("Already imported modules reused"):
+            self.assertIs(modules[names[0]], self.importer.preload(names[:1])[names[0]])
+
+    @skipIf(not hasattr(gc, "freeze"), "gc.freeze requires Python 3.7+")
+    def test_importer_preload_freeze_gc(self):
+        self.addCleanup(sys.modules.pop, "fake_module", None)
+        self.addCleanup(gc.unfreeze)
+
+        self.importer.preload(["fake_module"], freeze_gc=True)
+
+        self.assertGreater(gc.get_freeze_count(), 0)
+
+    @skipIf(hasattr(gc, "freeze"), "gc.freeze is supported")
+    def test_importer_preload_freeze_gc_unsupported(self):
+        with self.assertRaises(RuntimeError):
+            self.importer.preload(["fake_module"], freeze_gc=True)
+
+        self.assertNotIn("fake_module", sys.modules)
+
+    def test_importer_import_module_async(self):
+        self.addCleanup(sys.modules.pop, "fake_module", None)
+
+        async def import_concurrently():
+            return await asyncio.gather(
+                *[self.importer.import_module_async("fake_module") for _ in range(5)]
+            )
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        executor = CountingExecutor()
+        self.addCleanup(executor.shutdown)
+        loop.set_default_executor(executor)
+
+        if sys.version_info >= (3, 7):
+            # The running loop is used, rather than the thread's current loop.
+            with patch("asyncio.get_event_loop", side_effect=AssertionError):
+                modules = loop.run_until_complete(import_concurrently())
+        else:
+            modules = loop.run_until_complete(import_concurrently())
+
+        with self.subTest("Module imported"):
+            self.assertIs(sys.modules["fake_module"], modules[0])
+            self.assertEqual("fake_module", modules[0].value)
+
+        with self.subTest("Concurrent imports deduplicated"):
+            self.assertEqual(1, executor.submitted)
+            self.assertTrue(all(module is modules[0] for module in modules))
+
+        with self.subTest("Importer not left registered"):
+            self.assertNotIn(self.importer, sys.meta_path)
@@ -1,8 +1,12 @@
+import copy
+import json
 import sys
+import threading
 from dataclasses import dataclass
 from unittest import TestCase
 
 from custom_imports.importer import Module, ModuleSpec, SimpleLoader
+from custom_imports.utils import FrozenDict
 
 PY_36 = sys.version_info[:2] == (3, 6)
 
@@ -48,3 +52,129 @@ class TestSimpleLoader(TestCase):
                 self.assertTrue(issubclass(type(module), Module))
             else:
                 self.assertIsInstance(module, Module)
+
+    def test_lazy_simple_loader(self):
+        loads = []
+
+        def load_module(module, locator):
+            loads.append(locator)
+            module.update(locator)
+
+        loader = SimpleLoader(module_type=dict, load_module=load_module, lazy=True)
+        module_spec = ModuleSpec("fake_module", None, loader_state={"foo": "bar"})
+
+        module = loader.create_module(module_spec)
+        module.__spec__ = module_spec
+        loader.exec_module(module)
+
+        with self.subTest("Module not loaded before use"):
+            self.assertEqual([], loads)
+            self.assertIsInstance(module, dict)
+            self.assertEqual("fake_module", module.__spec__.name)
+
+        with self.subTest("Module loaded on first use"):
+            self.assertEqual("bar", module["foo"])
+            self.assertEqual(1, len(loads))
+
+        with self.subTest("Module loaded once"):
+            self.assertEqual({"foo": "bar"}, module)
+            self.assertEqual(1, len(loads))
+            self.assertIs(loader._module_type, type(module))
+
+    def test_lazy_simple_loader_copy(self):
+        loads = []
+
+        def load_module(module, locator):
+            loads.append(locator)
+            module.extend(locator)
+
+        loader = SimpleLoader(module_type=list, load_module=load_module, lazy=True)
+        module_spec = ModuleSpec("fake_module", None, loader_state=[1, 2])
+
+        module = loader.create_module(module_spec)
+        module.__spec__ = module_spec
+        loader.exec_module(module)
+
+        with self.subTest("Module loaded before copying"):
+            self.assertEqual([1, 2], copy.copy(module))
+            self.assertEqual(1, len(loads))
+            self.assertIs(loader._module_type, type(module))
+
+        with self.subTest("Module read directly once loaded"):
+            self.assertEqual("[1, 2]", json.dumps(module))
+            self.assertEqual([1, 2], [] + module)
+
+    def test_lazy_simple_loader_concurrent(self):
+        first_loading = threading.Event()
+        second_loaded = threading.Event()
+
+        def load_module(module, locator):
+            if locator == "first":
+                first_loading.set()
+                # Only loads if the second module is loaded meanwhile.
+                second_loaded.wait(5)
+
+            module[locator] = second_loaded.is_set()
+
+            if locator == "second":
+                second_loaded.set()
+
+        loader = SimpleLoader(module_type=dict, load_module=load_module, lazy=True)
+        modules = []
+        for name in ("first", "second"):
+            module_spec = ModuleSpec(name, None, loader_state=name)
+            module = loader.create_module(module_spec)
+            module.__spec__ = module_spec
+            loader.exec_module(module)
+            modules.append(module)
+
+        first, second = modules
+        thread = threading.Thread(target=len, args=(first,))
+        thread.start()
+        self.addCleanup(thread.join)
+
+        first_loading.wait(5)
+        self.assertEqual({"second": False}, second)
+        thread.join()
+        self.assertEqual({"first": True}, first)
+
+    def test_frozen_simple_loader(self):
+        loader = SimpleLoader(
+            module_type=dict,
+            load_module=lambda module, data: module.update(data),
+            frozen=True,
+        )
+        module_spec = ModuleSpec(
+            "fake_module", None, loader_state={"foo": {"bar": [1, 2]}, "baz": {3}}
+        )
+
+        module = loader.create_module(module_spec)
+        module.__spec__ = module_spec
+        loader.exec_module(module)
+
+        with self.subTest("Contents frozen"):
+            self.assertIsInstance(module, dict)
+            self.assertEqual({"foo": {"bar": (1, 2)}, "baz": frozenset({3})}, module)
+            self.assertIsInstance(module["foo"], FrozenDict)
+
+            with self.assertRaises(TypeError):
+                module["foo"]["bar"] = None
+
+        with self.subTest("Module frozen"):
+            with self.assertRaises(TypeError):
+                module["foo"] = None
+
+            with self.assertRaises(TypeError):
+                module.update(foo=None)
+
+        with self.subTest("Reloaded module frozen"):
+            module.__spec__.loader_state = {"foo": [4]}
+            loader.reload_module(module)
+
+            self.assertEqual({"foo": (4,)}, module)
+
+            with self.assertRaises(TypeError):
+                module.clear()
+
+        with self.subTest("Only containers frozen"), self.assertRaises(TypeError):
+            SimpleLoader(module_type=object, load_module=print, frozen=True)
@@ -1,12 +1,43 @@
 import csv
+import json
+import pickle
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from configparser import ConfigParser
+from dataclasses import dataclass
 from importlib import import_module
+from pathlib import Path
 from types import ModuleType
+from typing import Optional
 from unittest import TestCase
+from unittest.mock import patch
 
 from more_properties import cached_class_property
 
-from custom_imports.sample_importers import CSVImporter, ini_importer, json_importer
+from custom_imports.importer import ModuleSpec
+from custom_imports.sample_importers import (
+    ColumnarCSVImporter,
+    ConfigImporter,
+    CSVImporter,
+    CSVStream,
+    CSVTable,
+    IndexedJSONImporter,
+    JSONBackend,
+    JSONImporter,
+    JSONIndex,
+    StreamingCSVImporter,
+    ini_importer,
+    json_importer,
+)
+from custom_imports.sample_importers.columnar_csv_importer import compact_column
+from custom_imports.sample_importers.config_importer import (
+    BasicInterpolation,
+    compile_schema,
+    to_bool,
+    to_str,
+)
+from custom_imports.sample_importers.indexed_json_importer import index_json_object
+from custom_imports.utils import Namespace, to_namespace
 
 
 class TestSampleImporterMixin:
@@ -65,6 +96,154 @@ class TestJsonImporter(TestSampleImporterMixin, TestCase):
     }
 
 
+class TestStdlibJsonImporter(TestJsonImporter):
+    importer = JSONImporter(backend=JSONBackend("json", json.loads))
+
+
+class TestNamespaceJsonImporter(TestJsonImporter):
+    importer = JSONImporter(namespaces=True)
+
+    def test_attribute_notation(self):
+        john_smith = import_module(self.full_name)
+
+        with self.subTest("Nested objects"):
+            self.assertEqual("New York", john_smith.address.city)
+            self.assertEqual("home", john_smith.phoneNumbers[0].type)
+            self.assertEqual("New York", john_smith["address"]["city"])
+
+        with self.subTest("Missing keys"):
+            with self.assertRaises(AttributeError):
+                john_smith.address.country
+
+            with self.assertRaises(KeyError):
+                john_smith["address"]["country"]
+
+        with self.subTest("Namespaces"):
+            self.assertIsInstance(john_smith.address, Namespace)
+            self.assertEqual(
+                list(self.expected_value["address"].items()),
+                list(john_smith.address.items()),
+            )
+
+        with self.subTest("Pickle"):
+            self.assertEqual(
+                john_smith.address, pickle.loads(pickle.dumps(john_smith.address))
+            )
+
+    def test_reserved_keys(self):
+        data = '{"__class__": 1, "__dict__": 2, "keys": 3, "get": 4, "a b": 5, "c": 6}'
+        expected = json.loads(data)
+
+        for max_shapes in [1024, 0]:
+            with self.subTest(max_shapes=max_shapes), patch(
+                "custom_imports.utils.namespace._MAX_SHAPES", max_shapes
+            ), patch("custom_imports.utils.namespace._shapes", {}):
+                namespace = json.loads(
+                    "[" + data + "]", object_pairs_hook=Namespace.from_pairs
+                )[0]
+
+                self.assertEqual(expected, namespace)
+                self.assertEqual(expected, to_namespace(expected))
+                self.assertTrue(issubclass(namespace.__class__, Namespace))
+                self.assertEqual(3, namespace["keys"])
+                self.assertEqual(4, namespace["get"])
+                self.assertEqual(6, namespace.c)
+                self.assertEqual(expected, dict(namespace))
+                self.assertEqual(expected, {**namespace})
+                self.assertEqual(1, namespace.get("__class__"))
+                self.assertEqual(list(expected), list(namespace.keys()))
+
+                with self.assertRaises(AttributeError):
+                    namespace.c = 7
+
+
+class TestStdlibNamespaceJsonImporter(TestNamespaceJsonImporter):
+    importer = JSONImporter(backend=JSONBackend("json", json.loads), namespaces=True)
+
+
+class TestIndexedJSONImporter(TestJsonImporter):
+    importer = IndexedJSONImporter(backend=JSONBackend("json", json.loads))
+    expected_type = JSONIndex
+
+    def test_lazy_values(self):
+        with self.subTest("Keys indexed up to the key imported"):
+            from tests.sample_files.john_smith import firstName
+
+            john_smith = import_module(self.full_name)
+
+            self.assertEqual("John", firstName)
+            self.assertEqual(["firstName"], list(john_smith._index))
+            self.assertEqual(["firstName"], list(john_smith._values))
+
+        with self.subTest("Values not parsed on indexing"):
+            self.assertEqual(list(self.expected_value), list(john_smith))
+            self.assertEqual(["firstName"], list(john_smith._values))
+
+        with self.subTest("Values parsed on access"):
+            from tests.sample_files.john_smith import address
+
+            self.assertEqual(self.expected_value["address"], address)
+            self.assertEqual(27, john_smith["age"])
+            self.assertEqual(
+                ["firstName", "address", "age"], list(john_smith._values)
+            )
+            self.assertIs(address, john_smith.address)
+
+    def test_lazy_index(self):
+        john_smith = JSONIndex()
+        john_smith.load_index(Path(__file__).parent / "sample_files/john_smith.json")
+
+        with self.subTest("Keys not indexed on load"):
+            self.assertEqual({}, john_smith._index)
+
+        with self.subTest("Keys indexed up to the key accessed"):
+            self.assertEqual("Smith", john_smith["lastName"])
+            self.assertEqual(["firstName", "lastName"], list(john_smith._index))
+
+        with self.subTest("All keys indexed for missing keys"):
+            self.assertNotIn("middleName", john_smith)
+            self.assertEqual(list(self.expected_value), list(john_smith._index))
+
+    def test_index_json_object(self):
+        data = b'{"a": 1, "b\\"[": "x]{\\"", "c": {"d": [1, "}"]}, "e": []}'
+        index = index_json_object(data)
+
+        self.assertEqual(["a", 'b"[', "c", "e"], list(index))
+        self.assertEqual(
+            json.loads(data),
+            {
+                key: json.loads(data[start:end].rstrip(b" ,"))
+                for key, (start, end) in index.items()
+            },
+        )
+
+        with self.subTest("Without escape sequences"):
+            data = b'{"a": [{"b": "]"}], "c" : "}" ,"d":null}'
+            index = index_json_object(data)
+
+            self.assertEqual(
+                json.loads(data),
+                {
+                    key: json.loads(data[start:end])
+                    for key, (start, end) in index.items()
+                },
+            )
+
+        with self.subTest("Deeply nested values"):
+            data = b'{"a": ' + b"[" * 40 + b'"]"' + b"]" * 40 + b', "b": 2}'
+            index = index_json_object(data)
+
+            self.assertEqual(
+                json.loads(data)["a"], json.loads(data[slice(*index["a"])])
+            )
+            self.assertEqual(2, json.loads(data[slice(*index["b"])]))
+
+        with self.subTest("Invalid objects"):
+            for data in [b"[1, 2]", b'{"a" 1}', b'{"a": 1', b'{"a": [1}', b'{"a": 1,}']:
+                with self.subTest(data=data), self.assertRaises(ValueError):
+                    index_json_object(data)
+
+
 class TestIniImporter(TestSampleImporterMixin, TestCase):
     importer = ini_importer
     name = "db_config"
@@ -83,7 +262,12 @@ class TestIniImporter(TestSampleImporterMixin, TestCase):
     def setUpClass(cls):
         super().setUpClass()
 
-        ConfigParser.__eq__ = lambda self, other: self._sections == other
+        ConfigParser.__eq__ = (
+            lambda self, other: {
+                section: dict(self[section]) for section in self.sections()
+            }
+            == other
+        )
 
     def test_attribute_notation(self):
         from tests.sample_files import db_config
@@ -92,6 +276,119 @@ class TestIniImporter(TestSampleImporterMixin, TestCase):
         self.assertEqual(143, db_config.database.port)
         self.assertEqual(False, db_config.database.debug)
 
+    def test_values_unchanged_by_reads(self):
+        db_config = import_module(self.full_name)
+
+        sections = {
+            section: dict(options) for section, options in db_config._sections.items()
+        }
+
+        with self.subTest("Values converted"):
+            self.assertEqual(False, db_config.database.debug)
+            self.assertEqual(
+                dict(self.expected_value["database"]), dict(db_config.database)
+            )
+
+        with self.subTest("Raw values converted"):
+            self.assertEqual(
+                self.expected_value["database"]["port"],
+                db_config.get("database", "Port", raw=True),
+            )
+            self.assertEqual(
+                list(self.expected_value["database"].items()),
+                db_config.items("database", raw=True),
+            )
+            self.assertEqual(
+                "fallback",
+                db_config.get("database", "missing", raw=True, fallback="fallback"),
+            )
+
+        with self.subTest("Parser unchanged"):
+            self.assertEqual(sections, db_config._sections)
+
+    def test_configparser_unchanged(self):
+        import configparser
+
+        parser = configparser.ConfigParser()
+        parser.read_string("[section]\nkey = value\n")
+
+        self.assertIs(configparser.SectionProxy, type(parser["section"]))
+
+
+@dataclass
+class DatabaseSchema:
+    server: str
+    port: float
+    debug: bool
+
+
+@dataclass
+class ConfigSchema:
+    database: DatabaseSchema
+
+
+class TestConfigImporter(TestIniImporter):
+    importer = ConfigImporter(extension="ini", schema=ConfigSchema)
+    expected_value = {
+        "owner": {"full_name": "John Doe", "organization": "Acme Widgets Inc."},
+        "database": {
+            "server": "192.0.2.62",
+            "port": 143.0,
+            "file": "payroll.dat",
+            "debug": False,
+        },
+    }
+
+    def test_schema_conversion(self):
+        from tests.sample_files import db_config
+
+        with self.subTest("Schema values converted on read"):
+            self.assertEqual(143.0, db_config._sections["database"]["port"])
+            self.assertIsInstance(db_config.database.port, float)
+
+        with self.subTest("Other values converted on access"):
+            self.assertEqual("payroll.dat", db_config._sections["database"]["file"])
+            self.assertEqual("payroll.dat", db_config.database.file)
+
+    def test_schema_forms(self):
+        schema = {"database": {"Port": int, "server": str}}
+
+        with self.subTest("Dict schema"):
+            self.assertEqual(
+                {"database": {"port": int, "server": to_str}}, compile_schema(schema)
+            )
+
+        with self.subTest("Dataclass schema"):
+            self.assertEqual(
+                {"database": {"server": to_str, "port": float, "debug": to_bool}},
+                compile_schema(ConfigSchema),
+            )
+
+        with self.subTest("Unsupported type"), self.assertRaises(TypeError):
+            compile_schema({"database": {"port": Optional[int]}})
+
+    def test_str_values(self):
+        parser = ConfigParser(
+            interpolation=BasicInterpolation(compile_schema({"address": {"zip": str}}))
+        )
+        parser.read_string("[address]\nzip = 007\nnumber = 007\n")
+
+        self.assertEqual("007", parser["address"]["zip"])
+        self.assertEqual(7, parser["address"]["number"])
+
+    def test_invalid_value(self):
+        importer = ConfigImporter(schema={"database": {"server": int}})
+        spec = ModuleSpec(
+            "db_config",
+            importer.loader,
+            loader_state=Path(__file__).parent / "sample_files/db_config.ini",
+        )
+        module = importer.loader.create_module(spec)
+        module.__spec__ = spec
+
+        with self.assertRaises(ValueError):
+            importer.loader.exec_module(module)
+
 
 class TestCSVImporter(TestSampleImporterMixin, TestCase):
     importer = CSVImporter(
@@ -129,3 +426,156 @@ class TestCSVImporter(TestSampleImporterMixin, TestCase):
             "Price": 4799.00,
         },
     ]
+
+
+class TestChunkedCSVImporter(TestCSVImporter):
+    @classmethod
+    def setUpClass(cls):
+        # Created here, so that collecting the tests does not start a pool.
+        cls.importer = CSVImporter(
+            csv_reader=csv.DictReader,
+            csv_reader_kwargs={"quoting": csv.QUOTE_NONNUMERIC},
+            executor=ProcessPoolExecutor(max_workers=2),
+            chunk_size=1,
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls.importer.executor.shutdown()
+
+    def test_header_rows(self):
+        path = Path(__file__).parent / "sample_files/cars.csv"
+        importer = CSVImporter(
+            csv_reader=csv.reader, executor=self.importer.executor, chunk_size=40
+        )
+
+        module = []
+        with path.open() as file:
+            importer.loader.read_module(module, file)
+
+        with path.open(newline="") as file:
+            self.assertEqual(list(csv.reader(file)), module)
+
+
+class TestColumnarCSVImporter(TestSampleImporterMixin, TestCase):
+    importer = ColumnarCSVImporter(use_numpy=False)
+    name = "cars"
+    expected_type = CSVTable
+    expected_value = [
+        {
+            "Year": 1997,
+            "Make": "Ford",
+            "Model": "E350",
+            "Description": "ac, abs, moon",
+            "Price": 3000.00,
+        },
+        {
+            "Year": 1999,
+            "Make": "Chevy",
+            "Model": 'Venture "Extended Edition"',
+            "Description": "",
+            "Price": 4900.00,
+        },
+        {
+            "Year": 1999,
+            "Make": "Chevy",
+            "Model": 'Venture "Extended Edition, Very Large"',
+            "Description": "",
+            "Price": 5000.00,
+        },
+        {
+            "Year": 1996,
+            "Make": "Jeep",
+            "Model": "Grand Cherokee",
+            "Description": "MUST SELL!\nair, moon roof, loaded",
+            "Price": 4799.00,
+        },
+    ]
+
+    def test_column_access(self):
+        cars = import_module(self.full_name)
+
+        self.assertEqual(array("q", [1997, 1999, 1999, 1996]), cars["Year"])
+        self.assertEqual(array("d", [3000, 4900, 5000, 4799]), cars["Price"])
+        self.assertEqual(["Ford", "Chevy", "Chevy", "Jeep"], cars["Make"])
+        self.assertIs(cars["Make"][1], cars["Make"][2])
+        self.assertEqual("Jeep", cars[3]["Make"])
+
+    def test_compact_column(self):
+        with self.subTest("Numeric columns"):
+            self.assertEqual(array("q", [1, -20, 0]), compact_column(["1", "-20", "0"]))
+            self.assertEqual(
+                array("d", [1.5, 0.25, 1e3]), compact_column(["1.5", "0.25", "1e3"])
+            )
+
+        with self.subTest("Leading zeros"):
+            self.assertEqual(["007", "02134"], compact_column(["007", "02134"]))
+            self.assertEqual(["1.5", "01.5"], compact_column(["1.5", "01.5"]))
+
+        with self.subTest("Underscores"):
+            self.assertEqual(["1_000", "2"], compact_column(["1_000", "2"]))
+            self.assertEqual(["1_000.5"], compact_column(["1_000.5"]))
+
+        with self.subTest("Words"):
+            self.assertEqual(["nan", "1.5"], compact_column(["nan", "1.5"]))
+            self.assertEqual(["inf", "-Infinity"], compact_column(["inf", "-Infinity"]))
+
+        with self.subTest("Whitespace and signs"):
+            self.assertEqual([" 1", "+2"], compact_column([" 1", "+2"]))
+
+        with self.subTest("Large integers"):
+            self.assertEqual(
+                ["12345678901234567890", "1"],
+                compact_column(["12345678901234567890", "1"]),
+            )
+            self.assertEqual(
+                ["1", "9007199254740993", "1.5"],
+                compact_column(["1", "9007199254740993", "1.5"]),
+            )
+            self.assertEqual(
+                array("q", [9007199254740993, 1]),
+                compact_column(["9007199254740993", "1"]),
+            )
+
+        with self.subTest("Mixed columns keep their values"):
+            self.assertEqual(
+                ["1", "1.50", "1e3", "x"], compact_column(["1", "1.50", "1e3", "x"])
+            )
+            self.assertEqual([3000.0, 2, "x"], compact_column([3000.0, 2, "x"]))
+
+    def test_read_rows(self):
+        table = CSVTable(use_numpy=False)
+        table.read_rows(iter([["a", "b", "c"], ["1", "x"], ["2", "y", "1.5", "z"]]))
+
+        self.assertEqual(["a", "b", "c"], table.fieldnames)
+        self.assertEqual(array("q", [1, 2]), table["a"])
+        self.assertEqual(["x", "y"], table["b"])
+        self.assertEqual(["", "1.5"], table["c"])
+
+
+class TestStreamingCSVImporter(TestSampleImporterMixin, TestCase):
+    importer = StreamingCSVImporter(
+        csv_reader=csv.DictReader,
+        csv_reader_kwargs={"quoting": csv.QUOTE_NONNUMERIC},
+    )
+    name = "cars"
+    expected_type = CSVStream
+    expected_value = TestCSVImporter.expected_value
+
+    def test_sample_importer(self):
+        module = import_module(self.full_name)
+
+        self.assertIsInstance(module, ModuleType)
+        self.assertIsInstance(module, self.expected_type)
+
+        with self.subTest("Module is re-iterable"):
+            self.assertEqual(self.expected_value, list(module))
+            self.assertEqual(self.expected_value, list(module))
+
+        with self.subTest("Iterate in batches"):
+            self.assertEqual(
+                [self.expected_value[:3], self.expected_value[3:]],
+                list(module.batches(3)),
+            )
@@ -0,0 +1,106 @@
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Event
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from custom_imports import ini_importer, register_stub
+
+
+class TestImporterStub(TestCase):
+    def test_importer_stub(self):
+        with TemporaryDirectory() as directory:
+            Path(directory, "stub_config.ini").write_text("[section]\nkey = 1\n")
+
+            sys.path.insert(0, directory)
+            self.addCleanup(sys.path.remove, directory)
+            self.addCleanup(sys.modules.pop, "stub_config", None)
+
+            stub = register_stub("custom_imports:ini_importer", "ini")
+            self.addCleanup(
+                lambda: [
+                    sys.meta_path.remove(finder)
+                    for finder in (stub, ini_importer)
+                    if finder in sys.meta_path
+                ]
+            )
+
+            with self.subTest("Other modules ignored"):
+                with self.assertRaises(ImportError):
+                    import stub_missing  # noqa: F401
+
+                self.assertIn(stub, sys.meta_path)
+
+            with self.subTest("Importer registered in place of stub"):
+                import stub_config
+
+                self.assertEqual(1, stub_config.section.key)
+                self.assertNotIn(stub, sys.meta_path)
+                self.assertIn(ini_importer, sys.meta_path)
+
+    def test_importer_stub_concurrent(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        Path(directory.name, "stub_config.ini").write_text("[section]\nkey = 1\n")
+
+        stub = register_stub("custom_imports:ini_importer", "ini")
+        self.addCleanup(
+            lambda: [
+                sys.meta_path.remove(finder)
+                for finder in (stub, ini_importer)
+                if finder in sys.meta_path
+            ]
+        )
+
+        first_loading = Event()
+        second_finding = Event()
+        imported = []
+
+        def slow_import_module(name):
+            imported.append(name)
+            first_loading.set()
+            second_finding.wait(5)
+            return import_module(name)
+
+        def second():
+            first_loading.wait(5)
+            second_finding.set()
+            return stub.find_spec("stub_config", [directory.name])
+
+        with patch("custom_imports.stub.import_module", slow_import_module):
+            with ThreadPoolExecutor(2) as executor:
+                first = executor.submit(stub.load_importer)
+                second = executor.submit(second)
+
+                self.assertIs(ini_importer, first.result())
+                self.assertIsNotNone(second.result())
+
+        self.assertEqual(["custom_imports"], imported)
+
+    @skipIf(sys.version_info < (3, 7), "Python 3.6 has no module __getattr__")
+    def test_lightweight_import(self):
+        modules = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, custom_imports.stub;"
+                "custom_imports.stub.register_stub('custom_imports:ini_importer', 'ini');"
+                "print(' '.join(sys.modules))",
+            ],
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        ).stdout.split()
+
+        for module in [
+            "configparser",
+            "custom_imports.importer",
+            "dataclasses",
+            "typing",
+        ]:
+            with self.subTest(module=module):
+                self.assertNotIn(module, modules)